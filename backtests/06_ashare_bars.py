@@ -19,6 +19,10 @@ from nautilus_trader.model import Venue
 from nautilus_trader.model.enums import PriceType, BarAggregation
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 
+from research.analytics import parse_positions_report
+from research.analytics import summarise
+from research.catalog_reader import bar_arrays
+
 def main():
     print("=== NautilusTrader A-share Bar Backtest ===")
     
@@ -124,27 +128,37 @@ def main():
     # 8. Analysis
     engine_instance = node.get_engine(run_config.id)
     
+    accounts = []
     for venue_name in venue_names:
         print(f"\n=== PERFORMANCE ({venue_name}) ===")
         # Wrap venue_name string in Venue object
         venue = Venue(venue_name)
         account = engine_instance.trader.generate_account_report(venue)
+        accounts.append(account)
         print("\n=== FINAL ACCOUNT STATE ===")
         print(account.tail(1).to_string())
 
     positions = engine_instance.trader.generate_positions_report()
+    fills = engine_instance.trader.generate_order_fills_report()
     
     print("\n=== OVERALL POSITIONS ===")
     print(f"Total Positions: {len(positions)}")
     
     if not positions.empty:
-        # Simple PnL sum (check column name, might be 'realized_pnl' object)
-        total_pnl = 0
-        for pnl in positions['realized_pnl']:
-            # PnL is a Money object, convert to float if needed
-            total_pnl += float(str(pnl).split()[0])
+        # Report money columns are strings like "-11.00 CNY"; parse them once into floats
+        total_pnl = parse_positions_report(positions)["realized_pnl"].sum()
         print(f"Total Realized PnL: {total_pnl:.2f} CNY")
 
+    # Portfolio statistics over the combined equity of all venues: the cash
+    # balances plus the open holdings marked at the daily closes
+    marks = {}
+    for instrument in instruments:
+        closes = bar_arrays(catalog_path, f"{instrument.id}-1-DAY-LAST-EXTERNAL", columns=("ts_init", "close"))
+        marks[str(instrument.id)] = (closes["ts_init"], closes["close"])
+    stats = summarise([accounts], [positions], [fills], marks=marks)
+    print("\n=== PORTFOLIO STATISTICS ===")
+    print(stats.T.to_string(header=False))
+
 
 if __name__ == "__main__":
     main()
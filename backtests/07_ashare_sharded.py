@@ -0,0 +1,248 @@
+# Source: https://nautilustrader.io/docs/latest/getting_started/backtest_high_level
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.node import BacktestDataConfig
+from nautilus_trader.backtest.node import BacktestEngineConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.node import BacktestRunConfig
+from nautilus_trader.backtest.node import BacktestVenueConfig
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Bar
+from nautilus_trader.model import BarType
+from nautilus_trader.model import InstrumentId
+from nautilus_trader.model import Venue
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.analytics import holdings_value
+from research.analytics import parse_fills_report
+from research.analytics import parse_positions_report
+from research.analytics import to_ns
+from research.catalog_reader import bar_arrays
+
+STARTING_BALANCE = 10_000_000
+CURRENCY = "CNY"
+
+
+def build_run_config(catalog_path: str, instrument_ids: list[str], offset: int) -> BacktestRunConfig:
+    """
+    Build the run config for one shard.
+
+    Every shard gets its own venues and only the data/strategies for its instruments.
+    `offset` is the global index of the first instrument so that strategy and order
+    IDs stay unique after the shard reports are merged.
+    """
+    venue_names = sorted({InstrumentId.from_str(i).venue.value for i in instrument_ids})
+    venues = [
+        BacktestVenueConfig(
+            name=venue_name,
+            oms_type="NETTING",
+            account_type="CASH",
+            base_currency=CURRENCY,
+            starting_balances=[f"{STARTING_BALANCE} {CURRENCY}"],
+        )
+        for venue_name in venue_names
+    ]
+
+    data_configs = []
+    strategies = []
+    for n, instrument_id in enumerate(instrument_ids):
+        bar_type = BarType.from_str(f"{instrument_id}-1-DAY-LAST-EXTERNAL")
+
+        data_configs.append(BacktestDataConfig(
+            catalog_path=catalog_path,
+            data_cls=Bar,
+            instrument_id=instrument_id,
+        ))
+        strategies.append(ImportableStrategyConfig(
+            strategy_path="strategies.definitions:EMACrossBarStrategy",
+            config_path="strategies.definitions:EMACrossBarConfig",
+            config={
+                "instrument_id": instrument_id,
+                "bar_type": str(bar_type),
+                "fast_period": 5,
+                "slow_period": 20,
+                "trade_size": 100,  # 1 lot
+                "order_id_tag": f"{offset + n:03d}",
+            },
+        ))
+
+    engine = BacktestEngineConfig(
+        strategies=strategies,
+        logging=LoggingConfig(log_level="ERROR"),
+    )
+
+    return BacktestRunConfig(
+        engine=engine,
+        venues=venues,
+        data=data_configs,
+    )
+
+
+def run_shard(shard_id: int, catalog_path: str, instrument_ids: list[str], offset: int) -> dict:
+    """Run one shard in a worker process and return its reports as DataFrames."""
+    start = time.perf_counter()
+
+    run_config = build_run_config(catalog_path, instrument_ids, offset)
+    node = BacktestNode(configs=[run_config])
+    results = node.run()
+    engine = node.get_engine(run_config.id)
+
+    venue_names = sorted({InstrumentId.from_str(i).venue.value for i in instrument_ids})
+    accounts = {
+        venue_name: engine.trader.generate_account_report(Venue(venue_name))
+        for venue_name in venue_names
+    }
+    positions = engine.trader.generate_positions_report()
+    fills = engine.trader.generate_order_fills_report()
+    iterations = results[0].iterations if results else 0
+
+    node.dispose()
+
+    return {
+        "shard_id": shard_id,
+        "instruments": len(instrument_ids),
+        "iterations": iterations,
+        "elapsed": time.perf_counter() - start,
+        "accounts": accounts,
+        "positions": positions,
+        "fills": fills,
+    }
+
+
+def partition(instrument_ids: list[str], n_shards: int) -> list[list[str]]:
+    """Round-robin the instruments into at most `n_shards` non-empty shards."""
+    n_shards = max(1, min(n_shards, len(instrument_ids)))
+    return [instrument_ids[i::n_shards] for i in range(n_shards)]
+
+
+def merge_account_reports(shard_accounts: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Merge the per-shard account reports of one venue into the portfolio's cash.
+
+    Each shard started from the same balance, so the portfolio cash is the
+    starting balance plus the sum of every shard's change in balance. The
+    accounts are CASH accounts, so this excludes the value of the holdings
+    (see `portfolio_equity`).
+    """
+    totals = [
+        account["total"].astype(float).groupby(level=0).last()
+        for account in shard_accounts
+        if not account.empty
+    ]
+    if not totals:
+        return pd.DataFrame(columns=["cash", "currency"])
+
+    index = totals[0].index
+    for total in totals[1:]:
+        index = index.union(total.index)
+
+    pnl = sum(
+        (total.reindex(index).ffill().fillna(STARTING_BALANCE) - STARTING_BALANCE)
+        for total in totals
+    )
+    return pd.DataFrame({"cash": STARTING_BALANCE + pnl, "currency": CURRENCY}, index=index)
+
+
+def portfolio_equity(cash: pd.DataFrame, fills: pd.DataFrame, catalog_path: str) -> pd.DataFrame:
+    """The merged cash with the venue's net holdings marked at the daily closes, and their sum as equity."""
+    parsed = parse_fills_report(fills)
+    marks = {}
+    for instrument_id in parsed["instrument_id"].unique():
+        closes = bar_arrays(catalog_path, f"{instrument_id}-1-DAY-LAST-EXTERNAL", columns=("ts_init", "close"))
+        marks[instrument_id] = (closes["ts_init"], closes["close"])
+    holdings = holdings_value(parsed, marks, 1, to_ns(cash.index))[0]
+    return cash.assign(holdings=holdings, equity=cash["cash"].to_numpy() + holdings)
+
+
+def concat_reports(reports: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate the non-empty shard reports of one kind."""
+    reports = [report for report in reports if not report.empty]
+    return pd.concat(reports) if reports else pd.DataFrame()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sharded multi-process A-share backtest")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of worker processes")
+    args = parser.parse_args()
+
+    print("=== NautilusTrader Sharded A-share Bar Backtest ===")
+
+    # 1. Load Catalog
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog_ashare"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instruments = catalog.instruments()
+
+    if not instruments:
+        print("Error: No instruments found in catalog.")
+        return
+
+    # 2. Partition instruments across workers
+    # Strategies are independent per symbol, so each shard is a complete backtest
+    instrument_ids = sorted(str(i.id) for i in instruments)
+    shards = partition(instrument_ids, args.workers)
+    offsets = [sum(len(s) for s in shards[:n]) for n in range(len(shards))]
+    print(f"Running {len(instrument_ids)} instruments in {len(shards)} shards")
+
+    # 3. Run shards in parallel
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+        futures = [
+            executor.submit(run_shard, n, str(catalog.path), shard, offsets[n])
+            for n, shard in enumerate(shards)
+        ]
+        results = [future.result() for future in futures]
+    wall_time = time.perf_counter() - start
+
+    print("\n=== SHARD TIMING ===")
+    for result in results:
+        print(
+            f"Shard {result['shard_id']:>3}: {result['instruments']:>5} instruments, "
+            f"{result['iterations']:>9} iterations, {result['elapsed']:.2f}s"
+        )
+    cpu_time = sum(r["elapsed"] for r in results)
+    print(f"Wall time: {wall_time:.2f}s, summed shard time: {cpu_time:.2f}s, speedup: {cpu_time / wall_time:.2f}x")
+
+    # 4. Merge reports into one portfolio view
+    positions = concat_reports([r["positions"] for r in results])
+    fills = concat_reports([r["fills"] for r in results])
+
+    venue_names = sorted({venue for r in results for venue in r["accounts"]})
+    for venue_name in venue_names:
+        cash = merge_account_reports([r["accounts"][venue_name] for r in results if venue_name in r["accounts"]])
+        venue_fills = fills[fills["instrument_id"].astype(str).str.endswith(f".{venue_name}")] if not fills.empty else fills
+        account = portfolio_equity(cash, venue_fills, str(catalog.path))
+        print(f"\n=== PORTFOLIO ACCOUNT ({venue_name}) ===")
+        print(account.tail(1).to_string())
+
+    print("\n=== OVERALL POSITIONS ===")
+    print(f"Total Positions: {len(positions)}")
+    print(f"Total Fills: {len(fills)}")
+
+    if not positions.empty:
+        positions = positions.sort_values("ts_opened")
+        total_pnl = parse_positions_report(positions)["realized_pnl"].sum()
+        print(f"Total Realized PnL: {total_pnl:.2f} {CURRENCY}")
+
+
+if __name__ == "__main__":
+    main()
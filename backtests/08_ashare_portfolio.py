@@ -0,0 +1,144 @@
+# Source: https://nautilustrader.io/docs/latest/getting_started/backtest_high_level
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.node import BacktestDataConfig
+from nautilus_trader.backtest.node import BacktestEngineConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.node import BacktestRunConfig
+from nautilus_trader.backtest.node import BacktestVenueConfig
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Bar
+from nautilus_trader.model import BarType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.analytics import parse_positions_report
+
+
+def portfolio_strategies(bar_types: list[str]) -> list[ImportableStrategyConfig]:
+    """A single EMACrossPortfolioStrategy trading every bar type."""
+    return [ImportableStrategyConfig(
+        strategy_path="strategies.definitions:EMACrossPortfolioStrategy",
+        config_path="strategies.definitions:EMACrossPortfolioConfig",
+        config={
+            "bar_types": bar_types,
+            "fast_period": 5,
+            "slow_period": 20,
+            "trade_size": 100,  # 1 lot
+        },
+    )]
+
+
+def per_symbol_strategies(bar_types: list[str]) -> list[ImportableStrategyConfig]:
+    """One EMACrossBarStrategy per bar type, as in 06_ashare_bars.py."""
+    return [
+        ImportableStrategyConfig(
+            strategy_path="strategies.definitions:EMACrossBarStrategy",
+            config_path="strategies.definitions:EMACrossBarConfig",
+            config={
+                "instrument_id": str(BarType.from_str(bar_type).instrument_id),
+                "bar_type": bar_type,
+                "fast_period": 5,
+                "slow_period": 20,
+                "trade_size": 100,  # 1 lot
+            },
+        )
+        for bar_type in bar_types
+    ]
+
+
+def run(catalog: ParquetDataCatalog, instruments: list, strategies: list[ImportableStrategyConfig]):
+    """Run one backtest and return (positions report, iterations, elapsed seconds)."""
+    venues = [
+        BacktestVenueConfig(
+            name=venue_name,
+            oms_type="NETTING",
+            account_type="CASH",
+            base_currency="CNY",
+            starting_balances=["10_000_000 CNY"],
+        )
+        for venue_name in sorted({i.id.venue.value for i in instruments})
+    ]
+    data_configs = [
+        BacktestDataConfig(
+            catalog_path=str(catalog.path),
+            data_cls=Bar,
+            instrument_id=instrument.id,
+        )
+        for instrument in instruments
+    ]
+    run_config = BacktestRunConfig(
+        engine=BacktestEngineConfig(
+            strategies=strategies,
+            logging=LoggingConfig(log_level="ERROR"),
+        ),
+        venues=venues,
+        data=data_configs,
+    )
+
+    start = time.perf_counter()
+    node = BacktestNode(configs=[run_config])
+    results = node.run()
+    elapsed = time.perf_counter() - start
+
+    engine = node.get_engine(run_config.id)
+    positions = engine.trader.generate_positions_report()
+    return positions, results[0].iterations, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Array-backed A-share portfolio backtest")
+    parser.add_argument("--compare", action="store_true", help="Also run one EMACrossBarStrategy per symbol")
+    args = parser.parse_args()
+
+    print("=== NautilusTrader A-share Portfolio Backtest ===")
+
+    # 1. Load Catalog
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog_ashare"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instruments = catalog.instruments()
+
+    if not instruments:
+        print("Error: No instruments found in catalog.")
+        return
+
+    bar_types = [f"{i.id}-1-DAY-LAST-EXTERNAL" for i in instruments]
+    print(f"Trading {len(bar_types)} instruments with one strategy instance")
+
+    # 2. Run the array-backed portfolio strategy
+    runs = {"portfolio": portfolio_strategies(bar_types)}
+    if args.compare:
+        runs["per-symbol"] = per_symbol_strategies(bar_types)
+
+    print("\n=== THROUGHPUT ===")
+    reports = {}
+    for name, strategies in runs.items():
+        positions, iterations, elapsed = run(catalog, instruments, strategies)
+        reports[name] = positions
+        print(f"{name:>10}: {iterations} bars in {elapsed:.2f}s ({iterations / elapsed:,.0f} bars/s)")
+
+    # 3. Analysis
+    for name, positions in reports.items():
+        print(f"\n=== POSITIONS ({name}) ===")
+        print(f"Total Positions: {len(positions)}")
+        if not positions.empty:
+            total_pnl = parse_positions_report(positions)["realized_pnl"].sum()
+            print(f"Total Realized PnL: {total_pnl:.2f} CNY")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.optimise import data_range
+from research.optimise import grid
+from research.optimise import make_store_pool
+from research.optimise import walk_forward
+from research.optimise import walk_forward_windows
+from research.shared_store import shared_store
+
+# Candidate parameters for each strategy
+CANDIDATES = {
+    "ema": grid(
+        fast_period=[5, 10, 20],
+        slow_period=[30, 50, 100],
+        trade_size=[10_000],
+    ),
+    "macd": grid(
+        fast_period=[12],
+        slow_period=[26],
+        entry_threshold=[0.00003, 0.00005, 0.0001],
+        stop_loss_pips=[10, 20],
+        take_profit_pips=[20, 40],
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel walk-forward optimisation")
+    parser.add_argument("--strategy", choices=list(CANDIDATES), default="ema")
+    parser.add_argument("--train", default="3D", help="Train window length, e.g. 3D")
+    parser.add_argument("--test", default="1D", help="Test window length, e.g. 1D")
+    parser.add_argument("--objective", default="total_pnl", help="Column of research.analytics.summarise to maximise")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--warm-start", action="store_true", help="Seed indicators from the data before each window")
+    args = parser.parse_args()
+
+    print("=== NautilusTrader Walk-Forward Optimisation ===")
+
+    # 1. Catalog time range
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    start, end = data_range(str(catalog_path))
+    instrument_id = str(ParquetDataCatalog(str(catalog_path)).instruments()[0].id)
+    windows = walk_forward_windows(start, end, pd.Timedelta(args.train), pd.Timedelta(args.test))
+    candidates = CANDIDATES[args.strategy]
+
+    if not windows:
+        print("Error: Catalog time range is shorter than one train window.")
+        return
+
+    print(f"Strategy: {args.strategy}, {len(candidates)} candidates x {len(windows)} windows")
+
+    # 2. Optimise on train windows and evaluate on test windows
+    started = time.perf_counter()
+    # Ticks are written once to a memory-mapped store that every worker streams from
+    with (
+        shared_store(catalog_path, instrument_id) as store,
+        make_store_pool(store, str(catalog_path), workers=args.workers, warm_start=args.warm_start) as executor,
+    ):
+        report, equity = walk_forward(executor, args.strategy, candidates, windows, args.objective)
+    print(f"Completed in {time.perf_counter() - started:.2f}s")
+
+    # 3. Results
+    print("\n=== WALK-FORWARD WINDOWS ===")
+    print(report.to_string())
+
+    print("\n=== OUT-OF-SAMPLE EQUITY ===")
+    if equity.empty:
+        print("No out-of-sample account activity.")
+    else:
+        print(equity.resample("1D").last().dropna().to_string())
+        print(f"\nOut-of-sample PnL: {report['test_pnl'].sum():.2f} USD")
+
+
+if __name__ == "__main__":
+    main()
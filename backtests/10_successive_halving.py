@@ -0,0 +1,102 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.optimise import data_range
+from research.optimise import evaluate
+from research.optimise import grid
+from research.optimise import make_store_pool
+from research.optimise import successive_halving
+from research.shared_store import shared_store
+
+# MACDEnhancedStrategy search space (thresholds and exit distances)
+SPACE = {
+    "entry_threshold": [0.00002, 0.00003, 0.00005, 0.00008, 0.0001],
+    "stop_loss_pips": [10, 15, 20, 30],
+    "take_profit_pips": [20, 30, 40, 60],
+}
+FIXED = {"fast_period": 12, "slow_period": 26, "trade_size": 1_000_000}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Successive-halving optimiser for MACDEnhancedStrategy")
+    parser.add_argument("--min-span", default="1D", help="Data slice replayed on the first rung, e.g. 1D")
+    parser.add_argument("--eta", type=int, default=3, help="Keep the best 1/eta candidates per rung")
+    parser.add_argument("--proposals", type=int, default=0, help="Extra points proposed by the surrogate model")
+    parser.add_argument("--objective", default="total_pnl", help="Column of research.analytics.summarise to maximise")
+    parser.add_argument("--verify", action="store_true", help="Also run the full grid on the full range")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print("=== NautilusTrader Successive-Halving Optimisation ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    start, end = data_range(str(catalog_path))
+    instrument_id = str(ParquetDataCatalog(str(catalog_path)).instruments()[0].id)
+    candidates = grid(**SPACE)
+    print(f"{len(candidates)} candidates, first rung replays {args.min_span}")
+
+    # Ticks are written once to a memory-mapped store that every worker streams from
+    with (
+        shared_store(catalog_path, instrument_id) as store,
+        make_store_pool(store, str(catalog_path), workers=args.workers) as executor,
+    ):
+        started = time.perf_counter()
+        best, history = successive_halving(
+            executor,
+            "macd",
+            candidates,
+            start,
+            end,
+            pd.Timedelta(args.min_span),
+            eta=args.eta,
+            objective=args.objective,
+            space=SPACE,
+            n_proposals=args.proposals,
+            fixed=FIXED,
+        )
+        elapsed = time.perf_counter() - started
+
+        print("\n=== RUNGS ===")
+        summary = history.groupby("rung").agg(
+            end=("end", "first"),
+            candidates=("params", "size"),
+            best=(args.objective, "max"),
+            iterations=("iterations", "sum"),
+        )
+        print(summary.to_string())
+        print(f"\nBest parameters: {best}")
+        print(f"Replayed ticks: {history['iterations'].sum():,} in {elapsed:.2f}s")
+
+        if args.verify:
+            started = time.perf_counter()
+            stats, results = evaluate(executor, [("macd", {**FIXED, **c}, start, end) for c in candidates])
+            full_best = candidates[int(stats[args.objective].fillna(float("-inf")).to_numpy().argmax())]
+            full_ticks = sum(r["iterations"] for r in results)
+
+            print("\n=== FULL GRID ===")
+            print(f"Best parameters: {full_best}")
+            print(f"Replayed ticks: {full_ticks:,} in {time.perf_counter() - started:.2f}s")
+            print(f"Same best configuration: {full_best == best}")
+            print(f"Fraction of ticks replayed: {history['iterations'].sum() / full_ticks:.1%}")
+
+
+if __name__ == "__main__":
+    main()
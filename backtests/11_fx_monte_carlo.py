@@ -0,0 +1,129 @@
+# Source: https://nautilustrader.io/docs/latest/tutorials/backtest_fx_bars
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.model import Venue
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
+from nautilus_trader.test_kit.providers import TestDataProvider
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from research.optimise import evaluate
+from research.optimise import grid
+from research.optimise import make_loader_pool
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Fill probabilities swept around the 04_fx_bars.py setting
+FILL_PROBABILITIES = {
+    "prob_fill_on_limit": [0.1, 0.2, 0.5],
+    "prob_fill_on_stop": [0.95],
+    "prob_slippage": [0.2, 0.5, 0.8],
+}
+
+# Strategies that place limit orders (the take-profit of the macd bracket); the others only
+# send market orders, so prob_fill_on_limit is held at 04_fx_bars.py's 0.2 for them
+LIMIT_ORDER_STRATEGIES = {"macd"}
+
+# Loaded once in the parent process and inherited by the forked workers
+_data = None
+
+
+def load_usdjpy_bars() -> tuple:
+    """USD/JPY quote ticks wrangled from the bundled 2013 M1 bars, as in 04_fx_bars.py."""
+    global _data
+    if _data is None:
+        instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY", Venue("SIM"))
+        provider = TestDataProvider()
+        wrangler = QuoteTickDataWrangler(instrument=instrument)
+        ticks = wrangler.process_bar_data(
+            bid_data=provider.read_csv_bars("fxcm/usdjpy-m1-bid-2013.csv"),
+            ask_data=provider.read_csv_bars("fxcm/usdjpy-m1-ask-2013.csv"),
+        )
+        _data = (instrument, ticks)
+    return _data
+
+
+def load_catalog_ticks() -> tuple:
+    """The EUR/USD quote ticks written by setup_sample_data.py."""
+    global _data
+    if _data is None:
+        catalog = ParquetDataCatalog(str(PROJECT_ROOT / "catalog"))
+        instrument = catalog.instruments()[0]
+        _data = (instrument, catalog.quote_ticks(instrument_ids=[str(instrument.id)]))
+    return _data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Monte-Carlo fill-model robustness runs")
+    parser.add_argument("--draws", type=int, default=1_000, help="Total draws, split evenly over the fill settings")
+    parser.add_argument("--strategy", choices=["ema", "macd"], default="ema")
+    parser.add_argument("--catalog", action="store_true", help="Use the EUR/USD catalog instead of the USD/JPY bars")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print("=== NautilusTrader Monte-Carlo Fill Model Runs ===")
+
+    # 1. Load the data once; forked workers share it
+    if args.catalog:
+        if not (PROJECT_ROOT / "catalog").exists():
+            print("Error: Catalog not found. Please run 'python data_scripts/setup_sample_data.py' first.")
+            return
+        loader = load_catalog_ticks
+        venue = {"oms_type": "HEDGING", "base_currency": "USD", "starting_balances": ("1_000_000 USD",)}
+        currency = "USD"
+    else:
+        loader = load_usdjpy_bars
+        venue = {"oms_type": "HEDGING", "base_currency": None, "starting_balances": ("1_000_000 USD", "10_000_000 JPY")}
+        currency = "JPY"
+
+    started = time.perf_counter()
+    instrument, ticks = loader()
+    print(f"Loaded {len(ticks)} ticks for {instrument.id} in {time.perf_counter() - started:.2f}s")
+
+    # 2. One task per (fill probabilities, seed)
+    swept = dict(FILL_PROBABILITIES)
+    if args.strategy not in LIMIT_ORDER_STRATEGIES:
+        swept["prob_fill_on_limit"] = [0.2]
+    probabilities = grid(**swept)
+    seeds, extra = divmod(args.draws, len(probabilities))
+    params = {"trade_size": 1_000_000}
+    settings = [
+        {**setting, "random_seed": seed}
+        for k, setting in enumerate(probabilities)
+        for seed in range(seeds + (k < extra))
+    ]
+    tasks = [(args.strategy, params, None, None, fill_model) for fill_model in settings]
+    print(f"Running {len(tasks)} draws ({len(probabilities)} settings, {seeds}-{seeds + (extra > 0)} seeds each)")
+
+    started = time.perf_counter()
+    with make_loader_pool(loader, venue, workers=args.workers) as executor:
+        stats, _ = evaluate(executor, tasks, currency=currency)
+    print(f"Completed in {time.perf_counter() - started:.2f}s")
+
+    # 3. Distribution of PnL and drawdown per fill setting
+    stats = pd.concat([pd.DataFrame(settings), stats], axis=1)
+    keys = [key for key, values in swept.items() if len(values) > 1]
+    quantiles = [0.05, 0.5, 0.95]
+
+    print(f"\n=== PnL DISTRIBUTION ({currency}) ===")
+    print(stats.groupby(keys)["total_pnl"].quantile(quantiles).unstack().round(2).to_string())
+
+    print("\n=== MAX DRAWDOWN DISTRIBUTION ===")
+    print(stats.groupby(keys)["max_drawdown"].quantile(quantiles).unstack().round(5).to_string())
+
+    print("\n=== ALL DRAWS ===")
+    print(stats[["total_pnl", "max_drawdown"]].describe().to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Source: https://github.com/mpquant/MyTT
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root and MyTT to path
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "data_scripts" / "Ashare"))
+
+from MyTT import BARSLAST
+from MyTT import BOLL
+from MyTT import CROSS
+from MyTT import EVERY
+from MyTT import EXIST
+from MyTT import KDJ
+from MyTT import MA
+from MyTT import MACD
+from MyTT import REF
+from MyTT import RSI
+
+from research.screener import catalog_bar_types
+from research.screener import screen
+
+
+# Screening conditions: each takes the MyTT arrays of one symbol
+def ma_golden_cross(d):
+    return CROSS(MA(d["CLOSE"], 5), MA(d["CLOSE"], 20))
+
+
+def above_ma60(d):
+    return d["CLOSE"] > MA(d["CLOSE"], 60)
+
+
+def rising_3_days(d):
+    return EVERY(d["CLOSE"] > REF(d["CLOSE"], 1), 3)
+
+
+def limit_up_10_days(d):
+    return EXIST(d["CLOSE"] / REF(d["CLOSE"], 1) >= 1.095, 10)
+
+
+def macd_above_zero(d):
+    dif, dea, _ = MACD(d["CLOSE"])
+    return (dif > 0) & (dif > dea)
+
+
+def kdj_oversold(d):
+    _, _, j = KDJ(d["CLOSE"], d["HIGH"], d["LOW"])
+    return j < 0
+
+
+def below_boll_lower(d):
+    _, _, lower = BOLL(d["CLOSE"])
+    return d["CLOSE"] < lower
+
+
+def volume_surge(d):
+    return d["VOL"] > 2 * MA(d["VOL"], 20)
+
+
+def rsi_14(d):
+    return RSI(d["CLOSE"], 14)
+
+
+def bars_since_golden_cross(d):
+    return BARSLAST(CROSS(MA(d["CLOSE"], 5), MA(d["CLOSE"], 20)))
+
+
+CONDITIONS = {
+    "ma_golden_cross": ma_golden_cross,
+    "above_ma60": above_ma60,
+    "rising_3_days": rising_3_days,
+    "limit_up_10_days": limit_up_10_days,
+    "macd_above_zero": macd_above_zero,
+    "kdj_oversold": kdj_oversold,
+    "below_boll_lower": below_boll_lower,
+    "volume_surge": volume_surge,
+    "rsi_14": rsi_14,
+    "bars_since_golden_cross": bars_since_golden_cross,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-core MyTT screener over the A-share catalog")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--threads", action="store_true", help="Use a thread pool instead of processes")
+    parser.add_argument("--start", default=None, help="Only load bars from this date, e.g. 2024-06-01")
+    parser.add_argument("--top", type=int, default=20)
+    args = parser.parse_args()
+
+    print("=== A-share MyTT Screener ===")
+
+    # 1. Universe
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog_ashare"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    bar_types = catalog_bar_types(catalog_path)
+    start = pd.Timestamp(args.start, tz="UTC") if args.start else None
+    workers = args.workers or os.cpu_count()
+    print(f"Screening {len(bar_types)} symbols with {len(CONDITIONS)} conditions on {workers} {'threads' if args.threads else 'processes'}")
+
+    # 2. Screen
+    if args.threads:
+        executor = ThreadPoolExecutor(max_workers=workers)
+    else:
+        context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+    started = time.perf_counter()
+    with executor:
+        results, timing = screen(executor, catalog_path, CONDITIONS, bar_types, chunks=workers * 4, start=start, rank_by=["rsi_14"])
+    elapsed = time.perf_counter() - started
+
+    # 3. Results
+    print(f"\n=== TOP {args.top} ===")
+    print(results.head(args.top).to_string(float_format=lambda x: f"{x:.2f}"))
+
+    print("\n=== CONDITION TIMING ===")
+    print(timing.to_string(float_format=lambda x: f"{x:.4f}"))
+    print(f"\nScreened {len(results)} symbols in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
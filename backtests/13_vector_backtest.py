@@ -0,0 +1,148 @@
+# Source: https://nautilustrader.io/docs/latest/getting_started/backtest_high_level
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.node import BacktestDataConfig
+from nautilus_trader.backtest.node import BacktestEngineConfig
+from nautilus_trader.backtest.node import BacktestNode
+from nautilus_trader.backtest.node import BacktestRunConfig
+from nautilus_trader.backtest.node import BacktestVenueConfig
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Bar
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.analytics import parse_positions_report
+from research.optimise import grid
+from research.vector_backtest import FRICTIONLESS
+from research.vector_backtest import AShareRules
+from research.vector_backtest import backtest
+from research.vector_backtest import load_panel
+from research.vector_backtest import target_from_signal
+from research.vector_backtest import tile
+
+TRADE_SIZE = 100  # 1 lot
+
+PARAMS = [p for p in grid(fast_period=[3, 5, 8, 10, 12], slow_period=[20, 30, 40, 60]) if p["fast_period"] < p["slow_period"]]
+
+
+def ema_cross_signal(close: pd.DataFrame, fast_period: int, slow_period: int) -> pd.DataFrame:
+    """The EMACrossBarStrategy rule: long while fast EMA > slow EMA, flat when below, once both are warm."""
+    fast = close.ewm(span=fast_period, adjust=False, ignore_na=True).mean()
+    slow = close.ewm(span=slow_period, adjust=False, ignore_na=True).mean()
+    ready = close.notna().cumsum() >= max(fast_period, slow_period)
+    signal = np.where(fast > slow, 1.0, np.where(fast < slow, 0.0, np.nan))
+    return pd.DataFrame(np.where(ready & close.notna(), signal, np.nan), index=close.index, columns=close.columns)
+
+
+def nautilus_realized_pnl(catalog: ParquetDataCatalog, fast_period: int, slow_period: int) -> pd.DataFrame:
+    """Realized PnL and fill count per instrument of one EMACrossBarStrategy per instrument."""
+    instruments = catalog.instruments()
+    venues = [
+        BacktestVenueConfig(
+            name=venue_name,
+            oms_type="NETTING",
+            account_type="CASH",
+            base_currency="CNY",
+            starting_balances=["10_000_000 CNY"],
+        )
+        for venue_name in sorted({i.id.venue.value for i in instruments})
+    ]
+    strategies = [
+        ImportableStrategyConfig(
+            strategy_path="strategies.definitions:EMACrossBarStrategy",
+            config_path="strategies.definitions:EMACrossBarConfig",
+            config={
+                "instrument_id": str(i.id),
+                "bar_type": f"{i.id}-1-DAY-LAST-EXTERNAL",
+                "fast_period": fast_period,
+                "slow_period": slow_period,
+                "trade_size": TRADE_SIZE,
+            },
+        )
+        for i in instruments
+    ]
+    run_config = BacktestRunConfig(
+        engine=BacktestEngineConfig(strategies=strategies, logging=LoggingConfig(log_level="ERROR")),
+        venues=venues,
+        data=[BacktestDataConfig(catalog_path=str(catalog.path), data_cls=Bar, instrument_id=i.id) for i in instruments],
+    )
+    node = BacktestNode(configs=[run_config])
+    node.run()
+    engine = node.get_engine(run_config.id)
+
+    positions = parse_positions_report(engine.trader.generate_positions_report())
+    fills = engine.trader.generate_order_fills_report()
+    return pd.DataFrame({
+        "realized_pnl": positions.groupby("instrument_id")["realized_pnl"].sum(),
+        "fills": fills.groupby("instrument_id").size(),
+    })
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vectorized EMA-cross sweep over the A-share catalog")
+    parser.add_argument("--frictionless", action="store_true", help="No costs, price limits or T+1")
+    parser.add_argument("--verify", action="store_true", help="Check 5/20 against an EMACrossBarStrategy Nautilus run")
+    args = parser.parse_args()
+
+    print("=== Vectorized A-share Backtest ===")
+
+    # 1. Load the OHLCV panels
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog_ashare"
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    panel = load_panel(catalog_path)
+    close = panel["CLOSE"]
+    print(f"Panel: {close.shape[0]} bars x {close.shape[1]} instruments, {len(PARAMS)} parameter sets")
+
+    # 2. Signals for every parameter set, one column per (fast, slow, instrument)
+    keys = [(p["fast_period"], p["slow_period"]) for p in PARAMS]
+    started = time.perf_counter()
+    signal = pd.concat([ema_cross_signal(close, *key) for key in keys], axis=1, keys=keys, names=["fast", "slow"])
+    rules = FRICTIONLESS if args.frictionless else AShareRules()
+    result = backtest(target_from_signal(signal, TRADE_SIZE), tile(close, keys, names=["fast", "slow"]), rules)
+    elapsed = time.perf_counter() - started
+    print(f"Backtested {signal.shape[1]} columns in {elapsed:.2f}s ({signal.size / elapsed:,.0f} bar-columns/s)")
+
+    # 3. Rank the parameter sets by portfolio PnL
+    table = pd.DataFrame({
+        "final_equity": result.equity.iloc[-1],
+        "realized_pnl": result.realized_pnl,
+        "fills": result.fills,
+        "commissions": result.commissions,
+        "blocked": result.blocked,
+    }).groupby(level=["fast", "slow"]).sum()
+    curve = result.equity.T.groupby(level=["fast", "slow"]).sum().T
+    table["max_drawdown"] = (curve - curve.cummax()).min()
+    print("\n=== PARAMETER SETS ===")
+    print(table.sort_values("final_equity", ascending=False).to_string(float_format=lambda x: f"{x:,.2f}"))
+
+    # 4. Compare with the event engine
+    if args.verify:
+        print("\n=== VERIFY 5/20 AGAINST NAUTILUS ===")
+        reference = nautilus_realized_pnl(ParquetDataCatalog(str(catalog_path)), 5, 20)
+        vector = backtest(target_from_signal(ema_cross_signal(close, 5, 20), TRADE_SIZE), close, FRICTIONLESS)
+        comparison = reference.join(pd.DataFrame({"vector_pnl": vector.realized_pnl, "vector_fills": vector.fills}))
+        comparison["pnl_diff"] = comparison["vector_pnl"] - comparison["realized_pnl"]
+        print(comparison.to_string(float_format=lambda x: f"{x:,.2f}"))
+        matched = np.allclose(comparison["vector_pnl"], comparison["realized_pnl"], atol=0.01)
+        matched &= (comparison["vector_fills"] == comparison["fills"]).all()
+        print(f"\nMatch: {matched}")
+
+
+if __name__ == "__main__":
+    main()
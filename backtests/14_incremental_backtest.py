@@ -0,0 +1,216 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Money
+from nautilus_trader.model import TraderId
+from nautilus_trader.model.currencies import CNY
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.checkpoint import Checkpoint
+from research.checkpoint import load_checkpoint
+from research.checkpoint import restore_checkpoint
+from research.checkpoint import save_checkpoint
+from research.checkpoint import starting_balances
+from research.checkpoint import take_checkpoint
+from strategies.definitions import EMACrossBarConfig
+from strategies.definitions import EMACrossBarStrategy
+from strategies.definitions import EMACrossConfig
+from strategies.definitions import EMACrossStrategy
+from strategies.definitions import MACDEnhancedConfig
+from strategies.definitions import MACDEnhancedStrategy
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Strategy name -> (catalog, account type, starting balance)
+SETUPS = {
+    "ema": ("catalog", AccountType.MARGIN, Money(1_000_000, USD)),
+    "macd": ("catalog", AccountType.MARGIN, Money(1_000_000, USD)),
+    "bar": ("catalog_ashare", AccountType.CASH, Money(10_000_000, CNY)),
+}
+
+
+def make_strategy(name: str, instrument):
+    if name == "ema":
+        return EMACrossStrategy(EMACrossConfig(instrument_id=instrument.id, fast_period=10, slow_period=20, trade_size=10_000))
+    if name == "macd":
+        return MACDEnhancedStrategy(MACDEnhancedConfig(instrument_id=instrument.id, trade_size=100_000))
+    return EMACrossBarStrategy(EMACrossBarConfig(
+        instrument_id=instrument.id,
+        bar_type=f"{instrument.id}-1-DAY-LAST-EXTERNAL",
+        fast_period=5,
+        slow_period=20,
+        trade_size=100,
+    ))
+
+
+def make_engine(name: str, catalog: ParquetDataCatalog, checkpoint: Checkpoint | None = None) -> BacktestEngine:
+    """An engine with the venue, instrument and strategy, resumed from `checkpoint` if given."""
+    _, account_type, balance = SETUPS[name]
+    instrument = catalog.instruments()[0]
+    venue = instrument.id.venue
+
+    engine = BacktestEngine(config=BacktestEngineConfig(
+        trader_id=TraderId("BACKTESTER-001"),
+        logging=LoggingConfig(log_level="ERROR"),
+    ))
+    engine.add_venue(
+        venue=venue,
+        oms_type=OmsType.NETTING,
+        account_type=account_type,
+        base_currency=balance.currency,
+        starting_balances=starting_balances(checkpoint, venue) if checkpoint else [balance],
+    )
+    engine.add_instrument(instrument)
+    engine.add_strategy(make_strategy(name, instrument))
+    if checkpoint:
+        restore_checkpoint(engine, checkpoint)
+    return engine
+
+
+def load_data(name: str, catalog: ParquetDataCatalog, start: int | None = None) -> list:
+    """The strategy's ticks or bars with ts_init from `start` (nanoseconds) onwards."""
+    instrument = catalog.instruments()[0]
+    start = pd.Timestamp(start, tz="UTC") if start is not None else None
+    if name == "bar":
+        return catalog.bars(bar_types=[f"{instrument.id}-1-DAY-LAST-EXTERNAL"], start=start)
+    return catalog.quote_ticks(instrument_ids=[instrument.id], start=start)
+
+
+def run(engine: BacktestEngine, data: list) -> float:
+    """Stream `data` through the engine without stopping the trader; returns elapsed seconds."""
+    started = time.perf_counter()
+    engine.add_data(data)
+    engine.run(streaming=True)
+    engine.clear_data()
+    return time.perf_counter() - started
+
+
+def fill_fields(fill: dict) -> tuple:
+    """The parts of a fill that must match; venue order and trade ids are exchange sequence numbers."""
+    return fill["client_order_id"], fill["order_side"], fill["last_qty"], fill["last_px"], fill["commission"], fill["ts_event"]
+
+
+def order_fields(init: dict) -> dict:
+    """An order's initialisation without its random event id."""
+    return {key: value for key, value in init.items() if key != "event_id"}
+
+
+def fills_after(engine: BacktestEngine, ts: int) -> pd.DataFrame:
+    fills = engine.trader.generate_fills_report()
+    if fills.empty:
+        return fills
+    fills = fills[pd.to_datetime(fills["ts_event"], utc=True) > pd.Timestamp(ts, tz="UTC")]
+    columns = ["client_order_id", "order_side", "last_qty", "last_px", "ts_event"]
+    return fills.reset_index()[columns].sort_values(columns).reset_index(drop=True)
+
+
+def incremental(name: str, catalog: ParquetDataCatalog, path: Path):
+    """Resume from the checkpoint at `path` (or start afresh), replay the new data and save a new checkpoint."""
+    checkpoint = load_checkpoint(path) if path.exists() else None
+    data = load_data(name, catalog, checkpoint.ts_last + 1 if checkpoint else None)
+    if not data:
+        print(f"No data after {pd.Timestamp(checkpoint.ts_last, tz='UTC')}, checkpoint is up to date")
+        return
+
+    if checkpoint:
+        print(f"Resuming from {pd.Timestamp(checkpoint.ts_last, tz='UTC')} ({len(checkpoint.positions)} open positions)")
+    engine = make_engine(name, catalog, checkpoint)
+    elapsed = run(engine, data)
+    saved = save_checkpoint(engine, path)
+    print(f"Processed {len(data)} new records in {elapsed:.2f}s")
+    print(f"Checkpoint: {path} at {pd.Timestamp(saved.ts_last, tz='UTC')}")
+    print(f"Open positions: {len(saved.positions)}, balances: {saved.balances}")
+    engine.end()
+
+
+def verify(name: str, catalog: ParquetDataCatalog, path: Path, split: float):
+    """Check that running to a cut, checkpointing and resuming equals one full run."""
+    data = load_data(name, catalog)
+    cut = data[int(len(data) * split) - 1].ts_init
+    print(f"Full run: {len(data)} records, checkpoint at {pd.Timestamp(cut, tz='UTC')}")
+
+    full = make_engine(name, catalog)
+    full_s = run(full, data)
+    full_state = take_checkpoint(full)
+
+    first = make_engine(name, catalog)
+    run(first, [d for d in data if d.ts_init <= cut])
+    checkpoint = save_checkpoint(first, path)
+    first.end()
+
+    resumed = make_engine(name, catalog, load_checkpoint(path))
+    new_data = load_data(name, catalog, checkpoint.ts_last + 1)
+    resumed_s = run(resumed, new_data)
+    resumed_state = take_checkpoint(resumed)
+
+    full.end()
+    resumed.end()
+    full_fills = fills_after(full, cut)
+    resumed_fills = fills_after(resumed, cut)
+    venue = catalog.instruments()[0].id.venue
+    full_balance = full.cache.account_for_venue(venue).balances_total()
+    resumed_balance = resumed.cache.account_for_venue(venue).balances_total()
+
+    checks = {
+        "strategy state": full_state.strategies == resumed_state.strategies,
+        "open positions": [list(map(fill_fields, p)) for p in full_state.positions]
+        == [list(map(fill_fields, p)) for p in resumed_state.positions],
+        "order count": full_state.order_counts == resumed_state.order_counts
+        and full_state.order_list_counts == resumed_state.order_list_counts,
+        "open orders": {k: list(map(order_fields, v)) for k, v in full_state.orders.items()}
+        == {k: list(map(order_fields, v)) for k, v in resumed_state.orders.items()},
+        "balances before stop": full_state.balances == resumed_state.balances,
+        f"fills after checkpoint ({len(full_fills)})": full_fills.equals(resumed_fills),
+        "final balances": full_balance == resumed_balance,
+    }
+    print("\n=== VERIFY ===")
+    for check, passed in checks.items():
+        print(f"{check:<32} {'OK' if passed else 'MISMATCH'}")
+    print(f"\nFull rerun: {full_s:.2f}s, resumed run: {resumed_s:.2f}s over {len(new_data)} new records")
+    print(f"Equivalent: {all(checks.values())}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Checkpointed backtest that only replays newly appended data")
+    parser.add_argument("--strategy", choices=list(SETUPS), default="bar")
+    parser.add_argument("--checkpoint", default=None, help="Defaults to checkpoints/<strategy>.pkl")
+    parser.add_argument("--reset", action="store_true", help="Delete the checkpoint and start from the first bar")
+    parser.add_argument("--verify", action="store_true", help="Compare checkpoint + resume against a full rerun")
+    parser.add_argument("--split", type=float, default=0.7, help="Share of the data before the checkpoint in --verify")
+    args = parser.parse_args()
+
+    print("=== Incremental Backtest ===")
+
+    catalog_path = PROJECT_ROOT / SETUPS[args.strategy][0]
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run the data setup scripts in data_scripts/ first.")
+        return
+    catalog = ParquetDataCatalog(str(catalog_path))
+
+    path = Path(args.checkpoint) if args.checkpoint else PROJECT_ROOT / "checkpoints" / f"{args.strategy}.pkl"
+    if args.verify:
+        verify(args.strategy, catalog, path.with_name(f"{path.stem}.verify{path.suffix}"), args.split)
+        return
+    if args.reset:
+        path.unlink(missing_ok=True)
+    incremental(args.strategy, catalog, path)
+
+
+if __name__ == "__main__":
+    main()
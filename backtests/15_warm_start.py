@@ -0,0 +1,174 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Money
+from nautilus_trader.model.currencies import CNY
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from strategies.definitions import EMACrossBarConfig
+from strategies.definitions import EMACrossBarStrategy
+from strategies.definitions import EMACrossConfig
+from strategies.definitions import EMACrossStrategy
+from strategies.definitions import MACDEnhancedConfig
+from strategies.definitions import MACDEnhancedStrategy
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Strategy name -> (catalog, account type, starting balance)
+SETUPS = {
+    "ema": ("catalog", AccountType.MARGIN, Money(1_000_000, USD)),
+    "macd": ("catalog", AccountType.MARGIN, Money(1_000_000, USD)),
+    "bar": ("catalog_ashare", AccountType.CASH, Money(10_000_000, CNY)),
+}
+
+
+def ema_spread(strategy) -> float:
+    if not strategy.fast_ema.initialized or not strategy.slow_ema.initialized:
+        return np.nan
+    return strategy.fast_ema.value - strategy.slow_ema.value
+
+
+def macd_value(strategy) -> float:
+    return strategy.macd.value if strategy.macd.initialized else np.nan
+
+
+def recording(cls: type, indicator) -> type:
+    """`cls` recording `indicator(strategy)` after every tick or bar it handles."""
+
+    class Recording(cls):
+        def on_start(self):
+            self.recorded = []
+            super().on_start()
+
+        def on_quote_tick(self, tick):
+            super().on_quote_tick(tick)
+            self.recorded.append((tick.ts_init, indicator(self)))
+
+        def on_bar(self, bar):
+            super().on_bar(bar)
+            self.recorded.append((bar.ts_init, indicator(self)))
+
+    return Recording
+
+
+def make_strategy(name: str, instrument, warm_start_catalog: str | None):
+    if name == "ema":
+        config = EMACrossConfig(
+            instrument_id=instrument.id, fast_period=10, slow_period=50, trade_size=10_000, warm_start_catalog=warm_start_catalog
+        )
+        return recording(EMACrossStrategy, ema_spread)(config)
+    if name == "macd":
+        config = MACDEnhancedConfig(instrument_id=instrument.id, trade_size=100_000, warm_start_catalog=warm_start_catalog)
+        return recording(MACDEnhancedStrategy, macd_value)(config)
+    config = EMACrossBarConfig(
+        instrument_id=instrument.id,
+        bar_type=f"{instrument.id}-1-DAY-LAST-EXTERNAL",
+        fast_period=5,
+        slow_period=60,
+        trade_size=100,
+        warm_start_catalog=warm_start_catalog,
+    )
+    return recording(EMACrossBarStrategy, ema_spread)(config)
+
+
+def run(name: str, catalog: ParquetDataCatalog, data: list, start: int | None, warm_start: bool) -> tuple[pd.Series, float]:
+    """Replay `data` from `start` and return the recorded indicator series and the elapsed seconds."""
+    _, account_type, balance = SETUPS[name]
+    instrument = catalog.instruments()[0]
+    engine = BacktestEngine(config=BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR")))
+    engine.add_venue(
+        venue=instrument.id.venue,
+        oms_type=OmsType.NETTING,
+        account_type=account_type,
+        base_currency=balance.currency,
+        starting_balances=[balance],
+    )
+    engine.add_instrument(instrument)
+    strategy = make_strategy(name, instrument, str(catalog.path) if warm_start else None)
+    engine.add_strategy(strategy)
+
+    started = time.perf_counter()
+    engine.add_data([d for d in data if start is None or d.ts_init >= start])
+    engine.run(start=start)
+    elapsed = time.perf_counter() - started
+
+    ts, values = zip(*strategy.recorded)
+    engine.dispose()
+    return pd.Series(values, index=pd.to_datetime(ts, utc=True)), elapsed
+
+
+def compare(reference: pd.Series, windowed: pd.Series) -> dict:
+    """Signal agreement of a windowed run with the continuous run over the window."""
+    reference = reference.loc[windowed.index]
+    signal_ref = np.sign(reference.to_numpy())
+    signal = np.sign(windowed.to_numpy())
+    differs = ~((signal == signal_ref) | (np.isnan(signal) & np.isnan(signal_ref)))
+    mismatches = windowed.index[differs]
+    return {
+        "events": len(windowed),
+        "warm-up events": int(windowed.isna().sum()),
+        "signal mismatches": len(mismatches),
+        "last mismatch": mismatches[-1] if len(mismatches) else "-",
+        "max value error": f"{np.nanmax(np.abs(windowed.to_numpy() - reference.to_numpy())):.3g}",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Windowed runs with indicators seeded from the preceding history")
+    parser.add_argument("--strategy", choices=list(SETUPS), default="ema")
+    parser.add_argument("--split", type=float, default=0.5, help="Share of the data before the window start")
+    args = parser.parse_args()
+
+    print("=== Indicator Warm-Start ===")
+
+    catalog_path = PROJECT_ROOT / SETUPS[args.strategy][0]
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run the data setup scripts in data_scripts/ first.")
+        return
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instrument = catalog.instruments()[0]
+
+    if args.strategy == "bar":
+        data = catalog.bars(bar_types=[f"{instrument.id}-1-DAY-LAST-EXTERNAL"])
+    else:
+        data = catalog.quote_ticks(instrument_ids=[instrument.id])
+    window_start = data[int(len(data) * args.split)].ts_init
+    print(f"{instrument.id}: {len(data)} records, window from {pd.Timestamp(window_start, tz='UTC')}")
+
+    # 1. The reference: one run over all the data
+    continuous, continuous_s = run(args.strategy, catalog, data, None, warm_start=False)
+
+    # 2. The window alone, warming up on its own data and seeded from the history
+    cold, cold_s = run(args.strategy, catalog, data, window_start, warm_start=False)
+    warm, warm_s = run(args.strategy, catalog, data, window_start, warm_start=True)
+
+    table = pd.DataFrame({
+        "cold window": compare(continuous, cold),
+        "warm-started window": compare(continuous, warm),
+    }, dtype=object)
+    table.loc["seconds"] = [f"{cold_s:.2f}", f"{warm_s:.2f}"]
+    print("\n=== SIGNALS AGAINST A CONTINUOUS RUN ===")
+    print(table.to_string())
+    print(f"\nContinuous run over all {len(data)} records: {continuous_s:.2f}s")
+    print(f"Identical signals: {table.loc['signal mismatches', 'warm-started window'] == 0}")
+
+
+if __name__ == "__main__":
+    main()
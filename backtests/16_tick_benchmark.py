@@ -0,0 +1,100 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Money
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from strategies.definitions import EMACrossConfig
+from strategies.definitions import EMACrossStrategy
+from strategies.definitions import MACDConfig
+from strategies.definitions import MACDEnhancedConfig
+from strategies.definitions import MACDEnhancedStrategy
+from strategies.definitions import MACDStrategy
+
+# Benchmark name -> (strategy class, config class, parameters); short periods trade often
+BENCHMARKS = {
+    "ema": (EMACrossStrategy, EMACrossConfig, {"fast_period": 10, "slow_period": 20, "trade_size": 10_000}),
+    "ema_fast": (EMACrossStrategy, EMACrossConfig, {"fast_period": 2, "slow_period": 4, "trade_size": 10_000}),
+    "macd": (MACDStrategy, MACDConfig, {"trade_size": 100_000}),
+    "macd_enhanced": (MACDEnhancedStrategy, MACDEnhancedConfig, {"trade_size": 100_000}),
+}
+
+
+def benchmark(name: str, instrument, ticks: list, repeat: int, log_level: str) -> dict:
+    """Best-of-`repeat` replay of the ticks through one strategy on a reused engine."""
+    strategy_cls, config_cls, params = BENCHMARKS[name]
+    # The post-run PortfolioAnalyzer statistics are not part of the replay
+    engine = BacktestEngine(config=BacktestEngineConfig(logging=LoggingConfig(log_level=log_level), run_analysis=False))
+    engine.add_venue(
+        venue=instrument.id.venue,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(ticks)
+
+    timings = []
+    for _ in range(repeat):
+        engine.reset()
+        engine.clear_strategies()
+        engine.add_strategy(strategy_cls(config_cls(instrument_id=instrument.id, **params)))
+        started = time.perf_counter()
+        engine.run()
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    result = {
+        "seconds": best,
+        "ticks/s": len(ticks) / best,
+        "us/tick": best / len(ticks) * 1e6,
+        "orders": len(engine.cache.orders()),
+        "positions": len(engine.cache.positions()),
+    }
+    engine.dispose()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tick replay throughput of the strategies in strategies/definitions.py")
+    parser.add_argument("--strategy", choices=list(BENCHMARKS), nargs="+", default=list(BENCHMARKS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per strategy; the fastest is reported")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+
+    print("=== Tick Benchmark ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instrument = catalog.instruments()[0]
+    ticks = catalog.quote_ticks(instrument_ids=[instrument.id])
+    print(f"{instrument.id}: {len(ticks)} ticks, best of {args.repeat} runs, log level {args.log_level}")
+
+    table = pd.DataFrame({name: benchmark(name, instrument, ticks, args.repeat, args.log_level) for name in args.strategy}).T
+    print(table.to_string(float_format=lambda x: f"{x:,.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from research.optimise import data_range
+from research.optimise import evaluate
+from research.optimise import evaluate_variants
+from research.optimise import grid
+from research.optimise import make_pool
+
+# Parameter variants of each strategy; MACDEnhanced's bracket orders would move
+# the shared venue's quote for every variant (see `run_variants`). Some slow
+# periods are other variants' fast periods, so shared EMAs serve both roles.
+VARIANTS = {
+    "ema": [
+        params for params in grid(
+            fast_period=[5, 10, 20],
+            slow_period=[20, 40, 100],
+            trade_size=[10_000],
+        )
+        if params["fast_period"] < params["slow_period"]
+    ],
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parameter variants as strategy instances sharing one data replay")
+    parser.add_argument("--strategy", choices=list(VARIANTS), default="ema")
+    parser.add_argument("--workers", type=int, default=None, help="Variants are split into one shared replay per worker")
+    parser.add_argument("--verify", action="store_true", help="Also run every variant on its own and compare")
+    parser.add_argument("--shared-indicators", action="store_true", help="Variants share indicators with equal parameters")
+    parser.add_argument("--warm-start", action="store_true", help="Replay the second half, seeding indicators from the first")
+    args = parser.parse_args()
+
+    print("=== Shared Replay Sweep ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    variants = [{**params, "shared_indicators": args.shared_indicators} for params in VARIANTS[args.strategy]]
+    workers = args.workers or os.cpu_count()
+    print(f"Strategy: {args.strategy}, {len(variants)} variants in {min(workers, len(variants))} replay(s)")
+
+    start = None
+    if args.warm_start:
+        first, last = data_range(str(catalog_path))
+        start = first + (last - first) // 2
+        print(f"Window from {pd.Timestamp(start, tz='UTC')}, indicators warm-started")
+
+    with make_pool(str(catalog_path), workers=workers, warm_start=args.warm_start) as executor:
+        started = time.perf_counter()
+        stats, results = evaluate_variants(executor, args.strategy, variants, start=start, chunks=workers)
+        shared_s = time.perf_counter() - started
+
+        if args.verify:
+            started = time.perf_counter()
+            separate, _ = evaluate(executor, [(args.strategy, params, start) for params in variants])
+            separate_s = time.perf_counter() - started
+
+    table = pd.concat([pd.DataFrame(VARIANTS[args.strategy]), stats], axis=1)
+    print("\n=== VARIANTS ===")
+    print(table.to_string())
+    print(f"\nShared replay: {shared_s:.2f}s, {results[0]['iterations']} iterations per replay")
+
+    if args.verify:
+        columns = ["total_pnl", "total_return", "max_drawdown", "turnover", "positions"]
+        differs = ~np.isclose(stats[columns], separate[columns], rtol=0.0, atol=1e-9).all(axis=1)
+        print(f"Separate runs: {separate_s:.2f}s ({separate_s / shared_s:.1f}x)")
+        print(f"Variants matching their separate run: {len(variants) - differs.sum()}/{len(variants)}")
+        if differs.any():
+            print("\n=== DIFFERING VARIANTS (separate run) ===")
+            print(pd.concat([pd.DataFrame(VARIANTS[args.strategy]), separate], axis=1)[differs].to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Money
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.enums import OrderType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.analytics import parse_positions_report
+from research.warm_start import ema_values
+from strategies.definitions import EMACrossConfig
+from strategies.definitions import EMACrossStrategy
+from strategies.definitions import MACDConfig
+from strategies.definitions import MACDEnhancedConfig
+from strategies.definitions import MACDEnhancedStrategy
+from strategies.definitions import MACDStrategy
+
+# Strategy name -> (strategy class, config class, parameters)
+STRATEGIES = {
+    "ema": (EMACrossStrategy, EMACrossConfig, {"fast_period": 10, "slow_period": 20, "trade_size": 10_000}),
+    "macd": (MACDStrategy, MACDConfig, {"trade_size": 100_000}),
+    "macd_enhanced": (MACDEnhancedStrategy, MACDEnhancedConfig, {"trade_size": 100_000}),
+}
+
+
+def counting(cls: type) -> type:
+    """`cls` counting its `check_signals` calls."""
+
+    class Counting(cls):
+        def on_start(self):
+            self.checks = 0
+            super().on_start()
+
+        def check_signals(self, *args):
+            self.checks += 1
+            super().check_signals(*args)
+
+    return Counting
+
+
+def sign_changes(name: str, ticks: list) -> np.ndarray:
+    """Timestamps (ns) at which the strategy's signal (EMA spread or MACD) changes sign, from the mid prices."""
+    _, config_cls, params = STRATEGIES[name]
+    config = config_cls(instrument_id=ticks[0].instrument_id, **params)
+    mid = np.array([(tick.bid_price.as_double() + tick.ask_price.as_double()) / 2.0 for tick in ticks])
+    signal = ema_values(mid, config.fast_period) - ema_values(mid, config.slow_period)
+    ts = np.array([tick.ts_init for tick in ticks], dtype=np.int64)
+    sign = np.sign(signal)
+    return ts[1:][sign[1:] != sign[:-1]]
+
+
+def run(name: str, instrument, ticks: list, interval_ms: int, on_sign_change: bool) -> tuple[dict, np.ndarray]:
+    """Replay the ticks with signals sampled every `interval_ms`; returns the statistics and the market order times."""
+    strategy_cls, config_cls, params = STRATEGIES[name]
+    engine = BacktestEngine(config=BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"), run_analysis=False))
+    engine.add_venue(
+        venue=instrument.id.venue,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(ticks)
+    strategy = counting(strategy_cls)(config_cls(
+        instrument_id=instrument.id,
+        signal_interval_ms=interval_ms,
+        signal_on_sign_change=on_sign_change,
+        **params,
+    ))
+    engine.add_strategy(strategy)
+
+    started = time.perf_counter()
+    engine.run()
+    elapsed = time.perf_counter() - started
+
+    orders = np.sort([order.ts_init for order in engine.cache.orders() if order.order_type == OrderType.MARKET])
+    stats = {
+        "seconds": elapsed,
+        "ticks/s": len(ticks) / elapsed,
+        "signal checks": strategy.checks,
+        "orders": len(engine.cache.orders()),
+        "pnl": parse_positions_report(engine.trader.generate_positions_report())["realized_pnl"].sum(),
+    }
+    engine.dispose()
+    return stats, orders
+
+
+def latency(orders: np.ndarray, changes: np.ndarray) -> dict:
+    """Time from the signal's latest change of sign to each market order."""
+    last = np.searchsorted(changes, orders, side="right") - 1
+    delay = (orders[last >= 0] - changes[last[last >= 0]]) / 1e9
+    if len(delay) == 0:
+        return {"latency p50 (s)": np.nan, "latency p95 (s)": np.nan, "latency max (s)": np.nan}
+    return {
+        "latency p50 (s)": np.percentile(delay, 50),
+        "latency p95 (s)": np.percentile(delay, 95),
+        "latency max (s)": delay.max(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Signal evaluation sampled on a time grid instead of every tick")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="ema")
+    parser.add_argument("--intervals", nargs="+", default=["0", "1min", "5min", "15min"], help="Sampling intervals, 0 = every tick")
+    parser.add_argument("--grid-only", action="store_true", help="Do not evaluate early on a change of signal sign")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per interval; the fastest is reported")
+    args = parser.parse_args()
+
+    print("=== Signal Sampling ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instrument = catalog.instruments()[0]
+    ticks = catalog.quote_ticks(instrument_ids=[instrument.id])
+    spacing = np.diff([tick.ts_init for tick in ticks]) / 1e9
+    print(f"{instrument.id}: {len(ticks)} ticks, median spacing {np.median(spacing):.3f}s, strategy {args.strategy}")
+
+    changes = sign_changes(args.strategy, ticks)
+    rows = {}
+    for interval in args.intervals:
+        interval_ms = int(pd.Timedelta(interval).total_seconds() * 1000) if interval != "0" else 0
+        stats, orders = min(
+            (run(args.strategy, instrument, ticks, interval_ms, not args.grid_only) for _ in range(args.repeat)),
+            key=lambda result: result[0]["seconds"],
+        )
+        rows[interval] = {**stats, **latency(orders, changes)}
+
+    print("\n=== SAMPLING INTERVALS ===")
+    print(pd.DataFrame(rows).T.to_string(float_format=lambda x: f"{x:,.2f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/live
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.adapters.sandbox.config import SandboxExecutionClientConfig
+from nautilus_trader.config import InstrumentProviderConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import TradingNodeConfig
+from nautilus_trader.live.node import TradingNode
+from nautilus_trader.model import InstrumentId
+
+from research.ashare_live import AshareDataClientConfig
+from research.ashare_live import AshareLiveDataClientFactory
+from research.ashare_live import BarLatency
+from research.ashare_live import BarLatencyConfig
+from research.ashare_live import BarSandboxExecutionClient
+from research.ashare_live import MKLINE_PATH
+from research.ashare_live import TENCENT_MKLINE_URL
+from research.ashare_live import ashare_instrument
+from research.ashare_live import minute_bar_type
+from research.ashare_live import stand_in_server
+from strategies.definitions import EMACrossBarConfig
+from strategies.definitions import EMACrossBarStrategy
+
+DEFAULT_INSTRUMENTS = ["600519.SSE", "601318.SSE", "000001.SZSE", "000858.SZSE"]
+
+
+def build_node(
+    instrument_ids: list[InstrumentId],
+    base_url: str,
+    trading_hours_only: bool,
+    fast_period: int,
+    slow_period: int,
+) -> tuple[TradingNode, BarLatency]:
+    """Node paper-trading an EMA cross per instrument on polled minute bars, with a sandbox account per venue."""
+    venues = sorted({instrument_id.venue.value for instrument_id in instrument_ids})
+    config = TradingNodeConfig(
+        trader_id="PAPER-001",
+        logging=LoggingConfig(log_level="WARNING"),
+        data_clients={
+            "ASHARE": AshareDataClientConfig(
+                instrument_provider=InstrumentProviderConfig(load_ids=frozenset(map(str, instrument_ids))),
+                base_url=base_url,
+                trading_hours_only=trading_hours_only,
+            ),
+        },
+        timeout_connection=10.0,
+        timeout_reconciliation=5.0,
+        timeout_portfolio=5.0,
+        timeout_disconnection=5.0,
+        timeout_post_stop=2.0,
+    )
+    node = TradingNode(config=config)
+    node.add_data_client_factory("ASHARE", AshareLiveDataClientFactory)
+    # The sandbox clients load their venue's instruments from the cache when they connect
+    for instrument_id in instrument_ids:
+        node.cache.add_instrument(ashare_instrument(instrument_id))
+
+    bar_types = [str(minute_bar_type(instrument_id)) for instrument_id in instrument_ids]
+    for bar_type in bar_types:
+        node.trader.add_strategy(EMACrossBarStrategy(EMACrossBarConfig(
+            instrument_id=InstrumentId.from_str(bar_type.split("-")[0]),
+            bar_type=bar_type,
+            fast_period=fast_period,
+            slow_period=slow_period,
+            order_id_tag=bar_type.split(".")[0],
+        )))
+    latency = BarLatency(BarLatencyConfig(bar_types=bar_types))
+    node.trader.add_actor(latency)
+    node.build()
+
+    for venue in venues:
+        node.kernel.exec_engine.register_client(BarSandboxExecutionClient(
+            loop=node.get_event_loop(),
+            clock=node.kernel.clock,
+            portfolio=node.kernel.portfolio,
+            msgbus=node.kernel.msgbus,
+            cache=node.cache,
+            config=SandboxExecutionClientConfig(
+                venue=venue,
+                starting_balances=["10_000_000 CNY"],
+                base_currency="CNY",
+                oms_type="NETTING",
+                account_type="CASH",
+            ),
+        ))
+    return node, latency
+
+
+async def run(node: TradingNode, minutes: float) -> None:
+    task = asyncio.create_task(node.run_async())
+    try:
+        await asyncio.sleep(minutes * 60)
+    finally:
+        await node.stop_async()
+        await asyncio.sleep(1)
+        task.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Paper trading on live A-share minute bars polled from Tencent")
+    parser.add_argument("--instruments", nargs="+", default=DEFAULT_INSTRUMENTS)
+    parser.add_argument("--minutes", type=float, default=5, help="How long to run")
+    parser.add_argument("--fast-period", type=int, default=5)
+    parser.add_argument("--slow-period", type=int, default=20)
+    parser.add_argument("--stand-in", action="store_true", help="Poll a local stand-in server, around the clock")
+    args = parser.parse_args()
+
+    print("=== A-share Live Paper Trading ===")
+    instrument_ids = [InstrumentId.from_str(instrument_id) for instrument_id in args.instruments]
+
+    def trade(base_url: str, trading_hours_only: bool) -> None:
+        node, latency = build_node(instrument_ids, base_url, trading_hours_only, args.fast_period, args.slow_period)
+        loop = node.get_event_loop()
+        try:
+            loop.run_until_complete(run(node, args.minutes))
+        finally:
+            node.dispose()
+
+        print("\n=== BAR LATENCY (close -> callback) ===")
+        print(pd.Series(latency.summary()).to_string(float_format=lambda x: f"{x:,.1f}"))
+        print("\n=== ORDERS ===")
+        orders = node.cache.orders()
+        print(f"{len(orders)} orders, {sum(order.filled_qty > 0 for order in orders)} filled")
+        for account in node.cache.accounts():
+            print(f"  {account.id}: {account.balance_total()}")
+        for position in node.cache.positions():
+            print(f"  {position.instrument_id}: {position.side.name} {position.quantity}, realized {position.realized_pnl}")
+
+    if args.stand_in:
+        with stand_in_server(lag=0.5) as root:
+            print(f"Stand-in server at {root}")
+            trade(root + MKLINE_PATH, trading_hours_only=False)
+    else:
+        trade(TENCENT_MKLINE_URL, trading_hours_only=True)
+
+
+if __name__ == "__main__":
+    main()
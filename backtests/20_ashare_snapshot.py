@@ -0,0 +1,116 @@
+# Source: https://github.com/mpquant/Ashare
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.core.nautilus_pyo3 import HttpClient
+from nautilus_trader.core.nautilus_pyo3 import HttpMethod
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.ashare_live import MKLINE_PATH
+from research.ashare_live import QUOTE_PATH
+from research.ashare_live import TENCENT_MKLINE_URL
+from research.ashare_live import TENCENT_QUOTE_URL
+from research.ashare_live import QuoteSnapshotter
+from research.ashare_live import ashare_code
+from research.ashare_live import parse_minute_rows
+from research.ashare_live import stand_in_server
+
+
+def universe(args) -> list[str]:
+    """Tencent codes to monitor: `--codes`, `--synthetic` made-up codes, or the A-share catalog's instruments."""
+    if args.codes:
+        return args.codes
+    if args.synthetic:
+        half = args.synthetic // 2
+        return [f"sh{600000 + i}" for i in range(half)] + [f"sz{1 + i:06d}" for i in range(args.synthetic - half)]
+    catalog_path = Path(__file__).parent.parent / "catalog_ashare"
+    if not catalog_path.exists():
+        return []
+    return [ashare_code(instrument.id) for instrument in ParquetDataCatalog(str(catalog_path)).instruments()]
+
+
+async def per_code_cycle(codes: list[str], url: str, max_concurrency: int) -> dict:
+    """One kline request per code for its latest price, the way `get_price_min_tx` is used today."""
+    http = HttpClient(timeout_secs=5)
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def latest(code: str) -> float:
+        async with semaphore:
+            response = await http.request(HttpMethod.GET, f"{url}?param={code},m1,,1")
+        return float(parse_minute_rows(bytes(response.body), code)[-1][4])
+
+    started = time.perf_counter()
+    prices = await asyncio.gather(*map(latest, codes), return_exceptions=True)
+    return {
+        "requests": len(codes),
+        "quotes": sum(isinstance(price, float) for price in prices),
+        "total (ms)": (time.perf_counter() - started) * 1e3,
+    }
+
+
+async def monitor(snapshotter: QuoteSnapshotter, cycles: int, interval: float) -> dict[str, np.ndarray]:
+    snapshot = {}
+    for _ in range(cycles):
+        await asyncio.sleep(interval - time.time() % interval)
+        snapshot = await snapshotter.snapshot()
+    return snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batched real-time quote snapshots of an A-share universe")
+    parser.add_argument("--codes", nargs="+", help="Tencent codes, e.g. sh600519 sz000001")
+    parser.add_argument("--synthetic", type=int, help="Monitor this many made-up codes (with --stand-in)")
+    parser.add_argument("--cycles", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=3.0, help="Seconds between snapshots")
+    parser.add_argument("--batch-size", type=int, default=300, help="Codes per request")
+    parser.add_argument("--max-concurrency", type=int, default=8)
+    parser.add_argument("--compare", action="store_true", help="Also time one kline request per code")
+    parser.add_argument("--stand-in", action="store_true", help="Query a local stand-in server")
+    args = parser.parse_args()
+
+    print("=== A-share Quote Snapshots ===")
+    codes = universe(args)
+    if not codes:
+        print("No codes: pass --codes or --synthetic, or run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    def measure(quote_url: str, kline_url: str) -> None:
+        snapshotter = QuoteSnapshotter(codes, quote_url, args.batch_size, args.max_concurrency)
+        snapshot = asyncio.run(monitor(snapshotter, args.cycles, args.interval))
+        print(f"{len(codes)} codes, {args.batch_size} per request, every {args.interval}s\n")
+        print("=== CYCLES ===")
+        cycles = pd.DataFrame(snapshotter.cycles)
+        print(cycles.to_string(float_format=lambda x: f"{x:,.1f}"))
+        print(f"\nTotal latency p50 {cycles['total (ms)'].median():,.1f} ms, max {cycles['total (ms)'].max():,.1f} ms")
+
+        print("\n=== LATEST SNAPSHOT ===")
+        table = pd.DataFrame(snapshot).set_index("code")
+        table["ts"] = pd.to_datetime(table["ts"], utc=True).dt.tz_convert("Asia/Shanghai")
+        table["change (%)"] = (table["price"] / table["prev_close"] - 1) * 100
+        print(table[["ts", "price", "change (%)", "bid", "ask", "volume"]].head(10).to_string())
+
+        if args.compare:
+            print("\n=== ONE KLINE REQUEST PER CODE ===")
+            result = asyncio.run(per_code_cycle(codes, kline_url, args.max_concurrency))
+            print(pd.DataFrame([result]).to_string(index=False, float_format=lambda x: f"{x:,.1f}"))
+
+    if args.stand_in:
+        with stand_in_server() as root:
+            print(f"Stand-in server at {root}")
+            measure(root + QUOTE_PATH, root + MKLINE_PATH)
+    else:
+        measure(TENCENT_QUOTE_URL, TENCENT_MKLINE_URL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/backtesting
+
+import argparse
+import ast
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Money
+from nautilus_trader.model.currencies import USD
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from research.event_trace import EventTraceConfig
+from research.event_trace import EventTraceRecorder
+from research.event_trace import diff_traces
+from strategies.definitions import EMACrossConfig
+from strategies.definitions import EMACrossStrategy
+from strategies.definitions import MACDConfig
+from strategies.definitions import MACDEnhancedConfig
+from strategies.definitions import MACDEnhancedStrategy
+from strategies.definitions import MACDStrategy
+
+# Strategy name -> (strategy class, config class, parameters)
+STRATEGIES = {
+    "ema": (EMACrossStrategy, EMACrossConfig, {"fast_period": 10, "slow_period": 20, "trade_size": 10_000}),
+    "macd": (MACDStrategy, MACDConfig, {"trade_size": 100_000}),
+    "macd_enhanced": (MACDEnhancedStrategy, MACDEnhancedConfig, {"trade_size": 100_000}),
+}
+
+
+def run(name: str, instrument, ticks: list, params: dict, trace: Path | None) -> dict:
+    """Replay the ticks through one strategy, recording its events to `trace` if given."""
+    strategy_cls, config_cls, defaults = STRATEGIES[name]
+    engine = BacktestEngine(config=BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"), run_analysis=False))
+    engine.add_venue(
+        venue=instrument.id.venue,
+        oms_type=OmsType.NETTING,
+        account_type=AccountType.MARGIN,
+        base_currency=USD,
+        starting_balances=[Money(1_000_000, USD)],
+    )
+    engine.add_instrument(instrument)
+    engine.add_data(ticks)
+    engine.add_strategy(strategy_cls(config_cls(instrument_id=instrument.id, **{**defaults, **params})))
+    recorder = None
+    if trace is not None:
+        recorder = EventTraceRecorder(EventTraceConfig(path=str(trace)))
+        engine.add_actor(recorder)
+
+    started = time.perf_counter()
+    engine.run()
+    elapsed = time.perf_counter() - started
+    result = {
+        "seconds": elapsed,
+        "orders": len(engine.cache.orders()),
+        "events": recorder.count if recorder else 0,
+        "trace (KiB)": trace.stat().st_size / 1024 if trace else 0,
+    }
+    engine.dispose()
+    return result
+
+
+def report(path_a: Path, path_b: Path, ignore: tuple[str, ...]) -> None:
+    started = time.perf_counter()
+    diff = diff_traces(path_a, path_b, ignore=ignore)
+    elapsed = time.perf_counter() - started
+    print(f"\n=== DIFF ({elapsed * 1e3:,.1f} ms) ===")
+    print(f"a: {path_a} ({diff['events'][0]} events)")
+    print(f"b: {path_b} ({diff['events'][1]} events)")
+    if diff["index"] is None:
+        print("Traces are identical")
+        return
+    print(f"First divergent event: #{diff['index']}, columns {diff['columns'] or 'missing in one trace'}")
+    with pd.option_context("display.width", 250, "display.max_columns", None):
+        print(diff["context"].to_string())
+
+
+def parse_params(items: list[str]) -> dict:
+    """`key=value` arguments, values as Python literals."""
+    params = {}
+    for item in items:
+        key, value = item.split("=", 1)
+        params[key] = ast.literal_eval(value)
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record event traces of two runs and report where they diverge")
+    parser.add_argument("--strategy", choices=list(STRATEGIES), default="ema")
+    parser.add_argument("--baseline", nargs="*", default=[], help="Parameter overrides of run a, as key=value")
+    parser.add_argument("--variant", nargs="*", default=["signal_interval_ms=60000"], help="Parameter overrides of run b")
+    parser.add_argument("--ignore", nargs="*", default=[], help="Columns not compared, e.g. ts_event")
+    parser.add_argument("--diff", nargs=2, metavar=("A", "B"), help="Only diff two existing trace files")
+    args = parser.parse_args()
+
+    print("=== Event Trace ===")
+
+    if args.diff:
+        report(Path(args.diff[0]), Path(args.diff[1]), tuple(args.ignore))
+        return
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / "catalog"
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instrument = catalog.instruments()[0]
+    ticks = catalog.quote_ticks(instrument_ids=[instrument.id])
+    print(f"{instrument.id}: {len(ticks)} ticks, strategy {args.strategy}")
+
+    traces = project_root / "traces"
+    baseline, variant = parse_params(args.baseline), parse_params(args.variant)
+    path_a, path_b = traces / f"{args.strategy}_a.arrow", traces / f"{args.strategy}_b.arrow"
+    runs = {
+        "a, no trace": run(args.strategy, instrument, ticks, baseline, None),
+        "a": run(args.strategy, instrument, ticks, baseline, path_a),
+        "b": run(args.strategy, instrument, ticks, variant, path_b),
+    }
+    print(f"a: {baseline}, b: {variant}\n")
+    print("=== RUNS ===")
+    print(pd.DataFrame(runs).T.to_string(float_format=lambda x: f"{x:,.2f}"))
+    report(path_a, path_b, tuple(args.ignore))
+
+
+if __name__ == "__main__":
+    main()
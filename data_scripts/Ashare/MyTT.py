@@ -2,6 +2,7 @@
 # V2.1 2021-6-6 新增 BARSLAST函数
 # V2.2 2021-6-8 新增 SLOPE,FORCAST线性回归，和回归预测函数
 # V2.3 2025-8-2 改进 SAM函数,速度提升15倍
+# V2.4 2026-10-19 新增 SLOPE_S,FORCAST_S,BARSLAST_S,LAST_S 序列版本(O(n)向量化,支持二维面板)
   
 import numpy as np; import pandas as pd
 
@@ -51,6 +52,20 @@ def SLOPE(S,N,RS=False):               #返S序列N周期回线性回归斜率 (
     if RS: return Y[1]-Y[0],Y
     return Y[1]-Y[0]
 
+def _RSUM(S,N):                         #O(n)滚动求和(pandas带补偿的滚动和),二维面板按列计算,窗口不满或含nan为nan
+    S=np.asarray(S,dtype=float)
+    if N<=0: return np.zeros_like(S)
+    return pd.DataFrame(S.reshape(len(S),-1)).rolling(N).sum().values.reshape(S.shape)
+
+def _ROLLING_OLS(S,N):                  #N周期滚动线性回归(x=0..N-1),用滚动和求斜率K和截距B序列
+    S=np.asarray(S,dtype=float);  T=np.arange(len(S),dtype=float).reshape(-1,*[1]*(S.ndim-1))
+    SY=_RSUM(S,N);  SXY=_RSUM(S*T,N)-(T-N+1)*SY;  SX=N*(N-1)/2;  SXX=(N-1)*N*(2*N-1)/6
+    K=(N*SXY-SX*SY)/(N*SXX-SX*SX)
+    return K, (SY-K*SX)/N
+
+def SLOPE_S(S,N):                       #SLOPE的序列版本: 每个周期的N周期线性回归斜率
+    return _ROLLING_OLS(S,N)[0]
+
   
 #------------------   1级：应用层函数(通过0级核心函数实现） ----------------------------------
 def COUNT(S_BOOL, N):                  # COUNT(CLOSE>O, N):  最近N天满足S_BOO的天数  True的天数
@@ -69,12 +84,27 @@ def EXIST(S_BOOL, N=5):                # EXIST(CLOSE>3010, N=5)  n日内是否
     return IF(R>0, True ,False)
 
 def BARSLAST(S_BOOL):                  #上一次条件成立到当前的周期  
-    M=np.argwhere(S_BOOL);             # BARSLAST(CLOSE/REF(CLOSE)>=1.1) 上一次涨停到今天的天数
+    M=np.flatnonzero(S_BOOL);          # BARSLAST(CLOSE/REF(CLOSE)>=1.1) 上一次涨停到今天的天数
     return len(S_BOOL)-int(M[-1])-1  if M.size>0 else -1
 
+def BARSLAST_S(S_BOOL):                #BARSLAST的序列版本: 每个周期距上一次条件成立的周期数,从未成立为nan
+    S=np.asarray(S_BOOL,dtype=bool);  T=np.arange(len(S)).reshape(-1,*[1]*(S.ndim-1))
+    M=np.maximum.accumulate(np.where(S,T,-1),axis=0)
+    return np.where(M>=0,T-M,np.nan)
+
+def LAST_S(S_BOOL,A,B):                #LAST的序列版本: 每个周期前A日到前B日是否一直满足(与LAST相同的A-B个周期)
+    if A<B: A=B
+    R=_RSUM(np.asarray(S_BOOL,dtype=bool),A-B)==(A-B);  L=np.zeros_like(R)
+    L[B:]=R[:len(R)-B]
+    return L
+
 def FORCAST(S,N):                      #返S序列N周期回线性回归后的预测值
     K,Y=SLOPE(S,N,RS=True)
     return Y[-1]+K
+
+def FORCAST_S(S,N):                    #FORCAST的序列版本: 每个周期用最近N周期回归预测下一周期的值
+    K,B=_ROLLING_OLS(S,N)
+    return B+K*N
   
 def CROSS(S1,S2):                      #判断穿越 CROSS(MA(C,5),MA(C,10))               
     CROSS_BOOL=IF(S1>S2, True ,False)   
@@ -0,0 +1,91 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/data
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from nautilus_trader.model import QuoteTick
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+from research.catalog_reader import index_entries
+from research.catalog_reader import quote_arrays
+from research.tick_archive import archive_catalog
+from research.tick_archive import read_arrays
+from research.tick_archive import read_batches
+
+ALL_COLUMNS = ("bid_price", "ask_price", "bid_size", "ask_size", "ts_event", "ts_init")
+
+
+def timed(function) -> tuple[object, float]:
+    started = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive catalog quote ticks and compare with Parquet")
+    parser.add_argument("--catalog", default="catalog", help="Catalog directory, relative to the project root")
+    parser.add_argument("--instrument-id", default=None, help="Defaults to the catalog's first instrument")
+    parser.add_argument("--output", default="archive", help="Archive directory, relative to the project root")
+    args = parser.parse_args()
+
+    print("=== Quote Tick Archive ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / args.catalog
+
+    if not catalog_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        print("Please run 'python data_scripts/setup_sample_data.py' first.")
+        return
+
+    catalog = ParquetDataCatalog(str(catalog_path))
+    instrument_id = args.instrument_id or str(catalog.instruments()[0].id)
+    output = project_root / args.output
+    output.mkdir(exist_ok=True)
+    archive_path = output / f"{instrument_id.replace('/', '')}.ntqa"
+
+    # 1. Write the archive
+    footer, seconds = timed(lambda: archive_catalog(catalog_path, instrument_id, archive_path))
+    print(f"Archived {footer['rows']} ticks of {instrument_id} in {len(footer['blocks'])} blocks ({seconds:.2f}s)")
+    print(f"Archive: {archive_path}")
+
+    # 2. Size
+    parquet_bytes = index_entries(catalog_path, QuoteTick, instrument_id).drop_duplicates("file")["size"].sum()
+    archive_bytes = os.path.getsize(archive_path)
+    print("\n=== SIZE ===")
+    print(f"Parquet: {parquet_bytes:,} bytes ({parquet_bytes / footer['rows']:.2f} bytes/tick)")
+    print(f"Archive: {archive_bytes:,} bytes ({archive_bytes / footer['rows']:.2f} bytes/tick)")
+    print(f"Ratio:   {parquet_bytes / archive_bytes:.1f}x")
+
+    # 3. Decode speed
+    _, parquet_arrays_s = timed(lambda: quote_arrays(catalog_path, instrument_id, columns=ALL_COLUMNS))
+    _, archive_arrays_s = timed(lambda: read_arrays(archive_path))
+    _, parquet_objects_s = timed(lambda: catalog.quote_ticks(instrument_ids=[instrument_id]))
+    _, archive_objects_s = timed(lambda: [
+        tick
+        for batch in read_batches(archive_path)
+        for tick in QuoteTick.from_pyo3_list(ArrowSerializer.deserialize(QuoteTick, batch))
+    ])
+    report = pd.DataFrame(
+        {
+            "Parquet": [parquet_arrays_s, parquet_objects_s],
+            "Archive": [archive_arrays_s, archive_objects_s],
+        },
+        index=["NumPy arrays", "QuoteTick objects"],
+    )
+    report["Speedup"] = report["Parquet"] / report["Archive"]
+    print("\n=== DECODE SECONDS ===")
+    print(report.to_string(float_format=lambda x: f"{x:.4f}"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# Source: https://nautilustrader.io/docs/latest/concepts/data
+
+import argparse
+import ctypes
+import errno
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from research.catalog_reader import timestamp_filename
+from research.catalog_reader import update_index
+
+# Compacted directories are built here before being swapped into data/
+STAGING_DIR = ".compact"
+
+
+def scan(files: list[Path]) -> tuple[int, float]:
+    """Read every file in full and return (rows, seconds)."""
+    started = time.perf_counter()
+    rows = sum(pq.read_table(file).num_rows for file in files)
+    return rows, time.perf_counter() - started
+
+
+def needs_compaction(files: list[Path], row_group_size: int) -> bool:
+    """More than one file, or row groups smaller than the target."""
+    if len(files) != 1:
+        return len(files) > 1
+    metadata = pq.read_metadata(files[0])
+    return metadata.num_row_groups > max(1, -(-metadata.num_rows // row_group_size))
+
+
+# renameat2(2) arguments for an atomic exchange of two paths (Linux 3.15+, glibc 2.28+)
+AT_FDCWD = -100
+RENAME_EXCHANGE = 2
+
+
+def is_sorted(ts_init: np.ndarray) -> bool:
+    return bool(np.all(ts_init[1:] >= ts_init[:-1]))
+
+
+def swap_directories(a: Path, b: Path) -> None:
+    """
+    Exchange two directories.
+
+    Uses `renameat2(RENAME_EXCHANGE)`, which swaps them in one atomic step. Where
+    it is unavailable (other platforms, or file systems that reject the flag),
+    falls back to three renames through a temporary name, undoing the first if
+    the second fails so `a` is never left missing.
+    """
+    try:
+        renameat2 = ctypes.CDLL(None, use_errno=True).renameat2
+    except (OSError, AttributeError):
+        renameat2 = None
+    if renameat2 is not None:
+        renameat2.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+        if renameat2(AT_FDCWD, os.fsencode(a), AT_FDCWD, os.fsencode(b), RENAME_EXCHANGE) == 0:
+            return
+        error = ctypes.get_errno()
+        if error not in (errno.EINVAL, errno.ENOSYS, errno.ENOTSUP):
+            raise OSError(error, os.strerror(error), str(a), None, str(b))
+
+    temp = b.with_name(f"{b.name}.swap")
+    os.rename(a, temp)
+    try:
+        os.rename(b, a)
+    except OSError:
+        os.rename(temp, a)
+        raise
+    os.rename(temp, b)
+
+
+def compact_directory(
+    directory: Path,
+    staging: Path,
+    row_group_size: int,
+    max_rows_per_file: int | None,
+    verify: bool,
+) -> dict:
+    """
+    Rewrite one data/<type>/<identifier> directory into time-sorted files.
+
+    The new files are written to `staging` and, after optional verification,
+    exchanged with the directory in one atomic step, so readers see either the
+    old or the new set of files; open handles on old files stay valid until they
+    are closed. A failed swap leaves the original directory in place.
+    """
+    files = sorted(directory.glob("*.parquet"))
+    groups_before = sum(pq.read_metadata(file).num_row_groups for file in files)
+    _, seconds_before = scan(files)
+
+    table = pa.concat_tables([pq.read_table(file) for file in files], promote_options="default")
+    ts_init = table.column("ts_init").to_numpy()
+    was_sorted = is_sorted(ts_init)
+    if not was_sorted:
+        order = np.argsort(ts_init, kind="stable")
+        table = table.take(order)
+        ts_init = ts_init[order]
+
+    if staging.exists():
+        shutil.rmtree(staging)
+    staging.mkdir(parents=True)
+
+    step = max_rows_per_file or max(table.num_rows, 1)
+    for offset in range(0, table.num_rows, step):
+        part = table.slice(offset, step)
+        first, last = int(ts_init[offset]), int(ts_init[offset + part.num_rows - 1])
+        path = staging / f"{timestamp_filename(first)}_{timestamp_filename(last)}.parquet"
+        pq.write_table(part, path, row_group_size=row_group_size)
+
+    if verify:
+        written = pa.concat_tables([pq.read_table(file) for file in sorted(staging.glob("*.parquet"))])
+        if not is_sorted(written.column("ts_init").to_numpy()):
+            raise RuntimeError(f"Compacted files for {directory} are not sorted by ts_init")
+        if not written.equals(table):
+            raise RuntimeError(f"Compacted files for {directory} do not match the original rows")
+
+    # `staging` holds the old files afterwards
+    swap_directories(directory, staging)
+    shutil.rmtree(staging)
+
+    new_files = sorted(directory.glob("*.parquet"))
+    rows_after, seconds_after = scan(new_files)
+    return {
+        "data_type": directory.parent.name,
+        "identifier": directory.name,
+        "rows": rows_after,
+        "files_before": len(files),
+        "files_after": len(new_files),
+        "row_groups_before": groups_before,
+        "row_groups_after": sum(pq.read_metadata(file).num_row_groups for file in new_files),
+        "was_sorted": was_sorted,
+        "scan_before_s": seconds_before,
+        "scan_after_s": seconds_after,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compact a ParquetDataCatalog into time-sorted files")
+    parser.add_argument("catalog", nargs="?", default="catalog", help="Catalog directory, relative to the project root")
+    parser.add_argument("--row-group-size", type=int, default=100_000)
+    parser.add_argument("--max-rows-per-file", type=int, default=None, help="Split each instrument into files of at most N rows")
+    parser.add_argument("--data-type", default=None, help="Only compact this data directory, e.g. quote_tick or bar")
+    parser.add_argument("--verify", action="store_true", help="Check sort order and row equality before swapping files in")
+    parser.add_argument("--force", action="store_true", help="Rewrite directories that are already compact")
+    args = parser.parse_args()
+
+    print("=== NautilusTrader Catalog Compaction ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / args.catalog
+    data_path = catalog_path / "data"
+
+    if not data_path.exists():
+        print(f"Error: Catalog not found at {catalog_path}")
+        return
+
+    directories = sorted(
+        directory
+        for directory in data_path.glob(f"{args.data_type or '*'}/*")
+        if directory.is_dir()
+    )
+
+    results = []
+    for directory in directories:
+        files = sorted(directory.glob("*.parquet"))
+        if not files or not (args.force or needs_compaction(files, args.row_group_size)):
+            continue
+        staging = catalog_path / STAGING_DIR / directory.parent.name / directory.name
+        results.append(compact_directory(directory, staging, args.row_group_size, args.max_rows_per_file, args.verify))
+        print(f"Compacted {directory.relative_to(data_path)}")
+
+    shutil.rmtree(catalog_path / STAGING_DIR, ignore_errors=True)
+
+    if not results:
+        print("Nothing to compact.")
+        return
+
+    # Keep the research.catalog_reader row-group index in step with the new files
+    update_index(catalog_path)
+
+    report = pd.DataFrame(results)
+    print("\n=== COMPACTION REPORT ===")
+    print(report.to_string(index=False, float_format=lambda x: f"{x:.4f}"))
+
+    print("\n=== TOTAL ===")
+    rows = report["rows"].sum()
+    print(f"Files: {report['files_before'].sum()} -> {report['files_after'].sum()}")
+    print(f"Row groups: {report['row_groups_before'].sum()} -> {report['row_groups_after'].sum()}")
+    print(f"Scan throughput: {rows / report['scan_before_s'].sum():,.0f} -> {rows / report['scan_after_s'].sum():,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ from datetime import datetime, timedelta
 
 # Add Ashare directory to path
 sys.path.append(str(Path(__file__).parent / "Ashare"))
+sys.path.append(str(Path(__file__).parent.parent))
 
 try:
     from Ashare import get_price
@@ -29,6 +30,8 @@ from nautilus_trader.model.identifiers import Symbol
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers import BarDataWrangler
 
+from research.catalog_reader import update_index
+
 
 def create_ashare_instrument(symbol: Symbol, venue_name: str) -> Equity:
     """Create a Nautilus Equity instrument for A-share stock."""
@@ -121,6 +124,7 @@ def main():
                 # Write to Catalog
                 catalog.write_data([instrument])
                 catalog.write_data(bars)
+                update_index(catalog_path, Bar, str(bar_type))
                 print(f"Written {len(bars)} bars to catalog.")
                 
         except Exception as e:
@@ -1,14 +1,20 @@
 # Source: https://nautilustrader.io/docs/latest/getting_started/quickstart
 
 import os
+import sys
 import urllib.request
 from pathlib import Path
 
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
 from nautilus_trader.persistence.catalog import ParquetDataCatalog
 from nautilus_trader.persistence.wranglers import QuoteTickDataWrangler
 from nautilus_trader.test_kit.providers import CSVTickDataLoader
 from nautilus_trader.test_kit.providers import TestInstrumentProvider
 
+from research.catalog_reader import update_index
+
 
 def main():
     # Create catalog directory in project root (parent of this script)
@@ -65,6 +71,9 @@ def main():
         catalog.write_data(ticks)
         print("Tick data written to catalog")
 
+        # Row-group time ranges for research.catalog_reader range queries
+        update_index(catalog_path)
+
         # Verify what was written
         print("\nVerifying catalog contents...")
         test_catalog = ParquetDataCatalog(str(catalog_path))
@@ -0,0 +1,59 @@
+# Source: https://github.com/mpquant/MyTT
+# Source: https://nautilustrader.io/docs/latest/tutorials/data_catalog
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from research.feature_store import DEFAULT_FEATURES
+from research.feature_store import INDICATORS
+from research.feature_store import lookback
+from research.feature_store import read_features
+from research.feature_store import update_features
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute or refresh MyTT indicator features for a bar catalog")
+    parser.add_argument("--catalog", default="catalog_ashare", help="Catalog directory, relative to the project root")
+    parser.add_argument(
+        "--features",
+        nargs="+",
+        default=list(DEFAULT_FEATURES),
+        help=f"Indicator specs such as MACD or RSI(14), from {', '.join(INDICATORS)}",
+    )
+    args = parser.parse_args()
+
+    print("=== MyTT Feature Store Update ===")
+
+    project_root = Path(__file__).parent.parent
+    catalog_path = project_root / args.catalog
+    bar_dir = catalog_path / "data" / "bar"
+
+    if not bar_dir.exists():
+        print(f"Error: No bars found in {catalog_path}")
+        print("Please run 'python data_scripts/setup_ashare_data.py' first.")
+        return
+
+    specs = tuple(args.features)
+    bar_types = sorted(directory.name for directory in bar_dir.iterdir() if directory.is_dir())
+    print(f"Features: {', '.join(specs)} (context {lookback(specs)} bars)")
+
+    started = time.perf_counter()
+    total = 0
+    for bar_type in bar_types:
+        added = update_features(catalog_path, bar_type, specs)
+        total += added
+        print(f"{bar_type}: {added} new bars")
+    print(f"\nUpdated {len(bar_types)} bar types, {total} new bars in {time.perf_counter() - started:.2f}s")
+
+    if bar_types:
+        print(f"\n=== LATEST FEATURES ({bar_types[0]}) ===")
+        print(read_features(catalog_path, bar_types[0]).tail(3).T.to_string())
+
+
+if __name__ == "__main__":
+    main()
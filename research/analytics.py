@@ -0,0 +1,352 @@
+"""
+Vectorized performance analytics from backtest reports.
+
+The trader reports (`generate_account_report`, `generate_positions_report`,
+`generate_order_fills_report`) hold money as strings such as "-11.00 CNY".
+The reports of every run in a sweep are stacked into one frame with a `run`
+column and parsed into typed numeric columns once. The remaining functions work
+on NumPy arrays covering all runs at once: equity curves are aligned into an
+(n_runs, n_times) panel so drawdowns, rolling Sharpe/Sortino, exposure and
+attribution are computed without per-run loops.
+
+A CASH account's balance drops by the full cost of every purchase and ignores
+what the purchases are worth, so for cash accounts `summarise` takes `marks`
+(e.g. bar closes) and uses the balance plus the market value of the open
+holdings as equity.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def to_float(values: pd.Series) -> pd.Series:
+    """Convert Money/Quantity strings ("1,234.50 USD", "100") to float64."""
+    if pd.api.types.is_numeric_dtype(values):
+        return values.astype(np.float64)
+    return (
+        values.astype(str)
+        .str.split(" ", n=1)
+        .str[0]
+        .str.replace(",", "", regex=False)
+        .astype(np.float64)
+    )
+
+
+def to_ns(values) -> np.ndarray:
+    """Convert timestamps (DatetimeIndex, datetime Series or objects) to int64 nanoseconds."""
+    ts = pd.to_datetime(pd.Series(values), utc=True)
+    return ts.to_numpy(dtype="datetime64[ns]").astype(np.int64)
+
+
+def stack_reports(reports: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate one kind of report from many runs, tagging each row with its `run` number."""
+    runs = [n for n, report in enumerate(reports) if not report.empty]
+    if not runs:
+        return pd.DataFrame(columns=["run"])
+    stacked = pd.concat([reports[n] for n in runs])
+    stacked["run"] = np.repeat(runs, [len(reports[n]) for n in runs])
+    return stacked
+
+
+def _runs(report: pd.DataFrame) -> np.ndarray:
+    if "run" in report:
+        return report["run"].to_numpy(dtype=np.int64)
+    return np.zeros(len(report), dtype=np.int64)
+
+
+def _sum_commissions(values: pd.Series) -> np.ndarray:
+    """Sum the list of commission strings held in each report row."""
+    values = values.reset_index(drop=True)
+    exploded = values.explode().dropna()
+    if exploded.empty:
+        return np.zeros(len(values))
+    return to_float(exploded).groupby(level=0).sum().reindex(values.index, fill_value=0.0).to_numpy()
+
+
+def parse_account_report(account: pd.DataFrame, currency: str | None = None) -> pd.DataFrame:
+    """Typed account balances: ts (int64 ns), total, free, locked (float64)."""
+    if currency is not None:
+        account = account[account["currency"] == currency]
+    return pd.DataFrame({
+        "run": _runs(account),
+        "ts": to_ns(account.index),
+        "total": to_float(account["total"]).to_numpy(),
+        "free": to_float(account["free"]).to_numpy(),
+        "locked": to_float(account["locked"]).to_numpy(),
+        "currency": account["currency"].to_numpy(),
+    })
+
+
+def parse_positions_report(positions: pd.DataFrame) -> pd.DataFrame:
+    """Typed positions: timestamps as int64 ns (-1 while open), money and quantities as float64."""
+    if positions.empty:
+        return pd.DataFrame(columns=[
+            "run", "instrument_id", "strategy_id", "entry", "ts_opened", "ts_closed",
+            "peak_qty", "avg_px_open", "avg_px_close", "realized_pnl", "realized_return", "commissions",
+        ])
+    ts_closed = positions["ts_closed"]
+    closed = ts_closed.notna().to_numpy()
+    return pd.DataFrame({
+        "run": _runs(positions),
+        "instrument_id": positions["instrument_id"].astype(str).to_numpy(),
+        "strategy_id": positions["strategy_id"].astype(str).to_numpy(),
+        "entry": positions["entry"].astype(str).to_numpy(),
+        "ts_opened": to_ns(positions["ts_opened"]),
+        "ts_closed": np.where(closed, to_ns(ts_closed.where(closed, 0)), -1),
+        "peak_qty": to_float(positions["peak_qty"]).to_numpy(),
+        "avg_px_open": positions["avg_px_open"].astype(np.float64).to_numpy(),
+        "avg_px_close": positions["avg_px_close"].astype(np.float64).fillna(0.0).to_numpy(),
+        "realized_pnl": to_float(positions["realized_pnl"]).to_numpy(),
+        "realized_return": positions["realized_return"].astype(np.float64).to_numpy(),
+        "commissions": _sum_commissions(positions["commissions"]),
+    })
+
+
+def parse_fills_report(fills: pd.DataFrame) -> pd.DataFrame:
+    """Typed order fills: side (+1/-1), quantity, fill price, notional and commissions as float64."""
+    if fills.empty:
+        return pd.DataFrame(columns=["run", "instrument_id", "ts", "side", "qty", "px", "notional", "commissions"])
+    qty = to_float(fills["filled_qty"]).to_numpy()
+    px = fills["avg_px"].astype(np.float64).to_numpy()
+    side = np.where(fills["side"].astype(str).to_numpy() == "BUY", 1.0, -1.0)
+    return pd.DataFrame({
+        "run": _runs(fills),
+        "instrument_id": fills["instrument_id"].astype(str).to_numpy(),
+        "ts": to_ns(fills["ts_last"]),
+        "side": side,
+        "qty": qty,
+        "px": px,
+        "notional": qty * px,
+        "commissions": _sum_commissions(fills["commissions"]),
+    })
+
+
+def equity_panel(
+    accounts: list[pd.DataFrame | list[pd.DataFrame]],
+    freq: str = "1D",
+    currency: str | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Align the account balances of many runs on a common regular time grid.
+
+    Each entry of `accounts` is one run's account report, or a list of reports
+    (one per venue) whose balances are added together. Returns the grid as
+    int64 nanoseconds and an (n_runs, n_times) float64 equity panel. Before a
+    run's first balance the panel holds that first balance. Multi-currency
+    accounts should pass `currency` so balances are not mixed.
+    """
+    parts = []
+    owners = []
+    for n, account in enumerate(accounts):
+        for report in account if isinstance(account, list) else [account]:
+            if not report.empty:
+                parts.append(report)
+                owners.append(n)
+
+    equity = np.zeros((len(accounts), 0))
+    if not parts:
+        return np.empty(0, dtype=np.int64), equity
+
+    # Parse every account report of the sweep in one pass
+    parsed = parse_account_report(stack_reports(parts), currency)
+    if parsed.empty:
+        return np.empty(0, dtype=np.int64), equity
+    part = parsed["run"].to_numpy()
+    ts = parsed["ts"].to_numpy()
+    total = parsed["total"].to_numpy()
+
+    step = pd.Timedelta(freq).value
+    grid = np.arange(ts.min() // step * step, ts.max() + step, step, dtype=np.int64)
+
+    equity = np.zeros((len(accounts), len(grid)))
+    bounds = np.searchsorted(part, np.arange(len(parts) + 1))
+    for k in range(len(parts)):
+        lo, hi = bounds[k], bounds[k + 1]
+        if lo == hi:
+            continue
+        # Last balance at or before the end of each grid period
+        idx = np.searchsorted(ts[lo:hi], grid + step - 1, side="right") - 1
+        equity[owners[k]] += total[lo:hi][np.maximum(idx, 0)]
+    return grid, equity
+
+
+def holdings_value(fills: pd.DataFrame, marks: dict, n_runs: int, ts: np.ndarray) -> np.ndarray:
+    """
+    Market value of each run's net holdings at the times `ts` (int64 ns), shape (n_runs, n_times).
+
+    `fills` is a parsed fills report. `marks` maps every traded instrument id
+    to sorted (ts, price) arrays, such as bar `ts_init` and `close`; holdings
+    are valued at the last price at or before each time (the first price
+    before any).
+    """
+    value = np.zeros((n_runs, len(ts)))
+    if fills.empty or not len(ts):
+        return value
+    runs = fills["run"].to_numpy(dtype=np.int64)
+    instruments = fills["instrument_id"].to_numpy()
+    fill_ts = fills["ts"].to_numpy(dtype=np.int64)
+    signed = (fills["side"] * fills["qty"]).to_numpy(dtype=np.float64)
+    for instrument_id in np.unique(instruments):
+        if instrument_id not in marks:
+            raise ValueError(f"No marks for {instrument_id}")
+        mark_ts, mark_px = marks[instrument_id]
+        price = np.asarray(mark_px, dtype=np.float64)[np.maximum(np.searchsorted(mark_ts, ts, side="right") - 1, 0)]
+        mask = instruments == instrument_id
+        for run in np.unique(runs[mask]):
+            sel = np.flatnonzero(mask & (runs == run))
+            sel = sel[np.argsort(fill_ts[sel], kind="stable")]
+            net = np.cumsum(signed[sel])
+            idx = np.searchsorted(fill_ts[sel], ts, side="right") - 1
+            value[run] += np.where(idx >= 0, net[np.maximum(idx, 0)], 0.0) * price
+    return value
+
+
+def returns(equity: np.ndarray) -> np.ndarray:
+    """Simple period returns of an (n_runs, n_times) equity panel, zero for the first period."""
+    prev = np.concatenate([equity[:, :1], equity[:, :-1]], axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(prev != 0.0, equity / prev - 1.0, 0.0)
+
+
+def drawdowns(equity: np.ndarray) -> np.ndarray:
+    """Drawdown from the running peak (<= 0) for every run and period."""
+    peak = np.maximum.accumulate(equity, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(peak > 0.0, equity / peak - 1.0, 0.0)
+
+
+def _rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums along the time axis via cumulative sums; NaN until the window fills."""
+    out = np.full(values.shape, np.nan)
+    if values.shape[1] < window:
+        return out
+    csum = np.cumsum(values, axis=1)
+    out[:, window - 1] = csum[:, window - 1]
+    out[:, window:] = csum[:, window:] - csum[:, :-window]
+    return out
+
+
+def rolling_sharpe(rets: np.ndarray, window: int, periods_per_year: int = 252) -> np.ndarray:
+    """Annualised trailing-window Sharpe ratio (zero risk-free rate)."""
+    mean = _rolling_sum(rets, window) / window
+    var = _rolling_sum(rets * rets, window) / window - mean * mean
+    std = np.sqrt(np.maximum(var, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std > 0.0, mean / std * np.sqrt(periods_per_year), np.nan)
+
+
+def rolling_sortino(rets: np.ndarray, window: int, periods_per_year: int = 252) -> np.ndarray:
+    """Annualised trailing-window Sortino ratio (downside deviation below zero)."""
+    mean = _rolling_sum(rets, window) / window
+    downside = np.minimum(rets, 0.0)
+    dev = np.sqrt(_rolling_sum(downside * downside, window) / window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(dev > 0.0, mean / dev * np.sqrt(periods_per_year), np.nan)
+
+
+def attribution(positions: pd.DataFrame, n_runs: int) -> pd.DataFrame:
+    """Realized PnL per run (rows) and instrument (columns) from a parsed positions report."""
+    if positions.empty:
+        return pd.DataFrame(index=range(n_runs))
+    runs = positions["run"].to_numpy(dtype=np.int64)
+    names, codes = np.unique(positions["instrument_id"].to_numpy(), return_inverse=True)
+    flat = np.bincount(
+        runs * len(names) + codes,
+        weights=positions["realized_pnl"].to_numpy(dtype=np.float64),
+        minlength=n_runs * len(names),
+    )
+    return pd.DataFrame(flat.reshape(n_runs, len(names)), columns=names)
+
+
+def exposure(positions: pd.DataFrame, n_runs: int, grid: np.ndarray) -> np.ndarray:
+    """
+    Number of open positions per run and grid period, shape (n_runs, n_times).
+
+    Positions still open at the end of a run count as open until the last period.
+    """
+    delta = np.zeros((n_runs, len(grid) + 1))
+    if not positions.empty and len(grid):
+        runs = positions["run"].to_numpy(dtype=np.int64)
+        closed = positions["ts_closed"].to_numpy(dtype=np.int64)
+        closed = np.where(closed < 0, np.iinfo(np.int64).max, closed)
+        start = np.searchsorted(grid, positions["ts_opened"].to_numpy(dtype=np.int64), side="left")
+        stop = np.searchsorted(grid, closed, side="left")
+        np.add.at(delta, (runs, start), 1.0)
+        np.add.at(delta, (runs, stop), -1.0)
+    return np.cumsum(delta[:, :-1], axis=1)
+
+
+def turnover(fills: pd.DataFrame, equity: np.ndarray) -> np.ndarray:
+    """Traded notional of each run divided by its average equity."""
+    n_runs = equity.shape[0]
+    traded = np.zeros(n_runs)
+    if not fills.empty:
+        traded = np.bincount(
+            fills["run"].to_numpy(dtype=np.int64),
+            weights=fills["notional"].to_numpy(dtype=np.float64),
+            minlength=n_runs,
+        )
+    avg_equity = equity.mean(axis=1) if equity.shape[1] else np.zeros(n_runs)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(avg_equity > 0.0, traded / avg_equity, np.nan)
+
+
+def summarise(
+    accounts: list[pd.DataFrame | list[pd.DataFrame]],
+    positions: list[pd.DataFrame],
+    fills: list[pd.DataFrame],
+    freq: str = "1D",
+    window: int = 20,
+    periods_per_year: int = 252,
+    currency: str | None = None,
+    marks: dict | None = None,
+) -> pd.DataFrame:
+    """
+    One row of headline statistics per run.
+
+    `accounts`, `positions` and `fills` are the raw trader reports of each run
+    (in the same order); every report kind is parsed once for the whole sweep.
+    CASH accounts must pass `marks` (see `holdings_value`) so equity includes
+    the value of open holdings; margin account balances are used as they are.
+    """
+    n_runs = len(accounts)
+    grid, equity = equity_panel(accounts, freq=freq, currency=currency)
+    parsed_positions = parse_positions_report(stack_reports(positions))
+    parsed_fills = parse_fills_report(stack_reports(fills))
+    if marks is not None:
+        equity = equity + holdings_value(parsed_fills, marks, n_runs, grid + pd.Timedelta(freq).value - 1)
+
+    rets = returns(equity)
+    nan = np.full(n_runs, np.nan)
+    if rets.shape[1]:
+        mean = rets.mean(axis=1)
+        std = rets.std(axis=1)
+        downside = np.sqrt((np.minimum(rets, 0.0) ** 2).mean(axis=1))
+        scale = np.sqrt(periods_per_year)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0.0, mean / std * scale, np.nan)
+            sortino = np.where(downside > 0.0, mean / downside * scale, np.nan)
+            total_return = np.where(equity[:, 0] > 0.0, equity[:, -1] / equity[:, 0] - 1.0, np.nan)
+        max_drawdown = drawdowns(equity).min(axis=1)
+        last_rolling_sharpe = rolling_sharpe(rets, window, periods_per_year)[:, -1]
+        in_market = (exposure(parsed_positions, n_runs, grid) > 0).mean(axis=1)
+    else:
+        sharpe = sortino = total_return = max_drawdown = last_rolling_sharpe = in_market = nan
+
+    runs = parsed_positions["run"].to_numpy(dtype=np.int64)
+    pnl = parsed_positions["realized_pnl"].to_numpy(dtype=np.float64)
+    n_positions = np.bincount(runs, minlength=n_runs)
+    wins = np.bincount(runs, weights=pnl > 0.0, minlength=n_runs)
+
+    return pd.DataFrame({
+        "total_pnl": np.bincount(runs, weights=pnl, minlength=n_runs),
+        "total_return": total_return,
+        "sharpe": sharpe,
+        "sortino": sortino,
+        "max_drawdown": max_drawdown,
+        "last_rolling_sharpe": last_rolling_sharpe,
+        "exposure": in_market,
+        "turnover": turnover(parsed_fills, equity),
+        "positions": n_positions,
+        "win_rate": np.where(n_positions > 0, wins / np.maximum(n_positions, 1), np.nan),
+    })
@@ -0,0 +1,603 @@
+"""
+Live A-share minute bars polled from the Tencent kline endpoint behind `Ashare`.
+
+`Ashare.get_price` is a blocking one-shot call that returns `count` bars of
+history. `MinuteBarPoller` instead polls many codes concurrently on asyncio just
+after every minute boundary and asks for the last two rows only: the minute
+that just closed and the one in progress (more after a gap, never the history
+it has already seen). Rows are bars stamped with their close time, and a row
+counts as completed once that time has passed. Codes whose bar is not there yet
+are polled again every `retry_interval` until `deadline` seconds after the
+close, which bounds how late a bar can be published.
+
+`AshareDataClient` wraps the poller as a Nautilus live data client publishing
+`{instrument}-1-MINUTE-LAST-EXTERNAL` bars, so a `TradingNode` with
+`BarSandboxExecutionClient` (the sandbox execution client, filling on those
+bars) paper-trades on them. `BarLatency` records the delay from each
+bar's close to its bar callback.
+
+For monitoring a universe, `QuoteSnapshotter` reads the latest quote of every
+code from the multi-symbol `qt` endpoint, a few hundred codes per request
+instead of one kline request per code (`Ashare.get_price_min_tx` patches the
+same `qt` price into its last close), and parses all lines into arrays at once.
+
+`stand_in_server` serves made-up minute bars and quotes in the same formats
+from localhost for trying all of this without the real feeds.
+"""
+
+import asyncio
+import json
+import math
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from operator import itemgetter
+from urllib.parse import parse_qs
+from urllib.parse import urlparse
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.adapters.sandbox.execution import SandboxExecutionClient
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.common.component import LiveClock
+from nautilus_trader.common.component import MessageBus
+from nautilus_trader.common.config import ActorConfig
+from nautilus_trader.common.providers import InstrumentProvider
+from nautilus_trader.config import LiveDataClientConfig
+from nautilus_trader.core.nautilus_pyo3 import HttpClient
+from nautilus_trader.core.nautilus_pyo3 import HttpMethod
+from nautilus_trader.data.messages import SubscribeBars
+from nautilus_trader.data.messages import UnsubscribeBars
+from nautilus_trader.live.data_client import LiveMarketDataClient
+from nautilus_trader.live.factories import LiveDataClientFactory
+from nautilus_trader.model.currencies import CNY
+from nautilus_trader.model.data import Bar
+from nautilus_trader.model.data import BarType
+from nautilus_trader.model.identifiers import ClientId
+from nautilus_trader.model.identifiers import InstrumentId
+from nautilus_trader.model.instruments import Equity
+from nautilus_trader.model.objects import Price
+from nautilus_trader.model.objects import Quantity
+
+MKLINE_PATH = "/appstock/app/kline/mkline"
+TENCENT_MKLINE_URL = "http://ifzq.gtimg.cn" + MKLINE_PATH
+
+# Real-time quotes of many codes per request: `{url}sh600519,sz000001,...`
+QUOTE_PATH = "/q="
+TENCENT_QUOTE_URL = "http://qt.gtimg.cn" + QUOTE_PATH
+
+# Numeric `~`-separated fields of a quote line, by position
+QUOTE_FIELDS = {
+    "price": 3,
+    "prev_close": 4,
+    "open": 5,
+    "volume": 6,  # Lots of 100 shares
+    "bid": 9,
+    "bid_size": 10,
+    "ask": 19,
+    "ask_size": 20,
+    "high": 33,
+    "low": 34,
+}
+QUOTE_TIME_FIELD = 30  # YYYYMMDDHHMMSS, Beijing time
+
+MINUTE_NS = 60_000_000_000
+
+# Beijing time has no daylight saving
+SHANGHAI_OFFSET_NS = 8 * 3600 * 1_000_000_000
+
+# Close minutes (Beijing time, minutes after midnight) of the continuous trading sessions
+SESSIONS = ((9 * 60 + 31, 11 * 60 + 30), (13 * 60 + 1, 15 * 60))
+
+# Exchange prefix of the Tencent code for each venue
+PREFIXES = {"SSE": "sh", "SZSE": "sz"}
+
+# Row of a minute bar: (close time ns UTC, open, high, low, close, volume)
+MinuteRow = tuple[int, str, str, str, str, str]
+
+
+def ashare_code(instrument_id: InstrumentId | str) -> str:
+    """Tencent code of an instrument, e.g. 600519.SSE -> sh600519."""
+    instrument_id = InstrumentId.from_str(str(instrument_id))
+    return PREFIXES[instrument_id.venue.value] + instrument_id.symbol.value
+
+
+def ashare_instrument(instrument_id: InstrumentId | str) -> Equity:
+    """The equity `data_scripts/setup_ashare_data.py` writes to the catalog for this id."""
+    instrument_id = InstrumentId.from_str(str(instrument_id))
+    return Equity(
+        instrument_id=instrument_id,
+        raw_symbol=instrument_id.symbol,
+        currency=CNY,
+        price_precision=2,
+        price_increment=Price.from_str("0.01"),
+        lot_size=Quantity.from_int(100),
+        ts_event=0,
+        ts_init=0,
+    )
+
+
+def minute_bar_type(instrument_id: InstrumentId | str) -> BarType:
+    return BarType.from_str(f"{instrument_id}-1-MINUTE-LAST-EXTERNAL")
+
+
+def parse_minute_rows(payload: bytes, code: str) -> list[MinuteRow]:
+    """Rows of a Tencent `mkline` response (`time, open, close, high, low, volume, ...`), oldest first."""
+    rows = json.loads(payload)["data"][code]["m1"]
+    parsed = []
+    for row in rows:
+        close_time = datetime.strptime(row[0], "%Y%m%d%H%M").replace(tzinfo=timezone.utc)
+        ts = int(close_time.timestamp()) * 1_000_000_000 - SHANGHAI_OFFSET_NS
+        parsed.append((ts, row[1], row[3], row[4], row[2], row[5]))
+    return parsed
+
+
+def in_session(ts: int) -> bool:
+    """Whether a bar closing at `ts` (ns) belongs to a weekday's continuous trading session."""
+    local = ts + SHANGHAI_OFFSET_NS
+    if (local // (1440 * MINUTE_NS) + 3) % 7 >= 5:  # 1970-01-01 was a Thursday
+        return False
+    minute = local // MINUTE_NS % 1440
+    return any(first <= minute <= last for first, last in SESSIONS)
+
+
+class MinuteBarPoller:
+    """
+    Concurrent once-a-minute polling of the latest minute bars of many codes.
+
+    `on_bars(code, rows)` receives every completed row exactly once, oldest
+    first; `on_error(code, exception)` receives failed requests, which are
+    retried like a missing bar. With `trading_hours_only`, codes are not
+    retried for minutes outside the trading sessions.
+    """
+
+    def __init__(
+        self,
+        on_bars: Callable[[str, list[MinuteRow]], None],
+        on_error: Callable[[str, Exception], None],
+        clock: Callable[[], int] = time.time_ns,
+        base_url: str = TENCENT_MKLINE_URL,
+        poll_delay: float = 1.0,
+        retry_interval: float = 1.0,
+        deadline: float = 10.0,
+        max_concurrency: int = 16,
+        max_count: int = 240,
+        trading_hours_only: bool = True,
+    ):
+        self._on_bars = on_bars
+        self._on_error = on_error
+        self._clock = clock
+        self._base_url = base_url
+        self._poll_delay = poll_delay
+        self._retry_interval = retry_interval
+        self._deadline = deadline
+        self._max_count = max_count
+        self._trading_hours_only = trading_hours_only
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = HttpClient(timeout_secs=max(1, math.ceil(deadline)))
+        self._last: dict[str, int] = {}  # Close time of the last completed row seen per code
+        self.codes: set[str] = set()
+
+    async def add(self, code: str) -> None:
+        """Start polling `code`, taking its bars up to now as already seen."""
+        if code in self.codes:
+            return
+        self.codes.add(code)
+        try:
+            rows = await self._fetch(code, 2)
+        except Exception as e:
+            self._on_error(code, e)
+            return
+        now = self._clock()
+        completed = [row[0] for row in rows if row[0] <= now]
+        if completed:
+            self._last[code] = completed[-1]
+
+    def remove(self, code: str) -> None:
+        self.codes.discard(code)
+        self._last.pop(code, None)
+
+    async def run(self) -> None:
+        """Poll all codes just after every minute boundary, until cancelled."""
+        while True:
+            boundary = (self._clock() // MINUTE_NS + 1) * MINUTE_NS
+            await asyncio.sleep((boundary - self._clock()) / 1e9 + self._poll_delay)
+            await self.cycle(boundary)
+
+    async def cycle(self, boundary: int) -> None:
+        """Poll every code for the bars that closed by `boundary` (ns)."""
+        await asyncio.gather(*(self._poll_until(code, boundary) for code in list(self.codes)))
+
+    async def _poll_until(self, code: str, boundary: int) -> None:
+        expected = not self._trading_hours_only or in_session(boundary)
+        give_up = boundary + int(self._deadline * 1e9)
+        while code in self.codes:
+            await self._poll(code)
+            if self._last.get(code, 0) >= boundary or not expected:
+                return
+            if self._clock() + self._retry_interval * 1e9 > give_up:
+                return  # Published late, if at all, by the next cycle
+            await asyncio.sleep(self._retry_interval)
+
+    async def _poll(self, code: str) -> None:
+        last = self._last.get(code)
+        now = self._clock()
+        # The rows closed since the last one seen, and the one in progress
+        count = 2 if last is None else min(self._max_count, (now - last) // MINUTE_NS + 1)
+        try:
+            rows = await self._fetch(code, max(count, 2))
+        except Exception as e:
+            self._on_error(code, e)
+            return
+        now = self._clock()
+        new = [row for row in rows if (last is None or row[0] > last) and row[0] <= now]
+        if new and code in self.codes:
+            self._last[code] = new[-1][0]
+            self._on_bars(code, new)
+
+    async def _fetch(self, code: str, count: int) -> list[MinuteRow]:
+        async with self._semaphore:
+            response = await self._http.request(HttpMethod.GET, f"{self._base_url}?param={code},m1,,{count}")
+        if response.status != 200:
+            raise ConnectionError(f"HTTP {response.status}")
+        return parse_minute_rows(bytes(response.body), code)
+
+
+def parse_quotes(payload: bytes) -> dict[str, np.ndarray]:
+    """
+    Arrays of the quote lines (`v_sh600519="1~name~600519~price~..."`) in a `qt` response.
+
+    Returns `code`, the numeric `QUOTE_FIELDS` as float64 (NaN where empty)
+    and `ts`, the quote time in UNIX ns. Codes the endpoint does not know are
+    left out.
+    """
+    fields = itemgetter(*QUOTE_FIELDS.values(), QUOTE_TIME_FIELD)
+    codes, rows = [], []
+    for line in payload.decode("gbk", errors="replace").split(";"):
+        name, found, body = line.partition('="')
+        values = body.rstrip('"').split("~")
+        if found and len(values) > QUOTE_TIME_FIELD:
+            codes.append(name.strip()[2:])
+            rows.append(fields(values))
+
+    table = np.array(rows, dtype=str).reshape(len(rows), len(QUOTE_FIELDS) + 1)
+    numbers = table[:, :-1]
+    numbers[numbers == ""] = "nan"
+    numbers = numbers.astype(np.float64)
+    times = pd.to_datetime(table[:, -1], format="%Y%m%d%H%M%S", errors="coerce")
+    arrays = {"code": np.array(codes, dtype=str)}
+    arrays.update({name: numbers[:, i] for i, name in enumerate(QUOTE_FIELDS)})
+    arrays["ts"] = times.values.astype(np.int64) - SHANGHAI_OFFSET_NS
+    return arrays
+
+
+class QuoteSnapshotter:
+    """
+    Latest quotes of a universe of codes, `batch_size` codes per `qt` request.
+
+    The batches of a snapshot are requested concurrently and their responses
+    parsed together. Every snapshot appends its request count, quote count,
+    failed requests and fetch/parse/total milliseconds to `cycles`; codes of a
+    failed request are missing from that snapshot.
+    """
+
+    def __init__(
+        self,
+        codes: list[str],
+        base_url: str = TENCENT_QUOTE_URL,
+        batch_size: int = 300,
+        max_concurrency: int = 8,
+        timeout_secs: int = 5,
+    ):
+        self._base_url = base_url
+        self._batches = [",".join(codes[i:i + batch_size]) for i in range(0, len(codes), batch_size)]
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = HttpClient(timeout_secs=timeout_secs)
+        self.cycles: list[dict] = []
+
+    async def snapshot(self) -> dict[str, np.ndarray]:
+        """Arrays of the latest quotes, as `parse_quotes` returns them."""
+        started = time.perf_counter()
+        responses = await asyncio.gather(*map(self._fetch, self._batches), return_exceptions=True)
+        fetched = time.perf_counter()
+        payloads = [response for response in responses if isinstance(response, bytes)]
+        arrays = parse_quotes(b"".join(payloads))
+        parsed = time.perf_counter()
+        self.cycles.append({
+            "requests": len(self._batches),
+            "quotes": len(arrays["code"]),
+            "errors": len(responses) - len(payloads),
+            "fetch (ms)": (fetched - started) * 1e3,
+            "parse (ms)": (parsed - fetched) * 1e3,
+            "total (ms)": (parsed - started) * 1e3,
+        })
+        return arrays
+
+    async def run(self, interval: float, on_snapshot: Callable[[dict[str, np.ndarray]], None]) -> None:
+        """Take a snapshot at every multiple of `interval` seconds, until cancelled."""
+        while True:
+            await asyncio.sleep(interval - time.time() % interval)
+            on_snapshot(await self.snapshot())
+
+    async def _fetch(self, batch: str) -> bytes:
+        async with self._semaphore:
+            response = await self._http.request(HttpMethod.GET, self._base_url + batch)
+        if response.status != 200:
+            raise ConnectionError(f"HTTP {response.status}")
+        return bytes(response.body)
+
+
+class AshareInstrumentProvider(InstrumentProvider):
+    """Equities for the configured `load_ids`, built like the A-share catalog's."""
+
+    async def load_all_async(self, filters: dict | None = None) -> None:
+        await self.load_ids_async(list(self._load_ids_on_start or []))
+
+    async def load_ids_async(self, instrument_ids: list[InstrumentId], filters: dict | None = None) -> None:
+        for instrument_id in instrument_ids:
+            self.add(ashare_instrument(instrument_id))
+
+    async def load_async(self, instrument_id: InstrumentId, filters: dict | None = None) -> None:
+        self.add(ashare_instrument(instrument_id))
+
+
+class AshareDataClientConfig(LiveDataClientConfig, frozen=True):
+    base_url: str = TENCENT_MKLINE_URL
+    poll_delay_secs: float = 1.0  # Wait after the minute boundary before the first request
+    retry_interval_secs: float = 1.0
+    deadline_secs: float = 10.0  # Stop retrying a code this long after the bar close
+    max_concurrency: int = 16
+    trading_hours_only: bool = True
+
+
+class AshareDataClient(LiveMarketDataClient):
+    """Publishes the minute bars of `MinuteBarPoller` for subscribed `1-MINUTE-LAST-EXTERNAL` bar types."""
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client_id: ClientId,
+        msgbus: MessageBus,
+        cache: Cache,
+        clock: LiveClock,
+        instrument_provider: InstrumentProvider,
+        config: AshareDataClientConfig,
+    ):
+        super().__init__(
+            loop=loop,
+            client_id=client_id,
+            venue=None,
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            instrument_provider=instrument_provider,
+            config=config,
+        )
+        self._poller = MinuteBarPoller(
+            on_bars=self._handle_rows,
+            on_error=self._handle_error,
+            clock=clock.timestamp_ns,
+            base_url=config.base_url,
+            poll_delay=config.poll_delay_secs,
+            retry_interval=config.retry_interval_secs,
+            deadline=config.deadline_secs,
+            max_concurrency=config.max_concurrency,
+            trading_hours_only=config.trading_hours_only,
+        )
+        self._bar_types: dict[str, tuple[BarType, Equity]] = {}
+        self._poll_task: asyncio.Task | None = None
+
+    async def _connect(self) -> None:
+        await self._instrument_provider.initialize()
+        for instrument in self._instrument_provider.list_all():
+            self._handle_data(instrument)
+        self._poll_task = self.create_task(self._poller.run(), log_msg="poll minute bars")
+
+    async def _disconnect(self) -> None:
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    async def _subscribe_bars(self, command: SubscribeBars) -> None:
+        bar_type = command.bar_type
+        if bar_type != minute_bar_type(bar_type.instrument_id):
+            self._log.error(f"Cannot subscribe to {bar_type}: only 1-MINUTE-LAST-EXTERNAL bars are polled")
+            return
+        instrument = self._cache.instrument(bar_type.instrument_id)
+        if instrument is None:
+            instrument = ashare_instrument(bar_type.instrument_id)
+            self._handle_data(instrument)
+        code = ashare_code(bar_type.instrument_id)
+        self._bar_types[code] = (bar_type, instrument)
+        await self._poller.add(code)
+
+    async def _unsubscribe_bars(self, command: UnsubscribeBars) -> None:
+        code = ashare_code(command.bar_type.instrument_id)
+        self._bar_types.pop(code, None)
+        self._poller.remove(code)
+
+    def _handle_rows(self, code: str, rows: list[MinuteRow]) -> None:
+        bar_type, instrument = self._bar_types[code]
+        for ts, open_, high, low, close, volume in rows:
+            self._handle_data(Bar(
+                bar_type=bar_type,
+                open=instrument.make_price(float(open_)),
+                high=instrument.make_price(float(high)),
+                low=instrument.make_price(float(low)),
+                close=instrument.make_price(float(close)),
+                volume=instrument.make_qty(float(volume)),
+                ts_event=ts,
+                ts_init=self._clock.timestamp_ns(),
+            ))
+
+    def _handle_error(self, code: str, error: Exception) -> None:
+        self._log.warning(f"Polling {code} failed: {error!r}")
+
+
+class AshareLiveDataClientFactory(LiveDataClientFactory):
+    @staticmethod
+    def create(
+        loop: asyncio.AbstractEventLoop,
+        name: str,
+        config: AshareDataClientConfig,
+        msgbus: MessageBus,
+        cache: Cache,
+        clock: LiveClock,
+    ) -> AshareDataClient:
+        return AshareDataClient(
+            loop=loop,
+            client_id=ClientId(name),
+            msgbus=msgbus,
+            cache=cache,
+            clock=clock,
+            instrument_provider=AshareInstrumentProvider(config=config.instrument_provider),
+            config=config,
+        )
+
+
+class BarSandboxExecutionClient(SandboxExecutionClient):
+    """
+    Sandbox paper trading that also fills on the venue's bars.
+
+    The sandbox listens on `data.*.{venue}.*`, which bar topics
+    (`data.bars.600519.SSE-1-MINUTE-LAST-EXTERNAL`) do not match. The extra
+    subscription runs ahead of the strategies, so an order sent from `on_bar`
+    fills against that bar, as in a backtest. `TradingNode` passes the
+    portfolio to the stock sandbox factory only, so register the client with
+    the node's execution engine directly after `build`.
+    """
+
+    def connect(self) -> None:
+        super().connect()
+        self._msgbus.subscribe(f"data.bars.*.{self.venue}-*", handler=self.on_data, priority=1)
+
+
+class BarLatencyConfig(ActorConfig, frozen=True):
+    bar_types: list[str]
+
+
+class BarLatency(Actor):
+    """Records, per bar, the nanoseconds from its close (`ts_event`) to its bar callback."""
+
+    def __init__(self, config: BarLatencyConfig):
+        super().__init__(config=config)
+        self.latencies: list[int] = []
+
+    def on_start(self):
+        for bar_type in self.config.bar_types:
+            self.subscribe_bars(BarType.from_str(bar_type))
+
+    def on_bar(self, bar: Bar):
+        self.latencies.append(self.clock.timestamp_ns() - bar.ts_event)
+
+    def summary(self) -> dict:
+        """Bar count and latency percentiles in milliseconds."""
+        latencies = np.array(self.latencies) / 1e6
+        if len(latencies) == 0:
+            return {"bars": 0}
+        return {
+            "bars": len(latencies),
+            "p50 (ms)": np.percentile(latencies, 50),
+            "p95 (ms)": np.percentile(latencies, 95),
+            "max (ms)": latencies.max(),
+        }
+
+
+@contextmanager
+def stand_in_server(seed: int = 0, lag: float = 0.0) -> Iterator[str]:
+    """
+    Serve random-walk minute bars and quotes in the Tencent formats on localhost.
+
+    Yields the root URL to use instead of the Tencent hosts, i.e.
+    `{root}{MKLINE_PATH}` and `{root}{QUOTE_PATH}`. Every code gets its own
+    deterministic walk around the clock, including the minute in progress;
+    with `lag`, a minute's bar only appears `lag` seconds after it closed,
+    like a slow upstream.
+    """
+
+    @lru_cache(maxsize=65536)
+    def walk(code: str, day: int) -> np.ndarray:
+        steps = np.random.default_rng([seed, sum(map(ord, code)), day]).normal(0.0, 0.001, 1440)
+        return 100.0 * np.exp(np.cumsum(steps))
+
+    def price(code: str, minute: int) -> float:
+        return float(walk(code, minute // 1440)[minute % 1440])
+
+    def minute_bars(code: str, count: int) -> bytes:
+        now = time.time_ns()
+        current = (now - int(lag * 1e9)) // MINUTE_NS + 1  # The minute in progress, by its close time
+        if current * MINUTE_NS <= now:
+            current -= 1  # Closed but not out yet
+        rows = []
+        for minute in range(current - count + 1, current + 1):
+            close_time = datetime.fromtimestamp(minute * 60 + SHANGHAI_OFFSET_NS / 1e9, tz=timezone.utc)
+            open_, close = price(code, minute - 1), price(code, minute)
+            rows.append([
+                close_time.strftime("%Y%m%d%H%M"),
+                f"{open_:.2f}",
+                f"{close:.2f}",
+                f"{max(open_, close) * 1.001:.2f}",
+                f"{min(open_, close) * 0.999:.2f}",
+                "1000.00",
+                {},
+                "",
+            ])
+        return json.dumps({"code": 0, "data": {code: {"m1": rows}}}).encode()
+
+    def quotes(codes: list[str]) -> bytes:
+        now = time.time_ns()
+        minute = now // MINUTE_NS + 1
+        stamp = datetime.fromtimestamp(now / 1e9 + SHANGHAI_OFFSET_NS / 1e9, tz=timezone.utc).strftime("%Y%m%d%H%M%S")
+        lines = []
+        for code in codes:
+            last, prev_close = price(code, minute), price(code, minute - minute % 1440)
+            fields = [""] * 50
+            fields[0], fields[1], fields[2] = "1", f"替身{code[2:]}", code[2:]
+            for name, value in (("price", last), ("prev_close", prev_close), ("open", prev_close)):
+                fields[QUOTE_FIELDS[name]] = f"{value:.2f}"
+            fields[QUOTE_FIELDS["high"]] = f"{max(last, prev_close):.2f}"
+            fields[QUOTE_FIELDS["low"]] = f"{min(last, prev_close):.2f}"
+            fields[QUOTE_FIELDS["bid"]] = f"{last - 0.01:.2f}"
+            fields[QUOTE_FIELDS["ask"]] = f"{last + 0.01:.2f}"
+            fields[QUOTE_FIELDS["volume"]] = str(minute % 1440 * 10)
+            fields[QUOTE_FIELDS["bid_size"]] = fields[QUOTE_FIELDS["ask_size"]] = "100"
+            fields[QUOTE_TIME_FIELD] = stamp
+            lines.append(f'v_{code}="{"~".join(fields)}";\n')
+        return "".join(lines).encode("gbk")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # Keep-alive, as the HTTP client pools connections
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path.startswith(QUOTE_PATH):
+                body, content_type = quotes(url.path[len(QUOTE_PATH):].split(",")), "text/html; charset=GBK"
+            else:
+                code, _, _, count = parse_qs(url.query)["param"][0].split(",")
+                body, content_type = minute_bars(code, int(count)), "application/json"
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
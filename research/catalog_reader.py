@@ -0,0 +1,314 @@
+"""
+Columnar reads of catalog Parquet files straight into Arrow tables and NumPy arrays.
+
+`ParquetDataCatalog.quote_ticks()` and `.bars()` build a Nautilus object per
+row. Research code and the MyTT indicators only need a few price columns and
+timestamps, so this reader goes to the Parquet files directly:
+
+- a sidecar index at the catalog root (`ts_init_index.parquet`) records the
+  min/max `ts_init` of every row group per data class and identifier, so a
+  range query opens only the overlapping row groups and its cost follows the
+  window size rather than the catalog size;
+- the index is maintained on the write path: call `update_index` right after
+  `catalog.write_data` (the setup and compaction scripts do). Reads never
+  write it; files missing from it have their footers read on the fly;
+- only the requested columns are decoded;
+- price and size columns, stored as little-endian fixed-point integers
+  (`FixedSizeBinary(16)` scaled by 1e16 in high-precision builds, 8 bytes
+  scaled by 1e9 otherwise), are turned into float64 arrays with NumPy.
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.model import Bar
+from nautilus_trader.model import QuoteTick
+from nautilus_trader.persistence.funcs import class_to_filename
+from nautilus_trader.persistence.funcs import urisafe_identifier
+
+# Raw integer scale per fixed-point byte width
+FIXED_SCALES = {8: 1e9, 16: 1e16}
+
+# Sidecar index of row-group ts_init ranges, stored at the catalog root
+INDEX_FILE = "ts_init_index.parquet"
+
+_INDEX_COLUMNS = {
+    "data_type": "object",
+    "identifier": "object",
+    "file": "object",
+    "size": "int64",
+    "mtime_ns": "int64",
+    "row_group": "int64",
+    "num_rows": "int64",
+    "ts_min": "uint64",
+    "ts_max": "uint64",
+}
+
+_index_cache: dict[Path, tuple[int, pd.DataFrame]] = {}
+
+
+def _timestamp_ns(value) -> int | None:
+    """A timestamp (ns int, datetime or string, naive meaning UTC) as UNIX nanoseconds."""
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    return (ts.tz_localize("UTC") if ts.tzinfo is None else ts).value
+
+
+def timestamp_filename(ns: int) -> str:
+    """A ns timestamp in the catalog's file name format, e.g. 2020-01-01T00-00-00-000000000Z."""
+    return pd.Timestamp(ns, tz="UTC").strftime("%Y-%m-%dT%H-%M-%S-") + f"{ns % 1_000_000_000:09d}Z"
+
+
+def _read_index(catalog_path: Path) -> pd.DataFrame:
+    """The sidecar index as stored on disk, cached per process until the file changes."""
+    path = catalog_path / INDEX_FILE
+    if not path.exists():
+        return pd.DataFrame({name: pd.Series(dtype=dtype) for name, dtype in _INDEX_COLUMNS.items()})
+    mtime = path.stat().st_mtime_ns
+    cached = _index_cache.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, pd.read_parquet(path))
+        _index_cache[path] = cached
+    return cached[1]
+
+
+def _file_rows(catalog_path: Path, path: Path) -> list[dict]:
+    """One index row per row group of a catalog file, from its footer statistics."""
+    stat = path.stat()
+    metadata = pq.read_metadata(path)
+    column = metadata.schema.to_arrow_schema().get_field_index("ts_init")
+    rows = []
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        stats = row_group.column(column).statistics
+        has_stats = stats is not None and stats.has_min_max
+        rows.append({
+            "data_type": path.parent.parent.name,
+            "identifier": path.parent.name,
+            "file": path.relative_to(catalog_path).as_posix(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "row_group": i,
+            "num_rows": row_group.num_rows,
+            # Row groups without statistics always overlap
+            "ts_min": stats.min if has_stats else 0,
+            "ts_max": stats.max if has_stats else np.iinfo(np.uint64).max,
+        })
+    return rows
+
+
+def update_index(catalog_path: str | Path, data_cls: type | None = None, identifier: str | None = None) -> pd.DataFrame:
+    """
+    Bring the sidecar index up to date with the catalog's data files and return it.
+
+    Only files that are new or whose size or modification time changed have their
+    footers read again; entries of deleted files are dropped. `data_cls` and
+    `identifier` restrict the scan to one data directory. The index file is
+    replaced atomically, so concurrent readers see either the old or new version.
+    """
+    catalog_path = Path(catalog_path)
+    index = _read_index(catalog_path)
+    pattern = "/".join([
+        class_to_filename(data_cls) if data_cls else "*",
+        urisafe_identifier(identifier) if identifier else "*",
+        "*.parquet",
+    ])
+    files = sorted((catalog_path / "data").glob(pattern))
+
+    in_scope = np.ones(len(index), dtype=bool)
+    if data_cls:
+        in_scope &= (index["data_type"] == class_to_filename(data_cls)).to_numpy()
+    if identifier:
+        in_scope &= (index["identifier"] == urisafe_identifier(identifier)).to_numpy()
+    scoped = index[in_scope]
+
+    keep = []
+    rows = []
+    current = {
+        key: (size, mtime)
+        for key, size, mtime in scoped[["file", "size", "mtime_ns"]].drop_duplicates("file").itertuples(index=False)
+    }
+    for path in files:
+        key = path.relative_to(catalog_path).as_posix()
+        stat = path.stat()
+        if current.get(key) == (stat.st_size, stat.st_mtime_ns):
+            keep.append(key)
+        else:
+            rows += _file_rows(catalog_path, path)
+
+    if not rows and len(keep) == len(current):
+        return index
+
+    parts = [index[~in_scope], scoped[scoped["file"].isin(keep)]]
+    if rows:
+        parts.append(pd.DataFrame(rows).astype(_INDEX_COLUMNS))
+    index = pd.concat(parts, ignore_index=True).sort_values(["data_type", "identifier", "file", "row_group"], ignore_index=True)
+
+    path = catalog_path / INDEX_FILE
+    temp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    index.to_parquet(temp, index=False)
+    os.replace(temp, path)
+    _index_cache[path] = (path.stat().st_mtime_ns, index)
+    return index
+
+
+def index_entries(catalog_path: str | Path, data_cls: type, identifier: str) -> pd.DataFrame:
+    """
+    The index rows (one per row group) for one data directory.
+
+    Rows come from the stored index; files of the directory that are not in it
+    have their footers read instead, and the index file is left untouched, so
+    reads work on read-only catalogs and never race with each other. Files
+    rewritten in place are only picked up by the next `update_index`.
+    """
+    catalog_path = Path(catalog_path)
+    data_type, name = class_to_filename(data_cls), urisafe_identifier(identifier)
+    index = _read_index(catalog_path)
+    entries = index[(index["data_type"] == data_type) & (index["identifier"] == name)]
+
+    directory = catalog_path / "data" / data_type / name
+    files = set()
+    if directory.is_dir():
+        files = {f"data/{data_type}/{name}/{file}" for file in os.listdir(directory) if file.endswith(".parquet")}
+    indexed = entries["file"].isin(files)
+    missing = files.difference(entries["file"])
+    if indexed.all() and not missing:
+        return entries
+
+    rows = [row for file in sorted(missing) for row in _file_rows(catalog_path, catalog_path / file)]
+    parts = [entries[indexed]]
+    if rows:
+        parts.append(pd.DataFrame(rows).astype(_INDEX_COLUMNS))
+    return pd.concat(parts, ignore_index=True).sort_values(["file", "row_group"], ignore_index=True)
+
+
+def read_table(
+    catalog_path: str | Path,
+    data_cls: type,
+    identifier: str,
+    start=None,
+    end=None,
+    columns: list[str] | None = None,
+    last: int | None = None,
+) -> pa.Table:
+    """
+    The raw catalog columns for `identifier` with ts_init in [start, end], as one Arrow table.
+
+    Only the row groups whose indexed ts_init range overlaps the window are read;
+    with `last`, only the latest of them that hold the window's last `last` rows,
+    and only those rows are returned. `columns` defaults to every column; `ts_init`
+    is read for filtering either way but only returned when requested. The Parquet
+    schema metadata (instrument id, precisions, bar type) is kept on the result.
+    """
+    start, end = _timestamp_ns(start), _timestamp_ns(end)
+    read_columns = None if columns is None else list(dict.fromkeys([*columns, "ts_init"]))
+    entries = index_entries(catalog_path, data_cls, identifier)
+    if entries.empty:
+        raise FileNotFoundError(f"No {data_cls.__name__} data for {identifier} in {catalog_path}")
+
+    ts_min, ts_max = entries["ts_min"].to_numpy(), entries["ts_max"].to_numpy()
+    overlap = np.ones(len(entries), dtype=bool)
+    inside = np.ones(len(entries), dtype=bool)
+    if start is not None:
+        overlap &= ts_max >= start
+        inside &= ts_min >= start
+    if end is not None:
+        overlap &= ts_min <= end
+        inside &= ts_max <= end
+    selected = entries[overlap]
+    if last is not None:
+        # Latest row groups first, until those entirely inside the window hold `last` rows
+        latest = np.argsort(-selected["ts_max"].to_numpy(), kind="stable")
+        counted = np.where(inside[overlap], selected["num_rows"].to_numpy(), 0)[latest].cumsum()
+        selected = selected.iloc[latest[: int(np.searchsorted(counted, last)) + 1]]
+
+    tables = [
+        pq.ParquetFile(Path(catalog_path) / file).read_row_groups(sorted(groups), columns=read_columns)
+        for file, groups in selected.groupby("file", sort=True)["row_group"]
+    ]
+    if not tables:
+        table = pq.read_schema(Path(catalog_path) / entries["file"].iloc[0]).empty_table()
+        return table if columns is None else table.select(columns)
+
+    table = pa.concat_tables(tables)
+    if start is not None or end is not None:
+        ts_init = table.column("ts_init").to_numpy()
+        mask = np.ones(len(ts_init), dtype=bool)
+        if start is not None:
+            mask &= ts_init >= start
+        if end is not None:
+            mask &= ts_init <= end
+        if not mask.all():
+            table = table.filter(mask)
+    if last is not None and table.num_rows > last:
+        table = table.slice(table.num_rows - last)
+    if columns is not None:
+        table = table.select(columns)
+    return table
+
+
+def decode_fixed(column: pa.Array | pa.ChunkedArray) -> np.ndarray:
+    """Fixed-point `FixedSizeBinary(8|16)` values as float64; other columns are passed to NumPy as is."""
+    if isinstance(column, pa.ChunkedArray):
+        column = column.combine_chunks()
+    if not pa.types.is_fixed_size_binary(column.type):
+        return column.to_numpy(zero_copy_only=False)
+
+    width = column.type.byte_width
+    data = np.frombuffer(column.buffers()[1], dtype=np.uint8, offset=column.offset * width, count=len(column) * width)
+    if width == 8:
+        return data.view("<i8").astype(np.float64) / FIXED_SCALES[8]
+
+    words = data.view("<u8").reshape(-1, 2)
+    lo = words[:, 0].view(np.int64)
+    hi = words[:, 1].view(np.int64)
+    # Values that fit in 64 bits are exact through the signed low word
+    values = lo.astype(np.float64)
+    wide = hi != (lo >> 63)
+    if wide.any():
+        values[wide] = hi[wide].astype(np.float64) * 2.0**64 + words[wide, 0].astype(np.float64)
+    return values / FIXED_SCALES[16]
+
+
+def read_arrays(
+    catalog_path: str | Path,
+    data_cls: type,
+    identifier: str,
+    start=None,
+    end=None,
+    columns: list[str] | None = None,
+    last: int | None = None,
+) -> dict[str, np.ndarray]:
+    """`read_table` with every column decoded to a NumPy array (prices and sizes as float64)."""
+    table = read_table(catalog_path, data_cls, identifier, start, end, columns, last)
+    return {name: decode_fixed(table.column(name)) for name in table.column_names}
+
+
+def quote_arrays(
+    catalog_path: str | Path,
+    instrument_id: str,
+    start=None,
+    end=None,
+    columns: tuple[str, ...] = ("bid_price", "ask_price", "ts_init"),
+    last: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Quote tick columns for an instrument, by default bid, ask and ts_init."""
+    return read_arrays(catalog_path, QuoteTick, instrument_id, start, end, list(columns), last)
+
+
+def bar_arrays(
+    catalog_path: str | Path,
+    bar_type: str,
+    start=None,
+    end=None,
+    columns: tuple[str, ...] = ("open", "high", "low", "close", "volume", "ts_event"),
+    last: int | None = None,
+) -> dict[str, np.ndarray]:
+    """Bar columns for a bar type, by default OHLCV and ts_event."""
+    return read_arrays(catalog_path, Bar, bar_type, start, end, list(columns), last)
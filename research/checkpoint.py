@@ -0,0 +1,143 @@
+"""
+Checkpoints of a backtest so a run over newly appended data resumes where the last one stopped.
+
+`save_checkpoint` is called after `engine.run(..., streaming=True)`, while the
+trader is still running (stopping it would let `on_stop` flatten positions). It
+records the timestamp of the last processed data, every strategy's `save()`
+state (its `on_save`: pickled indicators and signal flags), the fills of every
+open position with the events of the orders behind them, the initialisation
+events of every open order, each strategy's client order id and order list id
+counts and the total balance of every account.
+
+`restore_checkpoint` applies it to a fresh engine with the same venues (started
+with `starting_balances`), instruments and strategies, before its first `run`:
+strategies load their state, open positions and their orders are rebuilt in
+the cache from their events and open orders are resubmitted as the first new
+data arrives. The engine then only needs the data with `ts_init` after `Checkpoint.ts_last`.
+"""
+
+import pickle
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from pathlib import Path
+
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.model import Money
+from nautilus_trader.model import Position
+from nautilus_trader.model import Venue
+from nautilus_trader.model import events
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.events import OrderInitialized
+from nautilus_trader.model.orders import Order
+from nautilus_trader.model.orders.unpacker import OrderUnpacker
+
+RESUME_ALERT = "checkpoint-resume"
+
+
+@dataclass
+class Checkpoint:
+    """Engine state at `ts_last`; events are stored as dicts and balances as Money strings."""
+
+    ts_last: int
+    strategies: dict[str, dict[str, bytes]] = field(default_factory=dict)
+    order_counts: dict[str, int] = field(default_factory=dict)
+    order_list_counts: dict[str, int] = field(default_factory=dict)
+    positions: list[list[dict]] = field(default_factory=list)
+    position_orders: list[list[dict]] = field(default_factory=list)
+    orders: dict[str, list[dict]] = field(default_factory=dict)
+    balances: dict[str, list[str]] = field(default_factory=dict)
+
+
+def take_checkpoint(engine: BacktestEngine) -> Checkpoint:
+    """Snapshot a streaming engine after its last `run`."""
+    checkpoint = Checkpoint(ts_last=engine.kernel.clock.timestamp_ns())
+    for strategy in engine.trader.strategies():
+        strategy_id = str(strategy.id)
+        checkpoint.strategies[strategy_id] = strategy.save()
+        checkpoint.order_counts[strategy_id] = strategy.order_factory.get_client_order_id_count()
+        checkpoint.order_list_counts[strategy_id] = strategy.order_factory.get_order_list_id_count()
+        orders = engine.cache.orders_open(strategy_id=strategy.id)
+        if orders:
+            checkpoint.orders[strategy_id] = [OrderInitialized.to_dict(order.init_event) for order in orders]
+    for position in engine.cache.positions_open():
+        checkpoint.positions.append([OrderFilled.to_dict(fill) for fill in position.events])
+        checkpoint.position_orders += [
+            [type(event).to_dict(event) for event in order.events]
+            for order in map(engine.cache.order, position.client_order_ids)
+        ]
+    for venue in engine.list_venues():
+        account = engine.cache.account_for_venue(venue)
+        if account is not None:
+            checkpoint.balances[venue.value] = [str(balance) for balance in account.balances_total().values()]
+    return checkpoint
+
+
+def save_checkpoint(engine: BacktestEngine, path: str | Path) -> Checkpoint:
+    """Snapshot the engine and write the checkpoint to `path` (replaced atomically)."""
+    checkpoint = take_checkpoint(engine)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp = path.with_name(f".{path.name}.tmp")
+    temp.write_bytes(pickle.dumps(checkpoint))
+    temp.replace(path)
+    return checkpoint
+
+
+def load_checkpoint(path: str | Path) -> Checkpoint:
+    return pickle.loads(Path(path).read_bytes())
+
+
+def starting_balances(checkpoint: Checkpoint, venue: Venue | str) -> list[Money]:
+    """The account balances of `venue` at the checkpoint, to start the resumed venue with."""
+    return [Money.from_str(balance) for balance in checkpoint.balances[str(venue)]]
+
+
+def restore_checkpoint(engine: BacktestEngine, checkpoint: Checkpoint, oms_type: OmsType = OmsType.NETTING) -> None:
+    """Load the checkpoint into an engine whose venues, instruments and strategies are added but which has not run."""
+    for strategy in engine.trader.strategies():
+        strategy_id = str(strategy.id)
+        if strategy_id not in checkpoint.strategies:
+            raise ValueError(f"No state for {strategy_id} in the checkpoint")
+        strategy.load(checkpoint.strategies[strategy_id])
+
+        # On start a strategy counts its cached orders to number new ones, so the saved
+        # count and the resting orders are applied just before the first new data
+        strategy.clock.set_time_alert_ns(
+            RESUME_ALERT,
+            checkpoint.ts_last + 1,
+            partial(
+                _resume,
+                strategy,
+                checkpoint.order_counts[strategy_id],
+                checkpoint.order_list_counts.get(strategy_id, 0),
+                checkpoint.orders.get(strategy_id, []),
+            ),
+        )
+
+    # Orders behind open positions are needed by the cache when the position next fills
+    for order_events in checkpoint.position_orders:
+        order = _order_from_events(order_events)
+        engine.cache.add_order(order, position_id=order.position_id)
+
+    for fills in checkpoint.positions:
+        position_fills = [OrderFilled.from_dict(fill) for fill in fills]
+        position = Position(engine.cache.instrument(position_fills[0].instrument_id), position_fills[0])
+        for fill in position_fills[1:]:
+            position.apply(fill)
+        engine.cache.add_position(position, oms_type)
+
+
+def _order_from_events(order_events: list[dict]) -> Order:
+    order = OrderUnpacker.from_init(OrderInitialized.from_dict(order_events[0]))
+    for event in order_events[1:]:
+        order.apply(getattr(events, event["type"]).from_dict(event))
+    return order
+
+
+def _resume(strategy, order_count: int, order_list_count: int, orders: list[dict], event) -> None:
+    strategy.order_factory.set_client_order_id_count(order_count)
+    strategy.order_factory.set_order_list_id_count(order_list_count)
+    for init in orders:
+        strategy.submit_order(OrderUnpacker.from_init(OrderInitialized.from_dict(init)))
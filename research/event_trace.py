@@ -0,0 +1,241 @@
+"""
+Binary traces of the order, fill and position events of a run, and a fast diff.
+
+`EventTraceRecorder` is an opt-in actor: add it to an engine (or a node through
+`ImportableActorConfig`) and it appends one row per event published on
+`events.order.*` and `events.position.*`, in publication order. Fills are
+`OrderFilled` rows. The handlers only append one tuple per event to a list;
+every `batch_size` events the tuples are transposed into an Arrow record batch
+appended with zstd compression to an IPC stream. The run never holds more than
+one batch, and a run that dies before `on_stop` leaves a trace that still reads
+up to its last written batch.
+
+Columns, one row per event (null where a field does not apply):
+
+- `ts_event`, `event` (class name), `strategy_id`, `instrument_id`,
+  `client_order_id`, `position_id`;
+- `side`: `OrderSide` for order events, `PositionSide` for position events;
+- `quantity`: order quantity, fill `last_qty` or position quantity;
+- `price`: order price (or trigger price), fill `last_px` or position
+  `avg_px_open`;
+- `amount`: fill commission or position realized PnL.
+
+`first_divergence` compares two traces column by column with Arrow compute
+kernels, a block at a time, and stops at the first block that differs, so
+traces of millions of events diff in well under a second when they diverge
+early and in seconds when they do not.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.common.config import ActorConfig
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.model.events import OrderInitialized
+from nautilus_trader.model.events import OrderUpdated
+
+VERSION = 1
+
+SCHEMA = pa.schema(
+    [
+        ("ts_event", pa.uint64()),
+        ("event", pa.string()),
+        ("strategy_id", pa.string()),
+        ("instrument_id", pa.string()),
+        ("client_order_id", pa.string()),
+        ("position_id", pa.string()),
+        ("side", pa.int8()),
+        ("quantity", pa.float64()),
+        ("price", pa.float64()),
+        ("amount", pa.float64()),
+    ],
+    metadata={b"format": b"event-trace", b"version": str(VERSION).encode()},
+)
+
+# Events buffered before they are written as one record batch
+BATCH_SIZE = 65_536
+
+# Rows compared per step of `first_divergence`
+DIFF_BLOCK = 1 << 20
+
+
+def _double(value) -> float | None:
+    return None if value is None else value.as_double()
+
+
+def _str(value) -> str | None:
+    return None if value is None else value.value
+
+
+class EventTraceConfig(ActorConfig, frozen=True):
+    path: str
+    batch_size: int = BATCH_SIZE
+
+
+class EventTraceRecorder(Actor):
+    """Records the order, fill and position events of all strategies to `config.path`."""
+
+    # Ahead of the strategies' event handlers (priority 0), so each event precedes the reactions to it
+    PRIORITY = 1
+
+    def __init__(self, config: EventTraceConfig):
+        super().__init__(config=config)
+        self._rows: list[tuple] = []
+        self._writer: pa.ipc.RecordBatchStreamWriter | None = None
+        self._sink: pa.OSFile | None = None
+        self.count = 0
+
+    def on_start(self):
+        Path(self.config.path).parent.mkdir(parents=True, exist_ok=True)
+        self._sink = pa.OSFile(self.config.path, "wb")
+        self._writer = pa.ipc.new_stream(self._sink, SCHEMA, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+        self.msgbus.subscribe("events.order.*", self._on_order_event, priority=self.PRIORITY)
+        self.msgbus.subscribe("events.position.*", self._on_position_event, priority=self.PRIORITY)
+
+    def on_stop(self):
+        self.msgbus.unsubscribe("events.order.*", self._on_order_event)
+        self.msgbus.unsubscribe("events.position.*", self._on_position_event)
+        self._flush()
+        self._writer.close()
+        self._sink.close()
+        self._writer = self._sink = None
+
+    def _on_order_event(self, event):
+        side = quantity = price = amount = position_id = None
+        if isinstance(event, OrderFilled):
+            side = event.order_side
+            quantity = event.last_qty.as_double()
+            price = event.last_px.as_double()
+            amount = event.commission.as_double()
+            position_id = _str(event.position_id)
+        elif isinstance(event, OrderInitialized):
+            side = event.side
+            quantity = event.quantity.as_double()
+            options = event.options
+            price = options.get("price") or options.get("trigger_price")
+            price = None if price is None else float(price)
+        elif isinstance(event, OrderUpdated):
+            quantity = event.quantity.as_double()
+            price = _double(event.price if event.price is not None else event.trigger_price)
+        self._append((
+            event.ts_event,
+            type(event).__name__,
+            event.strategy_id.value,
+            event.instrument_id.value,
+            event.client_order_id.value,
+            position_id,
+            side,
+            quantity,
+            price,
+            amount,
+        ))
+
+    def _on_position_event(self, event):
+        self._append((
+            event.ts_event,
+            type(event).__name__,
+            event.strategy_id.value,
+            event.instrument_id.value,
+            None,
+            event.position_id.value,
+            event.side,
+            event.quantity.as_double(),
+            event.avg_px_open,
+            _double(event.realized_pnl),
+        ))
+
+    def _append(self, row: tuple):
+        rows = self._rows
+        rows.append(row)
+        if len(rows) >= self.config.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._rows:
+            return
+        self._writer.write_batch(pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(zip(*self._rows), SCHEMA)],
+            schema=SCHEMA,
+        ))
+        self.count += len(self._rows)
+        self._rows = []
+
+
+def read_trace(path: str | Path) -> pa.Table:
+    """A trace file as an Arrow table, up to the last complete batch of a trace cut short."""
+    batches = []
+    with pa.memory_map(str(path)) as source:
+        reader = pa.ipc.open_stream(source)
+        try:
+            for batch in reader:
+                batches.append(batch)
+        except (pa.ArrowInvalid, OSError):
+            pass  # A batch cut short by a crash
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+    if table.schema.metadata.get(b"format") != b"event-trace":
+        raise ValueError(f"{path} is not an event trace")
+    return table
+
+
+def _equal(a: pa.Array, b: pa.Array) -> np.ndarray:
+    """Element-wise equality with nulls equal to nulls."""
+    equal = pc.equal(a, b)
+    both_null = pc.and_(pc.is_null(a), pc.is_null(b))
+    return pc.fill_null(pc.or_kleene(equal, both_null), False).to_numpy(zero_copy_only=False)
+
+
+def first_divergence(a: pa.Table, b: pa.Table, ignore: tuple[str, ...] = ()) -> int | None:
+    """
+    Index of the first event that differs between two traces, or None if they are identical.
+
+    Columns in `ignore` (e.g. `ts_event`) are not compared. When one trace is a
+    prefix of the other, the index is the length of the shorter one.
+    """
+    columns = [name for name in SCHEMA.names if name not in ignore]
+    n = min(a.num_rows, b.num_rows)
+    for start in range(0, n, DIFF_BLOCK):
+        length = min(DIFF_BLOCK, n - start)
+        same = np.ones(length, dtype=bool)
+        for name in columns:
+            same &= _equal(
+                a.column(name).slice(start, length).combine_chunks(),
+                b.column(name).slice(start, length).combine_chunks(),
+            )
+        if not same.all():
+            return start + int(np.argmin(same))
+    return None if a.num_rows == b.num_rows else n
+
+
+def diff_traces(path_a: str | Path, path_b: str | Path, ignore: tuple[str, ...] = (), context: int = 3) -> dict:
+    """
+    First divergence of two trace files.
+
+    Returns the event counts, the divergent `index` (None if identical), the
+    `columns` that differ there and `context`: both traces' events around it
+    side by side, labelled `a` and `b`.
+    """
+    a, b = read_trace(path_a), read_trace(path_b)
+    index = first_divergence(a, b, ignore)
+    result = {"events": (a.num_rows, b.num_rows), "index": index, "columns": [], "context": None}
+    if index is None:
+        return result
+
+    row_a = a.slice(index, 1).to_pylist()
+    row_b = b.slice(index, 1).to_pylist()
+    if row_a and row_b:
+        result["columns"] = [
+            name for name in SCHEMA.names if name not in ignore and row_a[0][name] != row_b[0][name]
+        ]
+    start = max(0, index - context)
+    frames = {}
+    for label, table in (("a", a), ("b", b)):
+        frame = table.slice(start, index + context + 1 - start).to_pandas()
+        frame.index = pd.RangeIndex(start, start + len(frame))
+        frames[label] = frame
+    result["context"] = pd.concat(frames, names=["trace", "index"]).swaplevel().sort_index()
+    return result
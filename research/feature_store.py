@@ -0,0 +1,226 @@
+"""
+Precomputed MyTT indicator columns stored alongside a bar catalog.
+
+Features for a bar type live under `<catalog>/features/<bar_type>/` as Parquet
+parts named like catalog files (`<first>_<last>.parquet` by ts_init), each
+holding `ts_event`, `ts_init` and one column per indicator output, e.g.
+`MACD.DIF` or `RSI(14).RSI`. The requested specs are kept in the schema
+metadata; asking for a different set rebuilds the store.
+
+`update_features` only computes the bars appended since the last part. It
+reads the new bars plus a context of `lookback` bars before them, which covers
+every finite window of the indicator (MA, STD, HHV, REF...) and lets the
+recursive ones (EMA, SMA) decay the influence of their seed below `TOLERANCE`,
+then writes the new rows as another part. A daily refresh therefore costs
+O(new bars + lookback) regardless of how much history is stored.
+"""
+
+import json
+import math
+import re
+import shutil
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from nautilus_trader.model import Bar
+from nautilus_trader.persistence.funcs import urisafe_identifier
+
+from research.catalog_reader import read_arrays
+from research.catalog_reader import timestamp_filename
+
+# MyTT ships with the Ashare scripts rather than as a package
+sys.path.append(str(Path(__file__).parent.parent / "data_scripts" / "Ashare"))
+import MyTT  # noqa: E402
+
+FEATURES_DIR = "features"
+
+# Weight left on the seed of an EMA/SMA after its warm-up
+TOLERANCE = 1e-12
+
+BAR_COLUMNS = ("open", "high", "low", "close", "volume")
+
+DEFAULT_FEATURES = ("MACD", "KDJ", "RSI", "BOLL")
+
+
+def _ema_span(n: float) -> int:
+    """Bars for an EMA of span n (alpha = 2 / (n + 1)) to forget its seed."""
+    return _smoothing(2 / (n + 1))
+
+
+def _smoothing(alpha: float) -> int:
+    """Bars for exponential smoothing with `alpha` to forget its seed."""
+    return 1 if alpha >= 1 else math.ceil(math.log(TOLERANCE) / math.log(1 - alpha))
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """A MyTT function, the bar columns it takes, its output names and the bars it needs before a value."""
+
+    function: Callable
+    inputs: tuple[str, ...]
+    outputs: tuple[str, ...]
+    lookback: Callable[..., int]
+
+
+INDICATORS = {
+    "MA": Indicator(MyTT.MA, ("close",), ("MA",), lambda N: N),
+    "MACD": Indicator(
+        MyTT.MACD, ("close",), ("DIF", "DEA", "MACD"),
+        lambda SHORT=12, LONG=26, M=9: _ema_span(max(SHORT, LONG)) + _ema_span(M),
+    ),
+    "KDJ": Indicator(
+        MyTT.KDJ, ("close", "high", "low"), ("K", "D", "J"),
+        lambda N=9, M1=3, M2=3: N + _ema_span(M1 * 2 - 1) + _ema_span(M2 * 2 - 1),
+    ),
+    "RSI": Indicator(MyTT.RSI, ("close",), ("RSI",), lambda N=24: 1 + _smoothing(1 / N)),
+    "WR": Indicator(MyTT.WR, ("close", "high", "low"), ("WR", "WR1"), lambda N=10, N1=6: max(N, N1)),
+    "BIAS": Indicator(MyTT.BIAS, ("close",), ("BIAS1", "BIAS2", "BIAS3"), lambda L1=6, L2=12, L3=24: max(L1, L2, L3)),
+    "BOLL": Indicator(MyTT.BOLL, ("close",), ("UPPER", "MID", "LOWER"), lambda N=20, P=2: N),
+    "PSY": Indicator(MyTT.PSY, ("close",), ("PSY", "PSYMA"), lambda N=12, M=6: 1 + N + M),
+    "CCI": Indicator(MyTT.CCI, ("close", "high", "low"), ("CCI",), lambda N=14: 2 * N),
+    "ATR": Indicator(MyTT.ATR, ("close", "high", "low"), ("ATR",), lambda N=20: 1 + N),
+    "BBI": Indicator(MyTT.BBI, ("close",), ("BBI",), lambda M1=3, M2=6, M3=12, M4=20: max(M1, M2, M3, M4)),
+    "DMI": Indicator(
+        MyTT.DMI, ("close", "high", "low"), ("PDI", "MDI", "ADX", "ADXR"),
+        lambda M1=14, M2=6: 1 + M1 + 2 * M2,
+    ),
+    "TRIX": Indicator(MyTT.TRIX, ("close",), ("TRIX", "TRMA"), lambda M1=12, M2=20: 3 * _ema_span(M1) + 1 + M2),
+    "VR": Indicator(MyTT.VR, ("close", "volume"), ("VR",), lambda M1=26: 1 + M1),
+    "DPO": Indicator(MyTT.DPO, ("close",), ("DPO", "MADPO"), lambda M1=20, M2=10, M3=6: M1 + M2 + M3),
+    "DMA": Indicator(MyTT.DMA, ("close",), ("DIF", "DIFMA"), lambda N1=10, N2=50, M=10: max(N1, N2) + M),
+    "MTM": Indicator(MyTT.MTM, ("close",), ("MTM", "MTMMA"), lambda N=12, M=6: N + M),
+    "ROC": Indicator(MyTT.ROC, ("close",), ("ROC", "MAROC"), lambda N=12, M=6: N + M),
+    "SLOPE": Indicator(MyTT.SLOPE_S, ("close",), ("SLOPE",), lambda N: N),
+    "FORCAST": Indicator(MyTT.FORCAST_S, ("close",), ("FORCAST",), lambda N: N),
+}
+
+_SPEC = re.compile(r"^(\w+)(?:\(([^)]*)\))?$")
+
+
+def parse_spec(spec: str) -> tuple[Indicator, tuple[float, ...]]:
+    """An indicator spec like "MACD" or "RSI(14)" as the indicator and its positional parameters."""
+    match = _SPEC.match(spec.replace(" ", ""))
+    if match is None or match.group(1) not in INDICATORS:
+        raise ValueError(f"Unknown indicator spec {spec!r}, expected one of {list(INDICATORS)}")
+    params = tuple(
+        float(value) if "." in value else int(value)
+        for value in (match.group(2) or "").split(",")
+        if value
+    )
+    return INDICATORS[match.group(1)], params
+
+
+def lookback(specs: tuple[str, ...]) -> int:
+    """Bars of context needed before the first new bar for every spec."""
+    return max((indicator.lookback(*params) for indicator, params in map(parse_spec, specs)), default=0)
+
+
+def compute_features(bars: dict[str, np.ndarray], specs: tuple[str, ...]) -> dict[str, np.ndarray]:
+    """Indicator columns over the given bar arrays, one per output of every spec."""
+    features = {}
+    for spec in specs:
+        indicator, params = parse_spec(spec)
+        result = indicator.function(*(bars[name] for name in indicator.inputs), *params)
+        result = result if isinstance(result, tuple) else (result,)
+        for output, values in zip(indicator.outputs, result):
+            features[f"{spec}.{output}"] = np.asarray(values, dtype=np.float64)
+    return features
+
+
+def feature_dir(catalog_path: str | Path, bar_type: str) -> Path:
+    return Path(catalog_path) / FEATURES_DIR / urisafe_identifier(bar_type)
+
+
+def _parts(directory: Path) -> list[Path]:
+    return sorted(directory.glob("*.parquet"))
+
+
+def _stored_specs(parts: list[Path]) -> tuple[str, ...] | None:
+    if not parts:
+        return None
+    metadata = pq.read_schema(parts[-1]).metadata or {}
+    return tuple(json.loads(metadata.get(b"features", b"[]")))
+
+
+def _tail_ts_init(parts: list[Path], count: int) -> np.ndarray:
+    """The last `count` stored ts_init values, reading parts from the newest backwards."""
+    tails = []
+    rows = 0
+    for part in reversed(parts):
+        ts_init = pq.read_table(part, columns=["ts_init"]).column("ts_init").to_numpy()
+        tails.append(ts_init)
+        rows += len(ts_init)
+        if rows >= count:
+            break
+    return np.concatenate(tails[::-1])[-count:]
+
+
+def update_features(
+    catalog_path: str | Path,
+    bar_type: str,
+    specs: tuple[str, ...] = DEFAULT_FEATURES,
+) -> int:
+    """
+    Compute `specs` for the bars of `bar_type` that are not stored yet and return how many were added.
+
+    The first call, or a call with different specs, computes the full history.
+    """
+    specs = tuple(specs)
+    directory = feature_dir(catalog_path, bar_type)
+    parts = _parts(directory)
+    if _stored_specs(parts) != specs:
+        shutil.rmtree(directory, ignore_errors=True)
+        parts = []
+
+    start = None
+    last = None
+    if parts:
+        tail = _tail_ts_init(parts, lookback(specs) + 1)
+        start, last = int(tail[0]), int(tail[-1])
+
+    bars = read_arrays(catalog_path, Bar, bar_type, start=start, columns=[*BAR_COLUMNS, "ts_event", "ts_init"])
+    new = np.ones(len(bars["ts_init"]), dtype=bool) if last is None else bars["ts_init"] > last
+    if not new.any():
+        return 0
+
+    features = compute_features(bars, specs)
+    table = pa.table({
+        "ts_event": bars["ts_event"][new],
+        "ts_init": bars["ts_init"][new],
+        **{name: values[new] for name, values in features.items()},
+    }).replace_schema_metadata({b"bar_type": bar_type.encode(), b"features": json.dumps(specs).encode()})
+
+    directory.mkdir(parents=True, exist_ok=True)
+    ts_init = table.column("ts_init").to_numpy()
+    name = f"{timestamp_filename(int(ts_init[0]))}_{timestamp_filename(int(ts_init[-1]))}.parquet"
+    temp = directory / f".{name}.tmp"
+    pq.write_table(table, temp)
+    temp.rename(directory / name)
+    return table.num_rows
+
+
+def read_features(
+    catalog_path: str | Path,
+    bar_type: str,
+    columns: list[str] | None = None,
+    start=None,
+    end=None,
+) -> pd.DataFrame:
+    """Stored features of a bar type indexed by ts_event, optionally limited to [start, end] by ts_event."""
+    parts = _parts(feature_dir(catalog_path, bar_type))
+    if not parts:
+        raise FileNotFoundError(f"No features for {bar_type} in {catalog_path}, run update_features first")
+    read_columns = None if columns is None else ["ts_event", *columns]
+    frame = pa.concat_tables([pq.read_table(part, columns=read_columns) for part in parts]).to_pandas()
+    frame.index = pd.to_datetime(frame.pop("ts_event"), utc=True)
+    frame = frame.drop(columns="ts_init", errors="ignore")
+    if start is not None or end is not None:
+        frame = frame.loc[start:end]
+    return frame
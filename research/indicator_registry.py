@@ -0,0 +1,102 @@
+"""
+Indicators shared by the strategies of one trader.
+
+Several strategies on the same instrument (parameter variants in one engine,
+or an EMA cross next to a MACD strategy) would each update their own copy of
+identical indicators on every tick. The registry keeps one instance per
+(instrument, indicator type, parameters, price type) and updates it once per
+quote tick from a message bus subscription with a higher priority than the
+strategies' own, so `on_quote_tick` already sees the tick in the indicator.
+Instances are reference counted: the last `release` drops the indicator, and
+the bus subscription goes with the instrument's last indicator.
+"""
+
+from nautilus_trader.model import InstrumentId
+from nautilus_trader.model import QuoteTick
+from nautilus_trader.model.enums import PriceType
+
+# Registries by message bus (one per trader); a registry is removed once it holds no indicators
+_registries: dict[int, "IndicatorRegistry"] = {}
+
+
+class _QuoteUpdater:
+    """Message bus handler updating the shared indicators of one instrument."""
+
+    __slots__ = ("indicators",)
+
+    def __init__(self):
+        self.indicators = []
+
+    def __call__(self, tick: QuoteTick):
+        for indicator in self.indicators:
+            indicator.handle_quote_tick(tick)
+
+
+class IndicatorRegistry:
+    """Reference-counted indicators keyed by (instrument, type, parameters, price type)."""
+
+    # Ahead of the strategies' quote tick handlers (priority 0)
+    PRIORITY = 1
+
+    def __init__(self, msgbus):
+        self._msgbus = msgbus
+        self._entries = {}  # key -> [indicator, refcount]
+        self._keys = {}  # id(indicator) -> key
+        self._updaters: dict[InstrumentId, _QuoteUpdater] = {}
+
+    @classmethod
+    def of(cls, strategy) -> "IndicatorRegistry":
+        """The registry of the trader `strategy` is registered with."""
+        registry = _registries.get(id(strategy.msgbus))
+        if registry is None:
+            registry = _registries[id(strategy.msgbus)] = cls(strategy.msgbus)
+        return registry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def share(self, instrument_id: InstrumentId, indicator, *params, price_type: PriceType = PriceType.MID):
+        """
+        The shared indicator of `indicator`'s type, `params` and `price_type` on the instrument.
+
+        `indicator` itself (e.g. restored from a checkpoint) becomes the shared
+        instance when none is registered yet; otherwise it is discarded and the
+        registered one, already holding the same history, is returned.
+        """
+        key = (instrument_id, type(indicator), params, price_type)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = [indicator, 0]
+            self._keys[id(indicator)] = key
+            updater = self._updaters.get(instrument_id)
+            if updater is None:
+                updater = self._updaters[instrument_id] = _QuoteUpdater()
+                self._msgbus.subscribe(_quote_topic(instrument_id), updater, priority=self.PRIORITY)
+            updater.indicators.append(indicator)
+        entry[1] += 1
+        return entry[0]
+
+    def release(self, indicator) -> None:
+        """Drop one reference to a shared indicator, removing it with the last one."""
+        key = self._keys.get(id(indicator))
+        if key is None:
+            raise ValueError(f"{indicator!r} is not a shared indicator")
+        entry = self._entries[key]
+        entry[1] -= 1
+        if entry[1] > 0:
+            return
+
+        del self._entries[key]
+        del self._keys[id(indicator)]
+        instrument_id = key[0]
+        updater = self._updaters[instrument_id]
+        updater.indicators.remove(indicator)
+        if not updater.indicators:
+            self._msgbus.unsubscribe(_quote_topic(instrument_id), updater)
+            del self._updaters[instrument_id]
+        if not self._entries:
+            _registries.pop(id(self._msgbus), None)
+
+
+def _quote_topic(instrument_id: InstrumentId) -> str:
+    return f"data.quotes.{instrument_id.venue}.{instrument_id.symbol}"
@@ -0,0 +1,592 @@
+"""
+Process-pool parameter sweeps, walk-forward optimisation and fill-model draws.
+
+Each worker process loads the catalog's quote ticks once (`init_worker`) into a
+`BacktestEngine` that is reset and reused for every task it receives, so a sweep
+pays the data loading cost once per worker rather than once per backtest. Tasks
+only carry the strategy name, its parameters and the time window to replay, and
+return the raw trader reports which are summarised together with
+`research.analytics.summarise`.
+
+With `make_store_pool` the workers instead map a `research.shared_store` file
+written once by the parent and stream each task's window from it, so memory
+no longer grows with the number of workers.
+
+`run_variants` goes the other way: many parameter variants of one strategy run
+as separate strategy instances in a single engine, so one replay of the data
+drives all of them and each variant's reports are split out by strategy id.
+Only strategies trading market orders alone can share a venue this way.
+"""
+
+import itertools
+import multiprocessing
+import os
+from collections.abc import Callable
+from types import SimpleNamespace
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.analysis.reporter import ReportProvider
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.backtest.engine import BacktestEngineConfig
+from nautilus_trader.backtest.models import FillModel
+from nautilus_trader.config import ImportableStrategyConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.config import RiskEngineConfig
+from nautilus_trader.model import BarType
+from nautilus_trader.model import Money
+from nautilus_trader.model import QuoteTick
+from nautilus_trader.model import Venue
+from nautilus_trader.model.enums import AccountType
+from nautilus_trader.model.enums import OmsType
+from nautilus_trader.model.identifiers import StrategyId
+from nautilus_trader.model.objects import Currency
+from nautilus_trader.model.position import Position
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.trading.config import StrategyFactory
+
+from research.analytics import parse_account_report
+from research.analytics import summarise
+from research.analytics import to_float
+from research.shared_store import open_store
+from research.shared_store import store_range
+from research.shared_store import stream
+
+STRATEGIES = {
+    "ema": ("strategies.definitions:EMACrossStrategy", "strategies.definitions:EMACrossConfig"),
+    "macd": ("strategies.definitions:MACDEnhancedStrategy", "strategies.definitions:MACDEnhancedConfig"),
+}
+
+# Strategies placing resting or contingent orders, which `run_variants` refuses
+RESTING_ORDER_STRATEGIES = {"macd"}
+
+SIM = Venue("SIM")
+
+# Per-worker state, populated by `init_engine`
+_engine: BacktestEngine | None = None
+_instrument = None
+_store = None
+_warm_start_catalog: str | None = None
+
+
+def init_engine(
+    instrument,
+    data: list,
+    oms_type: str = "NETTING",
+    base_currency: str | None = "USD",
+    starting_balances: tuple[str, ...] = ("1_000_000 USD",),
+) -> None:
+    """Build the worker's reusable engine with a SIM margin venue, the instrument and its data."""
+    global _engine, _instrument
+
+    _instrument = instrument
+    # Runs are summarised by `research.analytics`, so the engine's own post-run analysis is skipped
+    _engine = BacktestEngine(config=BacktestEngineConfig(
+        logging=LoggingConfig(log_level="ERROR"),
+        risk_engine=RiskEngineConfig(bypass=True),
+        run_analysis=False,
+    ))
+    _engine.add_venue(
+        venue=SIM,
+        oms_type=OmsType[oms_type],
+        account_type=AccountType.MARGIN,
+        base_currency=Currency.from_str(base_currency) if base_currency else None,
+        starting_balances=[Money.from_str(balance) for balance in starting_balances],
+    )
+    _engine.add_instrument(instrument)
+    if data:
+        _engine.add_data(data)
+
+
+def init_worker(catalog_path: str, instrument_id: str | None = None, warm_start: bool = False) -> None:
+    """Load the instrument and its quote ticks from the catalog once per worker."""
+    global _warm_start_catalog
+
+    _warm_start_catalog = catalog_path if warm_start else None
+    catalog = ParquetDataCatalog(catalog_path)
+    instruments = catalog.instruments(instrument_ids=[instrument_id] if instrument_id else None)
+    init_engine(instruments[0], catalog.quote_ticks(instrument_ids=[str(instruments[0].id)]))
+
+
+def init_loader_worker(loader: Callable[[], tuple], venue: dict) -> None:
+    """Build the worker's engine from `loader()`, which returns (instrument, data)."""
+    instrument, data = loader()
+    init_engine(instrument, data, **venue)
+
+
+def init_store_worker(store_path: str, catalog_path: str, venue: dict, warm_start: bool = False) -> None:
+    """Map the shared store and build the worker's engine without loading any data into it."""
+    global _store, _warm_start_catalog
+
+    _store = open_store(store_path)
+    _warm_start_catalog = catalog_path if warm_start else None
+    metadata = _store.schema.metadata
+    if b"instrument_id" in metadata:
+        instrument_id = metadata[b"instrument_id"].decode()
+    else:
+        instrument_id = str(BarType.from_str(metadata[b"bar_type"].decode()).instrument_id)
+    instrument = ParquetDataCatalog(catalog_path).instruments(instrument_ids=[instrument_id])[0]
+    init_engine(instrument, [], **venue)
+
+
+def data_range(catalog_path: str, instrument_id: str | None = None) -> tuple[int, int]:
+    """First and last `ts_init` (ns) of the catalog's quote ticks for the instrument."""
+    catalog = ParquetDataCatalog(catalog_path)
+    if instrument_id is None:
+        instrument_id = str(catalog.instruments()[0].id)
+    intervals = catalog.get_intervals(QuoteTick, instrument_id)
+    return min(i[0] for i in intervals), max(i[1] for i in intervals)
+
+
+def account_report(engine: BacktestEngine, venue: Venue = SIM) -> pd.DataFrame:
+    """
+    The venue's account report for the engine's last run.
+
+    The first account state is the balance the engine was created or reset with,
+    stamped with the clock time before the run: the epoch, or the end of the
+    previous task on a reused engine. It is left out, so reused engines report
+    the same balances as fresh ones.
+    """
+    events = engine.portfolio.account(venue).events
+    return ReportProvider.generate_account_report(SimpleNamespace(events=events[1:]))
+
+
+def run_backtest(
+    strategy: str,
+    params: dict,
+    start: int | None = None,
+    end: int | None = None,
+    fill_model: dict | None = None,
+) -> dict:
+    """
+    Replay [start, end] of the worker's data through one strategy and return its reports.
+
+    `fill_model` holds `FillModel` keyword arguments (e.g. probabilities and
+    `random_seed`); without it fills are deterministic. Workers started with
+    `warm_start` seed the strategy's indicators from the catalog data before
+    `start` (see `research.warm_start`) instead of warming them up on the window.
+    """
+    strategy_path, config_path = STRATEGIES[strategy]
+    config = {"instrument_id": _instrument.id, **params}
+    if _warm_start_catalog is not None:
+        config["warm_start_catalog"] = _warm_start_catalog
+
+    _engine.reset()
+    _engine.clear_strategies()
+    _engine.change_fill_model(SIM, FillModel(**(fill_model or {})))
+    _engine.add_strategy(StrategyFactory.create(ImportableStrategyConfig(
+        strategy_path=strategy_path,
+        config_path=config_path,
+        config=config,
+    )))
+    if _store is not None:
+        # Streams are dropped by `reset`, so the window is re-attached per task
+        first, last = store_range(_store)
+        start = first if start is None else start
+        end = last if end is None else end
+        _engine.add_data_iterator("store", stream(_store, start, end))
+    _engine.run(start=start, end=end)
+
+    return {
+        "account": account_report(_engine),
+        "positions": _engine.trader.generate_positions_report(),
+        "fills": _engine.trader.generate_order_fills_report(),
+        "iterations": _engine.iteration,
+    }
+
+
+def run_variants(
+    strategy: str,
+    variants: list[dict],
+    start: int | None = None,
+    end: int | None = None,
+    fill_model: dict | None = None,
+) -> list[dict]:
+    """
+    Replay [start, end] of the worker's data once through every parameter variant.
+
+    Each variant is added to the worker's engine as its own strategy instance
+    (with the order id tag of its index), so one pass over the data drives all of
+    them. NETTING positions are kept per strategy; the venue account is shared,
+    so each variant gets an account report rebuilt from its own fills (see
+    `strategy_account`). Returns one `run_backtest`-style result per variant.
+
+    The variants share the simulated venue: when one variant's stop order
+    triggers, the venue fills it at the trigger price by moving its quote there,
+    and other variants' market orders in the same tick fill at that price too.
+    Strategies placing resting or contingent orders (`RESTING_ORDER_STRATEGIES`)
+    are therefore refused; variants trading only market orders (such as the EMA
+    cross) match separate runs exactly.
+    """
+    if strategy in RESTING_ORDER_STRATEGIES:
+        raise ValueError(f"{strategy!r} places resting orders, so its variants cannot share a venue")
+    strategy_path, config_path = STRATEGIES[strategy]
+
+    _engine.reset()
+    _engine.clear_strategies()
+    _engine.change_fill_model(SIM, FillModel(**(fill_model or {})))
+    strategies = []
+    for n, params in enumerate(variants):
+        config = {"instrument_id": _instrument.id, "order_id_tag": f"{n:03d}", **params}
+        if _warm_start_catalog is not None:
+            config["warm_start_catalog"] = _warm_start_catalog
+        strategies.append(StrategyFactory.create(ImportableStrategyConfig(
+            strategy_path=strategy_path,
+            config_path=config_path,
+            config=config,
+        )))
+    _engine.add_strategies(strategies)
+    if _store is not None:
+        first, last = store_range(_store)
+        start = first if start is None else start
+        end = last if end is None else end
+        _engine.add_data_iterator("store", stream(_store, start, end))
+    _engine.run(start=start, end=end)
+
+    account = account_report(_engine)
+    positions = _engine.trader.generate_positions_report()
+    fills = _engine.trader.generate_order_fills_report()
+    results = []
+    for s in strategies:
+        strategy_id = str(s.id)
+        results.append({
+            "account": strategy_account(_engine, s.id, account),
+            "positions": positions[positions["strategy_id"] == strategy_id] if not positions.empty else positions,
+            "fills": fills[fills["strategy_id"] == strategy_id] if not fills.empty else fills,
+            "iterations": _engine.iteration,
+        })
+    return results
+
+
+def strategy_account(engine: BacktestEngine, strategy_id: StrategyId, account: pd.DataFrame) -> pd.DataFrame:
+    """
+    The account report one strategy would have produced trading the venue alone.
+
+    The strategy's fills are replayed through fresh `Position`s, and the balance
+    moves by the change in realized PnL (net of commissions) at every fill, as a
+    margin account does. Rows of the shared `account` report before the first
+    fill are kept, so runs line up with single-strategy runs. Balances are in
+    the settlement currency of the traded instruments.
+    """
+    fills = []
+    for current in engine.cache.positions(strategy_id=strategy_id):
+        for position in [*engine.cache.position_snapshots(current.id), current]:
+            fills.extend(position.events)
+    fills.sort(key=lambda fill: fill.ts_event)
+
+    ts = []
+    deltas = []
+    positions = {}
+    for fill in fills:
+        position = positions.get(fill.instrument_id)
+        if position is None or position.is_closed:
+            position = Position(engine.cache.instrument(fill.instrument_id), fill)
+            positions[fill.instrument_id] = position
+            before = 0.0
+        else:
+            before = position.realized_pnl.as_double()
+            position.apply(fill)
+        ts.append(fill.ts_event)
+        deltas.append(position.realized_pnl.as_double() - before)
+
+    # Shared balances before any strategy traded
+    balances = to_float(account["total"])
+    head = account[balances.eq(balances.iloc[0]).cummin().to_numpy()][["total", "free", "locked", "currency"]]
+    if not fills:
+        return head
+    currency = position.settlement_currency.code
+    head = head[(head.index < pd.Timestamp(ts[0], tz="UTC")) & (head["currency"] == currency)]
+    starting = float(to_float(head["total"]).iloc[0]) if not head.empty else 0.0
+    total = np.round(starting + np.cumsum(deltas), position.settlement_currency.precision)
+    return pd.concat([head, pd.DataFrame(
+        {"total": total, "free": total, "locked": 0.0, "currency": currency},
+        index=pd.to_datetime(ts, utc=True),
+    )])
+
+
+def grid(**params: list) -> list[dict]:
+    """Cartesian product of parameter values, e.g. grid(fast_period=[5, 10], slow_period=[20, 30])."""
+    keys = list(params)
+    return [dict(zip(keys, values)) for values in itertools.product(*params.values())]
+
+
+def make_pool(
+    catalog_path: str,
+    instrument_id: str | None = None,
+    workers: int | None = None,
+    warm_start: bool = False,
+) -> ProcessPoolExecutor:
+    """A process pool whose workers have the catalog data loaded."""
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=init_worker,
+        initargs=(catalog_path, instrument_id, warm_start),
+    )
+
+
+def make_loader_pool(loader: Callable[[], tuple], venue: dict | None = None, workers: int | None = None) -> ProcessPoolExecutor:
+    """
+    A process pool whose workers build their engine from `loader()`.
+
+    Workers are forked where the platform allows it, so a loader that caches its
+    result in a module global and is called once in the parent before the pool is
+    created hands the same data to every worker without loading it again.
+    """
+    context = multiprocessing.get_context("fork") if "fork" in multiprocessing.get_all_start_methods() else None
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        mp_context=context,
+        initializer=init_loader_worker,
+        initargs=(loader, venue or {}),
+    )
+
+
+def make_store_pool(
+    store_path: str,
+    catalog_path: str,
+    venue: dict | None = None,
+    workers: int | None = None,
+    warm_start: bool = False,
+) -> ProcessPoolExecutor:
+    """A process pool whose workers stream from the shared store at `store_path`."""
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count(),
+        initializer=init_store_worker,
+        initargs=(store_path, catalog_path, venue or {}, warm_start),
+    )
+
+
+def evaluate(
+    executor: Executor,
+    tasks: list[tuple],
+    currency: str | None = None,
+) -> tuple[pd.DataFrame, list[dict]]:
+    """Run `run_backtest` argument tuples on the pool and summarise all of them at once."""
+    futures = [executor.submit(run_backtest, *task) for task in tasks]
+    results = [future.result() for future in futures]
+    stats = summarise(
+        [r["account"] for r in results],
+        [r["positions"] for r in results],
+        [r["fills"] for r in results],
+        currency=currency,
+    )
+    return stats, results
+
+
+def evaluate_variants(
+    executor: Executor,
+    strategy: str,
+    variants: list[dict],
+    start: int | None = None,
+    end: int | None = None,
+    chunks: int = 1,
+    currency: str | None = None,
+) -> tuple[pd.DataFrame, list[dict]]:
+    """Split the variants into `chunks` shared-replay `run_variants` tasks and summarise them all at once."""
+    if strategy in RESTING_ORDER_STRATEGIES:
+        raise ValueError(f"{strategy!r} places resting orders, so its variants cannot share a venue")
+    size = -(-len(variants) // chunks)
+    futures = [
+        executor.submit(run_variants, strategy, variants[i:i + size], start, end)
+        for i in range(0, len(variants), size)
+    ]
+    results = [result for future in futures for result in future.result()]
+    stats = summarise(
+        [r["account"] for r in results],
+        [r["positions"] for r in results],
+        [r["fills"] for r in results],
+        currency=currency,
+    )
+    return stats, results
+
+
+def walk_forward_windows(start: int, end: int, train: pd.Timedelta, test: pd.Timedelta) -> list[tuple[int, int, int]]:
+    """Rolling (train_start, test_start, test_end) windows in ns, stepping by the test length."""
+    windows = []
+    train_start = start
+    while train_start + train.value < end:
+        test_start = train_start + train.value
+        windows.append((train_start, test_start, min(test_start + test.value, end)))
+        train_start += test.value
+    return windows
+
+
+def stitch_equity(accounts: list[pd.DataFrame]) -> pd.Series:
+    """
+    Chain the equity curves of consecutive out-of-sample windows.
+
+    Each window starts from the same balance, so every curve is shifted by the
+    PnL accumulated over the previous windows.
+    """
+    parts = []
+    balance = None
+    for account in accounts:
+        parsed = parse_account_report(account)
+        if parsed.empty:
+            continue
+        total = parsed["total"].to_numpy()
+        if balance is None:
+            balance = total[0]
+        parts.append(pd.Series(total - total[0] + balance, index=pd.to_datetime(parsed["ts"], utc=True)))
+        balance += total[-1] - total[0]
+    if not parts:
+        return pd.Series(dtype=np.float64)
+    return pd.concat(parts)
+
+
+def walk_forward(
+    executor: Executor,
+    strategy: str,
+    candidates: list[dict],
+    windows: list[tuple[int, int, int]],
+    objective: str = "total_pnl",
+) -> tuple[pd.DataFrame, pd.Series]:
+    """
+    Optimise on every train window and evaluate the winner on the following test window.
+
+    All (window, candidate) train runs are scheduled on the pool together, then the
+    selected configurations are replayed on their test windows. Returns one row per
+    window and the stitched out-of-sample equity curve.
+    """
+    tasks = [
+        (strategy, params, train_start, test_start)
+        for train_start, test_start, _ in windows
+        for params in candidates
+    ]
+    train_stats, _ = evaluate(executor, tasks)
+    scores = train_stats[objective].to_numpy().reshape(len(windows), len(candidates))
+    best = np.nanargmax(np.where(np.isnan(scores), -np.inf, scores), axis=1)
+
+    test_tasks = [
+        (strategy, candidates[k], test_start, test_end)
+        for (_, test_start, test_end), k in zip(windows, best)
+    ]
+    test_stats, test_results = evaluate(executor, test_tasks)
+
+    report = pd.DataFrame({
+        "train_start": pd.to_datetime([w[0] for w in windows], utc=True),
+        "test_start": pd.to_datetime([w[1] for w in windows], utc=True),
+        "test_end": pd.to_datetime([w[2] for w in windows], utc=True),
+        "params": [candidates[k] for k in best],
+        f"train_{objective}": scores[np.arange(len(windows)), best],
+        f"test_{objective}": test_stats[objective].to_numpy(),
+        "test_pnl": test_stats["total_pnl"].to_numpy(),
+    })
+    return report, stitch_equity([r["account"] for r in test_results])
+
+
+def _features(candidates: list[dict], space: dict[str, list]) -> np.ndarray:
+    """Quadratic features of candidates with every parameter scaled to [0, 1] over its space."""
+    columns = []
+    for key, values in space.items():
+        lo, hi = min(values), max(values)
+        x = np.array([c[key] for c in candidates], dtype=np.float64)
+        columns.append((x - lo) / (hi - lo) if hi > lo else np.zeros(len(candidates)))
+    x = np.column_stack(columns) if columns else np.zeros((len(candidates), 0))
+    pairs = [x[:, i] * x[:, j] for i in range(x.shape[1]) for j in range(i, x.shape[1])]
+    return np.column_stack([np.ones(len(candidates)), x, *pairs])
+
+
+def propose(
+    evaluated: list[dict],
+    scores: np.ndarray,
+    space: dict[str, list],
+    n: int,
+    n_samples: int = 2_000,
+    seed: int = 0,
+) -> list[dict]:
+    """
+    Propose `n` unevaluated points within the bounds of `space` using a quadratic surrogate.
+
+    A ridge-regularised quadratic model is fitted to the scores observed so far
+    and the best-predicted of `n_samples` random points are returned. Points are
+    drawn uniformly between each parameter's smallest and largest value, not from
+    its listed values, so they fall between the grid points; parameters whose
+    values are all integers stay integers.
+    """
+    finite = np.isfinite(scores)
+    if finite.sum() < 2 or n <= 0:
+        return []
+    known = [evaluated[k] for k in np.flatnonzero(finite)]
+    x = _features(known, space)
+    ridge = 1e-3 * np.eye(x.shape[1])
+    coef = np.linalg.solve(x.T @ x + ridge, x.T @ scores[finite])
+
+    rng = np.random.default_rng(seed)
+    columns = {}
+    for key, values in space.items():
+        column = rng.uniform(min(values), max(values), n_samples)
+        if all(isinstance(value, (int, np.integer)) for value in values):
+            column = np.rint(column).astype(np.int64)
+        columns[key] = column.tolist()
+    samples = [{key: column[k] for key, column in columns.items()} for k in range(n_samples)]
+    seen = {tuple(sorted(c.items())) for c in evaluated}
+    unique = {}
+    for sample in samples:
+        key = tuple(sorted(sample.items()))
+        if key not in seen:
+            unique[key] = sample
+    if not unique:
+        return []
+    samples = list(unique.values())
+    order = np.argsort(-(_features(samples, space) @ coef))
+    return [samples[k] for k in order[:n]]
+
+
+def successive_halving(
+    executor: Executor,
+    strategy: str,
+    candidates: list[dict],
+    start: int,
+    end: int,
+    min_span: pd.Timedelta,
+    eta: int = 3,
+    objective: str = "total_pnl",
+    space: dict[str, list] | None = None,
+    n_proposals: int = 0,
+    fixed: dict | None = None,
+) -> tuple[dict, pd.DataFrame]:
+    """
+    Successive-halving search over progressively longer data slices.
+
+    Every rung replays [start, start + span] for the surviving candidates, keeps
+    the best 1/eta of them and multiplies the span by eta, until one candidate
+    is left or the span covers the full range. With `space` and `n_proposals`,
+    a surrogate fitted on the first rung proposes extra points that join it.
+    `fixed` parameters are passed to every run but not searched.
+    Returns the winning parameters and one row per evaluated (rung, candidate).
+    """
+    fixed = fixed or {}
+    survivors = list(candidates)
+    span = min_span.value
+    rows = []
+    rung = 0
+    while True:
+        stop = min(start + span, end)
+        stats, results = evaluate(executor, [(strategy, {**fixed, **c}, start, stop) for c in survivors])
+        scores = stats[objective].to_numpy(dtype=np.float64)
+
+        if rung == 0 and space and n_proposals:
+            proposals = propose(survivors, scores, space, n_proposals)
+            if proposals:
+                extra_stats, extra_results = evaluate(executor, [(strategy, {**fixed, **c}, start, stop) for c in proposals])
+                survivors += proposals
+                scores = np.concatenate([scores, extra_stats[objective].to_numpy(dtype=np.float64)])
+                results += extra_results
+
+        rows += [
+            {"rung": rung, "end": pd.Timestamp(stop, tz="UTC"), "params": c, objective: s, "iterations": r["iterations"]}
+            for c, s, r in zip(survivors, scores, results)
+        ]
+
+        ranked = np.argsort(-np.where(np.isnan(scores), -np.inf, scores), kind="stable")
+        if len(survivors) == 1 or stop >= end:
+            return survivors[ranked[0]], pd.DataFrame(rows)
+
+        keep = max(1, len(survivors) // eta)
+        survivors = [survivors[k] for k in ranked[:keep]]
+        span *= eta
+        rung += 1
@@ -0,0 +1,112 @@
+"""
+Memory-mapped Arrow store for sharing catalog market data between processes.
+
+`write_store` reads the catalog's Parquet files for one instrument (or bar type)
+once and writes their columns as a single uncompressed Arrow IPC record batch,
+by default under /dev/shm. Workers `open_store` the file through a read-only
+memory map, so every process reads the same physical pages and nothing is
+parsed or copied on attach.
+
+`stream` slices a [start, end] window out of the mapped table with a binary
+search on `ts_init` and turns it into Nautilus objects one chunk at a time, so
+the engine only ever holds `chunk_size` objects per worker instead of the full
+dataset. Use it through `BacktestEngine.add_data_iterator`, as
+`research.optimise.init_store_worker` does.
+"""
+
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from nautilus_trader.model import Bar
+from nautilus_trader.model import QuoteTick
+from nautilus_trader.model import TradeTick
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+from research.catalog_reader import read_table
+
+DATA_TYPES = {cls.__name__: cls for cls in (QuoteTick, TradeTick, Bar)}
+
+# Objects built per `stream` chunk
+CHUNK_SIZE = 10_000
+
+
+def write_store(
+    catalog_path: str | Path,
+    identifier: str,
+    data_cls: type = QuoteTick,
+    path: str | Path | None = None,
+) -> str:
+    """
+    Write one instrument's (or bar type's) catalog data to an Arrow IPC file and return its path.
+
+    The file holds a single record batch sorted by `ts_init`, so each column is one
+    contiguous buffer. The schema metadata keeps the Parquet metadata (instrument
+    id, precisions, bar type) plus the data class name.
+    """
+    table = read_table(catalog_path, data_cls, identifier).combine_chunks()
+    ts_init = table.column("ts_init").to_numpy()
+    if np.any(ts_init[1:] < ts_init[:-1]):
+        table = table.take(np.argsort(ts_init, kind="stable"))
+
+    metadata = {**(table.schema.metadata or {}), b"data_cls": data_cls.__name__.encode()}
+    table = table.replace_schema_metadata(metadata)
+    batch = table.to_batches()[0] if table.num_rows else pa.RecordBatch.from_pylist([], schema=table.schema)
+
+    if path is None:
+        directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+        fd, path = tempfile.mkstemp(prefix="nautilus-store-", suffix=".arrow", dir=directory)
+        os.close(fd)
+
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write_batch(batch)
+    return str(path)
+
+
+@contextmanager
+def shared_store(catalog_path: str | Path, identifier: str, data_cls: type = QuoteTick) -> Iterator[str]:
+    """`write_store` for the duration of a `with` block, removing the file afterwards."""
+    path = write_store(catalog_path, identifier, data_cls)
+    try:
+        yield path
+    finally:
+        os.remove(path)
+
+
+def open_store(path: str | Path) -> pa.Table:
+    """Map a store read-only; its columns are views of the shared pages."""
+    return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+
+def store_data_cls(table: pa.Table) -> type:
+    """The Nautilus data class a store was written from."""
+    return DATA_TYPES[table.schema.metadata[b"data_cls"].decode()]
+
+
+def store_range(table: pa.Table) -> tuple[int, int]:
+    """First and last `ts_init` (ns) of a store."""
+    ts_init = table.column("ts_init")
+    return ts_init[0].as_py(), ts_init[-1].as_py()
+
+
+def stream(
+    table: pa.Table,
+    start: int | None = None,
+    end: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> Iterator[list]:
+    """Yield the store's data with `ts_init` in [start, end] as lists of at most `chunk_size` objects."""
+    data_cls = store_data_cls(table)
+    # The Rust decoders take the schema metadata as keyword arguments
+    table = table.replace_schema_metadata({k: v for k, v in table.schema.metadata.items() if k != b"data_cls"})
+    ts_init = table.column("ts_init").chunk(0).to_numpy()
+    lo = 0 if start is None else int(np.searchsorted(ts_init, start, side="left"))
+    hi = len(ts_init) if end is None else int(np.searchsorted(ts_init, end, side="right"))
+    for offset in range(lo, hi, chunk_size):
+        chunk = table.slice(offset, min(chunk_size, hi - offset))
+        yield data_cls.from_pyo3_list(ArrowSerializer.deserialize(data_cls, chunk))
@@ -0,0 +1,270 @@
+"""
+Compact archive format for quote ticks.
+
+Catalog Parquet files store every price and size as a 16-byte fixed-point
+integer, which compresses poorly and has to be decoded column by column. The
+archive keeps the same information in blocks of `BLOCK_SIZE` ticks:
+
+- prices and sizes as integers in units of their precision (e.g. 1e-5 for
+  EUR/USD), delta-encoded, so consecutive ticks mostly differ by a few units;
+- `ts_init` delta-of-delta encoded, which is zero for regularly spaced ticks;
+- `ts_event` as its lag behind `ts_init`, delta-encoded;
+- every stream narrowed to the smallest integer type that holds it, and the
+  block compressed with zstd.
+
+A JSON footer holds the block offsets, their first values and ts_init ranges,
+so single blocks can be decoded independently. Blocks decode to NumPy arrays
+(`read_arrays`) or to record batches with the catalog's quote tick schema
+(`read_batches`), which `ArrowSerializer.deserialize` and
+`ParquetDataCatalog.write_data` accept unchanged.
+"""
+
+import base64
+import json
+import struct
+from collections.abc import Iterator
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+
+from nautilus_trader.model import QuoteTick
+
+from research.catalog_reader import FIXED_SCALES
+from research.catalog_reader import decode_fixed
+from research.catalog_reader import read_table
+
+MAGIC = b"NTQA"
+VERSION = 1
+BLOCK_SIZE = 65_536
+CODEC = "zstd"
+
+PRICE_COLUMNS = ("bid_price", "ask_price")
+SIZE_COLUMNS = ("bid_size", "ask_size")
+
+_NARROW_TYPES = (np.int8, np.int16, np.int32, np.int64)
+
+
+def _narrow(values: np.ndarray) -> np.ndarray:
+    """`values` as the smallest signed integer type that holds them."""
+    if len(values) == 0:
+        return values.astype(np.int8)
+    lo, hi = values.min(), values.max()
+    for dtype in _NARROW_TYPES:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return values.astype(dtype)
+    return values
+
+
+def _to_units(column: pa.ChunkedArray | pa.Array, precision: int) -> np.ndarray:
+    """Fixed-point catalog values as int64 multiples of 10**-precision."""
+    return np.rint(decode_fixed(column) * 10.0**precision).astype(np.int64)
+
+
+def _mul_u64(a: np.ndarray, m: int) -> tuple[np.ndarray, np.ndarray]:
+    """The 128-bit products a * m of uint64 arrays and a uint64 scalar, as (low, high) words."""
+    mask = np.uint64(0xFFFFFFFF)
+    shift = np.uint64(32)
+    a0, a1 = a & mask, a >> shift
+    m0, m1 = np.uint64(m & 0xFFFFFFFF), np.uint64(m >> 32)
+    p00, p01, p10, p11 = a0 * m0, a0 * m1, a1 * m0, a1 * m1
+    mid = (p00 >> shift) + (p01 & mask) + (p10 & mask)
+    lo = (p00 & mask) | (mid << shift)
+    hi = p11 + (p01 >> shift) + (p10 >> shift) + (mid >> shift)
+    return lo, hi
+
+
+def encode_fixed(units: np.ndarray, precision: int, width: int) -> pa.FixedSizeBinaryArray:
+    """Multiples of 10**-precision as catalog fixed-point values of `width` bytes."""
+    scale = int(FIXED_SCALES[width]) // 10**precision
+    if width == 8:
+        data = (units * np.int64(scale)).astype("<i8")
+    elif len(units) == 0 or int(np.abs(units).max()) <= np.iinfo(np.int64).max // scale:
+        # Products that fit in 64 bits only need the sign extended into the high word
+        lo = units * np.int64(scale)
+        data = np.column_stack([lo, lo >> 63]).astype("<i8")
+    else:
+        negative = units < 0
+        lo, hi = _mul_u64(np.abs(units).astype(np.uint64), scale)
+        # Two's complement of negative values
+        lo = np.where(negative, ~lo + np.uint64(1), lo)
+        hi = np.where(negative, ~hi + (lo == 0).astype(np.uint64), hi)
+        data = np.column_stack([lo, hi]).astype("<u8")
+    return pa.FixedSizeBinaryArray.from_buffers(pa.binary(width), len(units), [None, pa.py_buffer(data.tobytes())])
+
+
+def _encode_block(columns: dict[str, np.ndarray]) -> tuple[bytes, dict]:
+    """Delta streams of one block, concatenated, plus the header needed to undo them."""
+    ts_init = columns["ts_init"].astype(np.int64)
+    lag = ts_init - columns["ts_event"].astype(np.int64)
+    first_step = int(ts_init[1] - ts_init[0]) if len(ts_init) > 1 else 0
+    streams = {
+        **{name: np.diff(columns[name]) for name in PRICE_COLUMNS + SIZE_COLUMNS},
+        "ts_init": np.diff(ts_init, n=2),
+        "ts_event": np.diff(lag),
+    }
+    streams = {name: _narrow(values) for name, values in streams.items()}
+    header = {
+        "n": len(ts_init),
+        "ts_min": int(ts_init[0]),
+        "ts_max": int(ts_init[-1]),
+        "first": {
+            **{name: int(columns[name][0]) for name in PRICE_COLUMNS + SIZE_COLUMNS},
+            "ts_init": int(ts_init[0]),
+            "ts_step": first_step,
+            "ts_event": int(lag[0]),
+        },
+        "dtypes": {name: values.dtype.str for name, values in streams.items()},
+    }
+    return b"".join(values.tobytes() for values in streams.values()), header
+
+
+def _decode_block(raw: bytes, header: dict) -> dict[str, np.ndarray]:
+    """Integer columns of one block: price/size units and ts_event/ts_init in ns."""
+    n = header["n"]
+    first = header["first"]
+    streams = {}
+    offset = 0
+    for name, dtype in header["dtypes"].items():
+        count = max(n - (2 if name == "ts_init" else 1), 0)
+        streams[name] = np.frombuffer(raw, dtype=dtype, count=count, offset=offset)
+        offset += count * np.dtype(dtype).itemsize
+
+    columns = {}
+    for name in PRICE_COLUMNS + SIZE_COLUMNS:
+        values = np.empty(n, dtype=np.int64)
+        values[0] = first[name]
+        np.cumsum(streams[name], out=values[1:])
+        values[1:] += first[name]
+        columns[name] = values
+
+    steps = np.empty(max(n - 1, 0), dtype=np.int64)
+    if n > 1:
+        steps[0] = first["ts_step"]
+        np.cumsum(streams["ts_init"], out=steps[1:])
+        steps[1:] += first["ts_step"]
+    ts_init = np.empty(n, dtype=np.int64)
+    ts_init[0] = first["ts_init"]
+    np.cumsum(steps, out=ts_init[1:])
+    ts_init[1:] += first["ts_init"]
+
+    lag = np.empty(n, dtype=np.int64)
+    lag[0] = first["ts_event"]
+    np.cumsum(streams["ts_event"], out=lag[1:])
+    lag[1:] += first["ts_event"]
+
+    columns["ts_event"] = (ts_init - lag).view(np.uint64)
+    columns["ts_init"] = ts_init.view(np.uint64)
+    return columns
+
+
+def write_archive(table: pa.Table, path: str | Path, block_size: int = BLOCK_SIZE, level: int = 3) -> dict:
+    """
+    Archive a catalog quote tick table (as returned by `read_table`) and return the footer.
+
+    The table must be sorted by `ts_init`, which catalog files are.
+    """
+    metadata = table.schema.metadata
+    price_precision = int(metadata[b"price_precision"])
+    size_precision = int(metadata[b"size_precision"])
+    columns = {
+        **{name: _to_units(table.column(name), price_precision) for name in PRICE_COLUMNS},
+        **{name: _to_units(table.column(name), size_precision) for name in SIZE_COLUMNS},
+        "ts_event": table.column("ts_event").to_numpy(),
+        "ts_init": table.column("ts_init").to_numpy(),
+    }
+
+    footer = {
+        "version": VERSION,
+        "instrument_id": metadata[b"instrument_id"].decode(),
+        "price_precision": price_precision,
+        "size_precision": size_precision,
+        "fixed_width": table.schema.field("bid_price").type.byte_width,
+        "schema": base64.b64encode(table.schema.serialize().to_pybytes()).decode(),
+        "rows": table.num_rows,
+        "blocks": [],
+    }
+    codec = pa.Codec(CODEC, compression_level=level)
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        for start in range(0, table.num_rows, block_size):
+            block = {name: values[start:start + block_size] for name, values in columns.items()}
+            raw, header = _encode_block(block)
+            compressed = codec.compress(raw, asbytes=True)
+            header.update({"offset": file.tell(), "length": len(compressed), "raw_length": len(raw)})
+            file.write(compressed)
+            footer["blocks"].append(header)
+        encoded = json.dumps(footer).encode()
+        file.write(encoded)
+        file.write(struct.pack("<Q", len(encoded)))
+        file.write(MAGIC)
+    return footer
+
+
+def archive_catalog(catalog_path: str | Path, instrument_id: str, path: str | Path, start=None, end=None) -> dict:
+    """Archive an instrument's quote ticks from the catalog, optionally limited to [start, end]."""
+    return write_archive(read_table(catalog_path, QuoteTick, instrument_id, start, end), path)
+
+
+def read_footer(path: str | Path) -> dict:
+    """The archive's footer: instrument, precisions, schema and block index."""
+    with open(path, "rb") as file:
+        file.seek(-(8 + len(MAGIC)), 2)
+        length, magic = struct.unpack("<Q4s", file.read(8 + len(MAGIC)))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a quote tick archive")
+        file.seek(-(8 + len(MAGIC) + length), 2)
+        return json.loads(file.read(length))
+
+
+def iter_blocks(path: str | Path, start=None, end=None) -> Iterator[tuple[dict, dict[str, np.ndarray]]]:
+    """Yield (footer, integer columns) for every block overlapping [start, end] in ns."""
+    footer = read_footer(path)
+    codec = pa.Codec(CODEC)
+    with open(path, "rb") as file:
+        for header in footer["blocks"]:
+            if (start is not None and header["ts_max"] < start) or (end is not None and header["ts_min"] > end):
+                continue
+            file.seek(header["offset"])
+            raw = codec.decompress(file.read(header["length"]), header["raw_length"], asbytes=True)
+            yield footer, _decode_block(raw, header)
+
+
+def read_arrays(path: str | Path, start=None, end=None) -> dict[str, np.ndarray]:
+    """Archived ticks as NumPy arrays: float64 prices and sizes, uint64 ts_event and ts_init."""
+    footer = read_footer(path)
+    parts = [columns for _, columns in iter_blocks(path, start, end)]
+    if not parts:
+        parts = [{name: np.empty(0, dtype=np.int64) for name in PRICE_COLUMNS + SIZE_COLUMNS + ("ts_event", "ts_init")}]
+    arrays = {name: np.concatenate([part[name] for part in parts]) for name in parts[0]}
+    for name in PRICE_COLUMNS:
+        arrays[name] = arrays[name] / 10.0**footer["price_precision"]
+    for name in SIZE_COLUMNS:
+        arrays[name] = arrays[name] / 10.0**footer["size_precision"]
+    arrays["ts_event"] = arrays["ts_event"].astype(np.uint64)
+    arrays["ts_init"] = arrays["ts_init"].astype(np.uint64)
+    if start is not None or end is not None:
+        mask = np.ones(len(arrays["ts_init"]), dtype=bool)
+        if start is not None:
+            mask &= arrays["ts_init"] >= start
+        if end is not None:
+            mask &= arrays["ts_init"] <= end
+        arrays = {name: values[mask] for name, values in arrays.items()}
+    return arrays
+
+
+def read_batches(path: str | Path, start=None, end=None) -> Iterator[pa.RecordBatch]:
+    """Yield one record batch per block in the catalog's quote tick schema (whole blocks, not trimmed)."""
+    footer = read_footer(path)
+    schema = pa.ipc.read_schema(pa.py_buffer(base64.b64decode(footer["schema"])))
+    width = footer["fixed_width"]
+    precisions = {
+        **dict.fromkeys(PRICE_COLUMNS, footer["price_precision"]),
+        **dict.fromkeys(SIZE_COLUMNS, footer["size_precision"]),
+    }
+    for _, columns in iter_blocks(path, start, end):
+        arrays = {name: encode_fixed(columns[name], precision, width) for name, precision in precisions.items()}
+        arrays["ts_event"] = pa.array(columns["ts_event"], pa.uint64())
+        arrays["ts_init"] = pa.array(columns["ts_init"], pa.uint64())
+        yield pa.RecordBatch.from_arrays([arrays[name] for name in schema.names], schema=schema)
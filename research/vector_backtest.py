@@ -0,0 +1,213 @@
+"""
+Vectorized backtests of MyTT signal rules on OHLCV panels under A-share rules.
+
+Panels are (time x column) frames, one column per symbol or per
+(parameter set, symbol) pair, so thousands of variants run as one backtest.
+Signals become target positions: `1` long, `-1` short, `0` flat and NaN keeps
+the previous target, which is how a strategy like `EMACrossBarStrategy` only
+acts when its condition changes. The backtest then steps through time once,
+updating every column with NumPy operations. Orders fill at the bar's close,
+like a market order submitted from `on_bar` in the event engine, subject to:
+
+* lots: targets are rounded towards zero to whole lots;
+* T+1: shares bought on a trading day cannot be sold the same day;
+* price limits: buys are blocked when a bar closes at limit-up and sells when
+  it closes at limit-down, relative to the previous day's close;
+* costs: a commission rate with a minimum per fill plus stamp duty on sells.
+
+Blocked or suspended (NaN close) columns keep their position and retry on the
+next bar while the target differs.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.model import Bar
+from nautilus_trader.model import BarType
+
+from research.catalog_reader import read_arrays
+from research.screener import MYTT_COLUMNS
+from research.screener import catalog_bar_types
+
+# Trading days are calendar days in exchange time
+TIMEZONE = "Asia/Shanghai"
+
+
+@dataclass(frozen=True)
+class AShareRules:
+    """Trading rules and costs; `price_limit=None` disables limit-up/limit-down blocking."""
+
+    lot_size: int = 100
+    commission: float = 0.00025
+    min_commission: float = 5.0
+    stamp_duty: float = 0.0005
+    price_limit: float | None = 0.10
+    t_plus_one: bool = True
+
+
+# No costs or limits, as in an event-engine run on instruments without fees
+FRICTIONLESS = AShareRules(commission=0.0, min_commission=0.0, stamp_duty=0.0, price_limit=None, t_plus_one=False)
+
+
+@dataclass
+class VectorResult:
+    """
+    Per-bar equity and positions, and per-column totals, of a vectorized backtest.
+
+    Equity starts from zero: it is the cash flow of all fills and costs plus the
+    position marked at the last close. `realized_pnl` is net of costs.
+    """
+
+    equity: pd.DataFrame
+    position: pd.DataFrame
+    fills: pd.Series
+    commissions: pd.Series
+    realized_pnl: pd.Series
+    blocked: pd.Series
+
+
+def load_panel(catalog_path: str | Path, bar_types: list[str] | None = None, start=None, end=None) -> dict[str, pd.DataFrame]:
+    """OHLCV panels under their MyTT names, indexed by ts_event with one column per instrument."""
+    bar_types = catalog_bar_types(catalog_path) if bar_types is None else bar_types
+    frames = {name: {} for name in MYTT_COLUMNS.values()}
+    for bar_type in bar_types:
+        arrays = read_arrays(catalog_path, Bar, bar_type, start=start, end=end, columns=[*MYTT_COLUMNS, "ts_event"])
+        index = pd.to_datetime(arrays["ts_event"], utc=True)
+        instrument_id = str(BarType.from_str(bar_type).instrument_id)
+        for column, name in MYTT_COLUMNS.items():
+            frames[name][instrument_id] = pd.Series(arrays[column], index=index)
+    return {name: pd.DataFrame(columns).sort_index() for name, columns in frames.items()}
+
+
+def tile(panel: pd.DataFrame, keys: list, names: list[str] | None = None) -> pd.DataFrame:
+    """Repeat a panel's columns once per key, e.g. once per parameter set."""
+    return pd.concat([panel] * len(keys), axis=1, keys=keys, names=names)
+
+
+def target_from_signal(signal, size: float) -> np.ndarray:
+    """Targets of `size` times the last non-NaN signal (1 long, -1 short, 0 flat), starting flat."""
+    target = pd.DataFrame(np.asarray(signal, dtype=np.float64)).ffill().fillna(0.0).to_numpy()
+    return target.reshape(np.shape(signal)) * size
+
+
+def _previous_day_close(close: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """For each bar, the last close of the previous trading day (NaN on the first day)."""
+    first = np.r_[0, np.flatnonzero(day[1:] != day[:-1]) + 1]
+    start = np.repeat(first, np.diff(np.r_[first, len(day)]))
+    last = pd.DataFrame(close).ffill().to_numpy()
+    previous = np.full_like(close, np.nan)
+    has_previous = start > 0
+    previous[has_previous] = last[start[has_previous] - 1]
+    return previous
+
+
+def _limit_prices(previous: np.ndarray, limit: float) -> tuple[np.ndarray, np.ndarray]:
+    # Exchange limit prices are rounded to the 0.01 tick
+    return np.round(previous * (1 + limit) + 1e-9, 2), np.round(previous * (1 - limit) + 1e-9, 2)
+
+
+def backtest(
+    target,
+    close,
+    rules: AShareRules = AShareRules(),
+    index=None,
+) -> VectorResult:
+    """
+    Trade every column of `close` towards its `target` position in shares.
+
+    `target` and `close` are (time x column) arrays or frames of the same shape;
+    `index` holds the bar timestamps and defaults to the frame index of `close`.
+    """
+    columns = close.columns if isinstance(close, pd.DataFrame) else None
+    index = close.index if index is None and isinstance(close, pd.DataFrame) else index
+    if index is None:
+        raise ValueError("Bar timestamps are required to find trading days, pass `index`")
+    price = np.asarray(close, dtype=np.float64)
+    if price.ndim == 1:
+        price = price[:, None]
+    target = np.asarray(target, dtype=np.float64).reshape(price.shape)
+    target = np.trunc(np.nan_to_num(target) / rules.lot_size) * rules.lot_size
+
+    day = pd.DatetimeIndex(pd.to_datetime(index, utc=True)).tz_convert(TIMEZONE).normalize().asi8
+    tradable = np.isfinite(price)
+    mark = pd.DataFrame(price).ffill().fillna(0.0).to_numpy()
+    if rules.price_limit is None:
+        limit_up = limit_down = np.zeros(price.shape, dtype=bool)
+    else:
+        upper, lower = _limit_prices(_previous_day_close(price, day), rules.price_limit)
+        limit_up = price >= upper
+        limit_down = price <= lower
+
+    n_columns = price.shape[1]
+    position = np.zeros(n_columns)
+    cash = np.zeros(n_columns)
+    average = np.zeros(n_columns)
+    bought_today = np.zeros(n_columns)
+    realized = np.zeros(n_columns)
+    commissions = np.zeros(n_columns)
+    fills = np.zeros(n_columns, dtype=np.int64)
+    blocked = np.zeros(n_columns, dtype=np.int64)
+    equity = np.empty(price.shape)
+    positions = np.empty(price.shape)
+
+    for t in range(len(price)):
+        if t == 0 or day[t] != day[t - 1]:
+            bought_today[:] = 0.0
+        wanted = target[t]
+        desired = wanted
+        if rules.t_plus_one:
+            # Shares bought today stay in a long position until the next trading day
+            desired = np.where(position > 0, np.maximum(desired, np.minimum(position, bought_today)), desired)
+        buy = desired > position
+        sell = desired < position
+        can_trade = tradable[t] & ~(buy & limit_up[t]) & ~(sell & limit_down[t])
+        new = np.where(can_trade, desired, position)
+        blocked += (wanted != position) & (new == position)
+
+        quantity = new - position
+        traded = quantity != 0
+        fill_price = np.where(traded, price[t], 0.0)
+        notional = np.abs(quantity) * fill_price
+        fee = np.where(traded, np.maximum(notional * rules.commission, rules.min_commission), 0.0)
+        fee += np.where(quantity < 0, notional * rules.stamp_duty, 0.0)
+
+        # Realized PnL against the average entry price, as on a netting position
+        closing = traded & (position != 0) & (np.sign(quantity) != np.sign(position))
+        closed = np.where(closing, np.minimum(np.abs(quantity), np.abs(position)), 0.0)
+        realized += closed * (fill_price - average) * np.sign(position) - fee
+        opened = np.abs(new) - np.abs(position) + closed
+        average = np.where(
+            new == 0,
+            0.0,
+            np.where(
+                np.sign(new) != np.sign(position),
+                fill_price,
+                np.where(opened > 0, (average * (np.abs(new) - opened) + fill_price * opened) / np.maximum(np.abs(new), 1), average),
+            ),
+        )
+
+        bought_today += np.maximum(np.maximum(new, 0.0) - np.maximum(position, 0.0), 0.0)
+        cash -= quantity * fill_price + fee
+        commissions += fee
+        fills += traded
+        position = new
+        positions[t] = position
+        equity[t] = cash + position * mark[t]
+
+    def frame(values):
+        return pd.DataFrame(values, index=index, columns=columns)
+
+    def series(values):
+        return pd.Series(values, index=columns)
+
+    return VectorResult(
+        equity=frame(equity),
+        position=frame(positions),
+        fills=series(fills),
+        commissions=series(commissions),
+        realized_pnl=series(realized),
+        blocked=series(blocked),
+    )
@@ -0,0 +1,62 @@
+"""
+Indicator state seeded from the history before a run's first data.
+
+A run bounded by `start` (a walk-forward slice, a successive-halving rung or
+any windowed backtest) otherwise spends the first stretch of its window warming
+its EMAs and MACD up, and until the EMAs have forgotten their first input its
+signals differ from those of a continuous run. An EMA with smoothing
+`alpha = 2 / (period + 1)` keeps a weight of `(1 - alpha) ** n` on the value it
+had `n` prices ago, so after about `period * ln(1 / TOLERANCE) / 2` prices its
+starting point no longer matters. Only that tail of the catalog data before the
+window is read and replayed through the indicators' `update_raw`, so replay
+begins at the window start with the values a continuous run has at that point,
+to within `TOLERANCE` of the price range.
+"""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from nautilus_trader.indicators import ExponentialMovingAverage
+from nautilus_trader.indicators import MovingAverageConvergenceDivergence
+
+from research.catalog_reader import bar_arrays
+from research.catalog_reader import quote_arrays
+
+# Weight left on the value before the replayed tail
+TOLERANCE = 1e-12
+
+
+def warmup_length(period: int, tolerance: float = TOLERANCE) -> int:
+    """Prices an EMA of `period` needs before its starting value weighs less than `tolerance`."""
+    return max(period, math.ceil(math.log(tolerance) / math.log1p(-2.0 / (period + 1))))
+
+
+def mid_history(catalog_path: str | Path, instrument_id: str, end: int, count: int) -> np.ndarray:
+    """Mid prices of the instrument's last `count` quote ticks with ts_init before `end` (ns)."""
+    arrays = quote_arrays(catalog_path, str(instrument_id), end=end - 1, columns=("bid_price", "ask_price"), last=count)
+    return (arrays["bid_price"] + arrays["ask_price"]) / 2.0
+
+
+def close_history(catalog_path: str | Path, bar_type: str, end: int, count: int) -> np.ndarray:
+    """Closes of the bar type's last `count` bars with ts_init before `end` (ns)."""
+    return bar_arrays(catalog_path, str(bar_type), end=end - 1, columns=("close",), last=count)["close"]
+
+
+def ema_values(prices: np.ndarray, period: int) -> np.ndarray:
+    """The EMA after every price, seeded with the first price."""
+    return pd.Series(prices, dtype=np.float64).ewm(span=period, adjust=False).mean().to_numpy()
+
+
+def seed_ema(ema: ExponentialMovingAverage, prices: np.ndarray) -> None:
+    """Replay the tail of `prices` that still affects a fresh `ema` through `update_raw`."""
+    for price in prices[-warmup_length(ema.period):].tolist():
+        ema.update_raw(price)
+
+
+def seed_macd(macd: MovingAverageConvergenceDivergence, prices: np.ndarray) -> None:
+    """Replay the tail of `prices` that still affects a fresh `macd` through `update_raw`."""
+    for price in prices[-warmup_length(max(macd.fast_period, macd.slow_period)):].tolist():
+        macd.update_raw(price)
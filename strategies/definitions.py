@@ -1,9 +1,15 @@
 # Source: https://nautilustrader.io/docs/latest/getting_started/quickstart
 # Source: https://nautilustrader.io/docs/latest/getting_started/backtest_high_level
 
+import pickle
+from functools import partial
+
+import numpy as np
+
 from nautilus_trader.core.message import Event
 from nautilus_trader.indicators import ExponentialMovingAverage
 from nautilus_trader.indicators import MovingAverageConvergenceDivergence
+from nautilus_trader.model import BarType
 from nautilus_trader.model import InstrumentId
 from nautilus_trader.model import Position
 from nautilus_trader.model import Quantity
@@ -12,27 +18,172 @@ from nautilus_trader.model.data import Bar
 from nautilus_trader.model.enums import OrderSide
 from nautilus_trader.model.enums import PositionSide
 from nautilus_trader.model.enums import PriceType
+from nautilus_trader.model.events import PositionChanged
 from nautilus_trader.model.events import PositionClosed
 from nautilus_trader.model.events import PositionOpened
+from nautilus_trader.model.instruments import CurrencyPair
 from nautilus_trader.model.objects import Price
 from nautilus_trader.trading.strategy import Strategy
 from nautilus_trader.trading.strategy import StrategyConfig
 
+from research.indicator_registry import IndicatorRegistry
+
+def pips_raw(instrument, pips: float, price: Price) -> int:
+    """
+    A distance of `pips` from `price` as a raw price, in whole price increments.
+
+    Currency pairs quoted with a fractional pip (5 decimals, or 3 for JPY pairs)
+    move ten increments per pip, other pairs one. Other instruments, such as
+    A-share equities, have no pip and a tick that is tiny next to an expensive
+    stock's price, so a pip is one basis point of `price` there (at least one
+    increment in total) and exits scale with the price.
+    """
+    increment = instrument.price_increment.raw
+    if isinstance(instrument, CurrencyPair):
+        return round(pips * (10 if instrument.price_precision in (3, 5) else 1)) * increment
+    return max(1, round(pips * price.raw / 10_000 / increment)) * increment
+
 
-class EMACrossConfig(StrategyConfig):
+class InstrumentStrategyConfig(StrategyConfig):
     instrument_id: InstrumentId
+    trade_size: int = 100
+    warm_start_catalog: str | None = None  # Seed indicators from this catalog's earlier data
+
+
+class InstrumentStrategy(Strategy):
+    """
+    Base for the strategies trading one instrument.
+
+    `position` and `side` follow the strategy's open position through the typed
+    `on_position_*` hooks (subclasses extending them call `super()`), the
+    instrument and trade size are looked up once on start. Log levels come from
+    the kernel's `LoggingConfig` alone, and the INFO messages are f-strings
+    built even when that level is filtered out: they are written per order, not
+    per tick, and skipping them measured within noise.
+    """
+
+    __slots__ = (
+        "instrument",
+        "trade_size",
+        "position",
+        "side",
+    )
+
+    def __init__(self, config: InstrumentStrategyConfig):
+        super().__init__(config=config)
+
+        self.instrument = None
+        self.trade_size = Quantity.from_int(config.trade_size)
+        self.position: Position | None = None
+        self.side = PositionSide.FLAT
+
+    def on_start(self):
+        self.instrument = self.cache.instrument(self.config.instrument_id)
+        self.trade_size = self.instrument.make_qty(self.config.trade_size)
+
+        # Resume with the position restored from a checkpoint, if any
+        positions = self.cache.positions_open(instrument_id=self.config.instrument_id, strategy_id=self.id)
+        self.position = positions[0] if positions else None
+        self.side = self.position.side if self.position else PositionSide.FLAT
+
+    def on_position_opened(self, event: PositionOpened):
+        self.position = self.cache.position(event.position_id)
+        self.side = event.side
+
+    def on_position_changed(self, event: PositionChanged):
+        self.side = event.side
+
+    def on_position_closed(self, event: PositionClosed):
+        if self.position and self.position.id == event.position_id:
+            self.position = None
+            self.side = PositionSide.FLAT
+
+    @property
+    def is_flat(self) -> bool:
+        return self.side == PositionSide.FLAT
+
+    @property
+    def is_long(self) -> bool:
+        return self.side == PositionSide.LONG
+
+    @property
+    def is_short(self) -> bool:
+        return self.side == PositionSide.SHORT
+
+
+class TickStrategyConfig(InstrumentStrategyConfig):
+    shared_indicators: bool = False  # Use the trader's shared indicators (see research.indicator_registry)
+    signal_interval_ms: int = 0  # Evaluate signals once per interval of this length (0: on every tick)
+    signal_on_sign_change: bool = True  # With an interval, also evaluate when the signal changes sign
+
+
+class TickStrategy(InstrumentStrategy):
+    """
+    Base for the strategies driven by one instrument's quote ticks.
+
+    With `config.shared_indicators`, `share_indicator` swaps the strategy's
+    indicators for instances shared with the other strategies of the trader,
+    which are updated before `on_quote_tick` and released on stop.
+    With `config.signal_interval_ms`, indicators still see every tick but
+    `signal_due` only lets the first tick of each interval, or one where the
+    signal changed sign, through to `check_signals`.
+    """
+
+    __slots__ = (
+        "_shared",
+        "_signal_interval",
+        "_signal_slot",
+        "_signal_sign",
+    )
+
+    def __init__(self, config: TickStrategyConfig):
+        super().__init__(config=config)
+        self._shared = []
+        self._signal_interval = config.signal_interval_ms * 1_000_000
+        self._signal_slot = -1
+        self._signal_sign = 0
+
+    def on_stop(self):
+        if self._shared:
+            registry = IndicatorRegistry.of(self)
+            for indicator in self._shared:
+                registry.release(indicator)
+            self._shared.clear()
+
+    def share_indicator(self, indicator, *params):
+        """The trader's instance of `indicator` (its type with `params`, on mid prices) if shared, else `indicator`."""
+        if not self.config.shared_indicators:
+            return indicator
+        shared = IndicatorRegistry.of(self).share(self.config.instrument_id, indicator, *params, price_type=PriceType.MID)
+        self._shared.append(shared)
+        return shared
+
+    def signal_due(self, ts: int, signal: float) -> bool:
+        """Whether signals are evaluated for a tick at `ts` (ns), given the value whose sign drives them."""
+        slot = ts // self._signal_interval
+        sign = (signal > 0) - (signal < 0)
+        if slot == self._signal_slot and (sign == self._signal_sign or not self.config.signal_on_sign_change):
+            return False
+        self._signal_slot = slot
+        self._signal_sign = sign
+        return True
+
+
+class EMACrossConfig(TickStrategyConfig):
     fast_period: int = 10
     slow_period: int = 20
     trade_size: int = 10_000
 
 
-class EMACrossStrategy(Strategy):
+class EMACrossStrategy(TickStrategy):
     """
     Exponential Moving Average Crossover Strategy.
     Long when Fast EMA > Slow EMA.
     Short when Fast EMA < Slow EMA.
     """
 
+    __slots__ = ("fast_ema", "slow_ema")
+
     def __init__(self, config: EMACrossConfig):
         super().__init__(config=config)
 
@@ -46,72 +197,94 @@ class EMACrossStrategy(Strategy):
             price_type=PriceType.MID
         )
 
-        self.trade_size = Quantity.from_int(config.trade_size)
-        self.position: Position | None = None
-
     def on_start(self):
+        super().on_start()
+        self.fast_ema = self.share_indicator(self.fast_ema, self.config.fast_period)
+        self.slow_ema = self.share_indicator(self.slow_ema, self.config.slow_period)
+        if self.config.warm_start_catalog:
+            self.warm_start()
         self.subscribe_quote_ticks(instrument_id=self.config.instrument_id)
 
-    def on_quote_tick(self, tick: QuoteTick):
-        # Update indicators with latest price
-        self.fast_ema.handle_quote_tick(tick)
-        self.slow_ema.handle_quote_tick(tick)
+    def on_save(self) -> dict[str, bytes]:
+        return {"fast_ema": pickle.dumps(self.fast_ema), "slow_ema": pickle.dumps(self.slow_ema)}
+
+    def on_load(self, state: dict[str, bytes]):
+        self.fast_ema = pickle.loads(state["fast_ema"])
+        self.slow_ema = pickle.loads(state["slow_ema"])
+
+    def warm_start(self):
+        """Seed the EMAs without inputs (a shared one may be seeded already) with the catalog's mid prices before this run."""
+        from research.warm_start import mid_history
+        from research.warm_start import seed_ema
+        from research.warm_start import warmup_length
 
-        if not self.fast_ema.initialized or not self.slow_ema.initialized:
+        emas = [ema for ema in (self.fast_ema, self.slow_ema) if not ema.has_inputs]
+        if not emas:
+            return
+        count = warmup_length(max(ema.period for ema in emas))
+        prices = mid_history(self.config.warm_start_catalog, self.config.instrument_id, self.clock.timestamp_ns(), count)
+        for ema in emas:
+            seed_ema(ema, prices)
+
+    def on_quote_tick(self, tick: QuoteTick):
+        # Update indicators with latest price, unless the registry has done so
+        fast_ema = self.fast_ema
+        slow_ema = self.slow_ema
+        if not self._shared:
+            fast_ema.handle_quote_tick(tick)
+            slow_ema.handle_quote_tick(tick)
+
+        if not fast_ema.initialized or not slow_ema.initialized:
+            return
+        if self._signal_interval and not self.signal_due(tick.ts_init, fast_ema.value - slow_ema.value):
             return
 
         self.check_signals()
 
     def check_signals(self):
-        # Determine trend
-        if self.fast_ema.value > self.slow_ema.value:
-            # Bullish: Enter Long if not already Long
-            if not self.position or self.position.side == PositionSide.SHORT:
-                if self.position:
-                    self.close_position(self.position)
-                
-                # Check if we are flat before entering to avoid flipping in one tick if not supported
-                if not self.position: 
-                     self.submit_order(self.order_factory.market(
-                        instrument_id=self.config.instrument_id,
-                        order_side=OrderSide.BUY,
-                        quantity=self.trade_size
-                    ))
-
-        elif self.fast_ema.value < self.slow_ema.value:
-            # Bearish: Enter Short if not already Short
-            if not self.position or self.position.side == PositionSide.LONG:
-                if self.position:
-                    self.close_position(self.position)
-                
-                if not self.position:
-                    self.submit_order(self.order_factory.market(
-                        instrument_id=self.config.instrument_id,
-                        order_side=OrderSide.SELL,
-                        quantity=self.trade_size
-                    ))
+        fast = self.fast_ema.value
+        slow = self.slow_ema.value
+        side = self.side
 
-    def on_event(self, event: Event):
-        if isinstance(event, PositionOpened):
-            self.position = self.cache.position(event.position_id)
-        elif isinstance(event, PositionClosed):
-            if self.position and self.position.id == event.position_id:
-                self.position = None
+        # Determine trend
+        if fast > slow:
+            # Bullish: Enter Long if flat, close a Short first
+            if side == PositionSide.SHORT:
+                self.close_position(self.position)
+            elif side == PositionSide.FLAT:
+                self.submit_order(self.order_factory.market(
+                    instrument_id=self.config.instrument_id,
+                    order_side=OrderSide.BUY,
+                    quantity=self.trade_size,
+                ))
+
+        elif fast < slow:
+            # Bearish: Enter Short if flat, close a Long first
+            if side == PositionSide.LONG:
+                self.close_position(self.position)
+            elif side == PositionSide.FLAT:
+                self.submit_order(self.order_factory.market(
+                    instrument_id=self.config.instrument_id,
+                    order_side=OrderSide.SELL,
+                    quantity=self.trade_size,
+                ))
 
     def on_stop(self):
         self.close_all_positions(self.config.instrument_id)
+        super().on_stop()
 
 
-class MACDConfig(StrategyConfig):
-    instrument_id: InstrumentId
+class MACDConfig(TickStrategyConfig):
     fast_period: int = 12
     slow_period: int = 26
     trade_size: int = 1_000_000
 
 
-class MACDStrategy(Strategy):
+class MACDStrategy(TickStrategy):
     """A MACD-based strategy that only trades on zero-line crossovers."""
 
+    __slots__ = ("macd", "last_macd_above_zero")
+
     def __init__(self, config: MACDConfig):
         super().__init__(config=config)
 
@@ -119,72 +292,89 @@ class MACDStrategy(Strategy):
         self.macd = MovingAverageConvergenceDivergence(
             fast_period=config.fast_period, slow_period=config.slow_period, price_type=PriceType.MID
         )
-        self.trade_size = Quantity.from_int(config.trade_size)
 
-        # Track our position and MACD state
-        self.position: Position | None = None
+        # Track our MACD state
         self.last_macd_above_zero = None  # Track if MACD was above zero on last check
 
     def on_start(self):
         """Subscribe to market data on strategy start."""
+        super().on_start()
+        self.macd = self.share_indicator(self.macd, self.config.fast_period, self.config.slow_period)
+        if self.config.warm_start_catalog and not self.macd.has_inputs:
+            self.warm_start()
         self.subscribe_quote_ticks(instrument_id=self.config.instrument_id)
 
     def on_stop(self):
         """Clean up on strategy stop."""
         self.close_all_positions(self.config.instrument_id)
         self.unsubscribe_quote_ticks(instrument_id=self.config.instrument_id)
+        super().on_stop()
+
+    def on_save(self) -> dict[str, bytes]:
+        """Indicator and crossover state for a checkpoint."""
+        return {"macd": pickle.dumps(self.macd), "last_macd_above_zero": pickle.dumps(self.last_macd_above_zero)}
+
+    def on_load(self, state: dict[str, bytes]):
+        """Restore the state saved by `on_save`."""
+        self.macd = pickle.loads(state["macd"])
+        self.last_macd_above_zero = pickle.loads(state["last_macd_above_zero"])
+
+    def warm_start(self):
+        """Seed the MACD with the catalog's mid prices before the first data of this run."""
+        from research.warm_start import mid_history
+        from research.warm_start import seed_macd
+        from research.warm_start import warmup_length
+
+        count = warmup_length(max(self.macd.fast_period, self.macd.slow_period))
+        seed_macd(self.macd, mid_history(self.config.warm_start_catalog, self.config.instrument_id, self.clock.timestamp_ns(), count))
+        if self.macd.initialized:
+            self.last_macd_above_zero = self.macd.value > 0
 
     def on_quote_tick(self, tick: QuoteTick):
         """Process incoming quote ticks."""
-        # Update indicator
-        self.macd.handle_quote_tick(tick)
+        # Update indicator, unless the registry has done so
+        macd = self.macd
+        if not self._shared:
+            macd.handle_quote_tick(tick)
 
-        if not self.macd.initialized:
+        if not macd.initialized:
             return  # Wait for indicator to warm up
+        if self._signal_interval and not self.signal_due(tick.ts_init, macd.value):
+            return
 
         # Check for trading opportunities
         self.check_signals()
 
-    def on_event(self, event: Event):
-        """Handle position events."""
-        if isinstance(event, PositionOpened):
-            self.position = self.cache.position(event.position_id)
-            self._log.info(f"Position opened: {self.position.side} @ {self.position.avg_px_open}")
-        elif isinstance(event, PositionClosed):
-            if self.position and self.position.id == event.position_id:
-                self._log.info(f"Position closed with PnL: {self.position.realized_pnl}")
-                self.position = None
+    def on_position_opened(self, event: PositionOpened):
+        super().on_position_opened(event)
+        self._log.info(f"Position opened: {event.side} @ {event.avg_px_open}")
+
+    def on_position_closed(self, event: PositionClosed):
+        super().on_position_closed(event)
+        self._log.info(f"Position closed with PnL: {event.realized_pnl}")
 
     def check_signals(self):
         """Check MACD signals - only act on actual crossovers."""
-        current_macd = self.macd.value
-        current_above_zero = current_macd > 0
+        current_above_zero = self.macd.value > 0
+        last_above_zero = self.last_macd_above_zero
+        self.last_macd_above_zero = current_above_zero
 
-        # Skip if this is the first reading
-        if self.last_macd_above_zero is None:
-            self.last_macd_above_zero = current_above_zero
+        # Skip the first reading, then only act on actual crossovers
+        if last_above_zero is None or last_above_zero == current_above_zero:
             return
 
-        # Only act on actual crossovers
-        if self.last_macd_above_zero != current_above_zero:
-            if current_above_zero:  # Just crossed above zero
-                # Only go long if we're not already long
-                if not self.is_long:
-                    # Close any short position first
-                    if self.is_short:
-                        self.close_position(self.position)
-                    # Then go long (but only when flat)
-                    self.go_long()
-            else:  # Just crossed below zero
-                # Only go short if we're not already short
-                if not self.is_short:
-                    # Close any long position first
-                    if self.is_long:
-                        self.close_position(self.position)
-                    # Then go short (but only when flat)
-                    self.go_short()
-
-        self.last_macd_above_zero = current_above_zero
+        side = self.side
+        if current_above_zero:  # Just crossed above zero
+            if side == PositionSide.SHORT:
+                # Close the short, the next crossover finds us flat
+                self.close_position(self.position)
+            elif side == PositionSide.FLAT:
+                self.go_long()
+        else:  # Just crossed below zero
+            if side == PositionSide.LONG:
+                self.close_position(self.position)
+            elif side == PositionSide.FLAT:
+                self.go_short()
 
     def go_long(self):
         """Enter long position only if flat."""
@@ -208,39 +398,25 @@ class MACDStrategy(Strategy):
             self.submit_order(order)
             self._log.info(f"Going SHORT - MACD crossed below zero: {self.macd.value:.6f}")
 
-    @property
-    def is_flat(self) -> bool:
-        """Check if we have no position."""
-        return self.position is None
-
-    @property
-    def is_long(self) -> bool:
-        """Check if we have a long position."""
-        return self.position and self.position.side == PositionSide.LONG
-
-    @property
-    def is_short(self) -> bool:
-        """Check if we have a short position."""
-        return self.position and self.position.side == PositionSide.SHORT
-
     def on_dispose(self):
         """Clean up on strategy disposal."""
         pass
 
 
-class MACDEnhancedConfig(StrategyConfig):
-    instrument_id: InstrumentId
+class MACDEnhancedConfig(TickStrategyConfig):
     fast_period: int = 12
     slow_period: int = 26
     trade_size: int = 1_000_000
     entry_threshold: float = 0.00005
     exit_threshold: float = 0.00002
-    stop_loss_pips: int = 20  # Stop loss in pips
-    take_profit_pips: int = 40  # Take profit in pips
+    stop_loss_pips: int = 20  # Stop loss in pips (basis points of the entry for non-FX instruments)
+    take_profit_pips: int = 40  # Take profit in pips (likewise)
 
 
-class MACDEnhancedStrategy(Strategy):
-    """Enhanced MACD strategy with stop-loss and take-profit."""
+class MACDEnhancedStrategy(TickStrategy):
+    """Enhanced MACD strategy with a stop-loss and take-profit bracket on every entry."""
+
+    __slots__ = ("macd", "last_macd_sign")
 
     def __init__(self, config: MACDEnhancedConfig):
         super().__init__(config=config)
@@ -248,13 +424,14 @@ class MACDEnhancedStrategy(Strategy):
         self.macd = MovingAverageConvergenceDivergence(
             fast_period=config.fast_period, slow_period=config.slow_period, price_type=PriceType.MID
         )
-        self.trade_size = Quantity.from_int(config.trade_size)
-
-        self.position: Position | None = None
         self.last_macd_sign = 0
 
     def on_start(self):
         """Subscribe to market data on strategy start."""
+        super().on_start()
+        self.macd = self.share_indicator(self.macd, self.config.fast_period, self.config.slow_period)
+        if self.config.warm_start_catalog and not self.macd.has_inputs:
+            self.warm_start()
         self.subscribe_quote_ticks(instrument_id=self.config.instrument_id)
 
     def on_stop(self):
@@ -262,56 +439,71 @@ class MACDEnhancedStrategy(Strategy):
         self.cancel_all_orders(self.config.instrument_id)
         self.close_all_positions(self.config.instrument_id)
         self.unsubscribe_quote_ticks(instrument_id=self.config.instrument_id)
+        super().on_stop()
+
+    def on_save(self) -> dict[str, bytes]:
+        """Indicator and crossover state for a checkpoint."""
+        return {"macd": pickle.dumps(self.macd), "last_macd_sign": pickle.dumps(self.last_macd_sign)}
+
+    def on_load(self, state: dict[str, bytes]):
+        """Restore the state saved by `on_save`."""
+        self.macd = pickle.loads(state["macd"])
+        self.last_macd_sign = pickle.loads(state["last_macd_sign"])
+
+    def warm_start(self):
+        """Seed the MACD with the catalog's mid prices before the first data of this run."""
+        from research.warm_start import mid_history
+        from research.warm_start import seed_macd
+        from research.warm_start import warmup_length
+
+        count = warmup_length(max(self.macd.fast_period, self.macd.slow_period))
+        seed_macd(self.macd, mid_history(self.config.warm_start_catalog, self.config.instrument_id, self.clock.timestamp_ns(), count))
+        if self.macd.initialized:
+            self.last_macd_sign = 1 if self.macd.value > 0 else -1
 
     def on_quote_tick(self, tick: QuoteTick):
         """Process incoming quote ticks."""
-        self.macd.handle_quote_tick(tick)
+        macd = self.macd
+        if not self._shared:
+            macd.handle_quote_tick(tick)
 
-        if not self.macd.initialized:
+        if not macd.initialized:
+            return
+        if self._signal_interval and not self.signal_due(tick.ts_init, macd.value):
             return
 
         self.check_signals(tick)
 
-    def on_event(self, event: Event):
-        """Handle position events."""
-        if isinstance(event, PositionOpened):
-            self.position = self.cache.position(event.position_id)
-            self._log.info(f"Position opened: {self.position.side} @ {self.position.avg_px_open}")
-
-            # Place stop-loss and take-profit orders
-            self.place_exit_orders()
+    def on_position_opened(self, event: PositionOpened):
+        super().on_position_opened(event)
+        self._log.info(f"Position opened: {event.side} @ {event.avg_px_open}")
 
-        elif isinstance(event, PositionClosed):
-            if self.position and self.position.id == event.position_id:
-                pnl = self.position.realized_pnl
-                self._log.info(f"Position closed with PnL: {pnl}")
-                self.position = None
-
-                # Cancel any remaining exit orders
-                self.cancel_all_orders(self.config.instrument_id)
+    def on_position_closed(self, event: PositionClosed):
+        super().on_position_closed(event)
+        self._log.info(f"Position closed with PnL: {event.realized_pnl}")
 
     def check_signals(self, tick: QuoteTick):
         """Check MACD signals and manage positions."""
-        current_macd = self.macd.value
-        current_sign = 1 if current_macd > 0 else -1
-
         # Skip if we already have a position
-        if self.position:
+        if self.position is not None:
             return
 
+        current_macd = self.macd.value
+        current_sign = 1 if current_macd > 0 else -1
+        entry_threshold = self.config.entry_threshold
+
         # Detect MACD zero-line crossover
         if self.last_macd_sign != 0 and self.last_macd_sign != current_sign:
             if current_sign > 0:
                 self.go_long(tick)
             else:
                 self.go_short(tick)
-        
+
         # Entry signals based on threshold
-        elif abs(current_macd) > self.config.entry_threshold:
-            if current_macd > self.config.entry_threshold:
-                self.go_long(tick)
-            elif current_macd < -self.config.entry_threshold:
-                self.go_short(tick)
+        elif current_macd > entry_threshold:
+            self.go_long(tick)
+        elif current_macd < -entry_threshold:
+            self.go_short(tick)
 
         self.last_macd_sign = current_sign
 
@@ -320,12 +512,7 @@ class MACDEnhancedStrategy(Strategy):
         if self.position:
             return  # Already have a position
 
-        order = self.order_factory.market(
-            instrument_id=self.config.instrument_id,
-            order_side=OrderSide.BUY,
-            quantity=self.trade_size,
-        )
-        self.submit_order(order)
+        self.submit_bracket(OrderSide.BUY, tick.ask_price)
         self._log.info(f"Going LONG @ {tick.ask_price} - MACD: {self.macd.value:.6f}")
 
     def go_short(self, tick: QuoteTick):
@@ -333,94 +520,53 @@ class MACDEnhancedStrategy(Strategy):
         if self.position:
             return  # Already have a position
 
-        order = self.order_factory.market(
+        self.submit_bracket(OrderSide.SELL, tick.bid_price)
+        self._log.info(f"Going SHORT @ {tick.bid_price} - MACD: {self.macd.value:.6f}")
+
+    def submit_bracket(self, side: OrderSide, entry: Price):
+        """
+        Submit a market entry with its stop-loss and take-profit as one bracket.
+
+        Exits are placed `stop_loss_pips`/`take_profit_pips` away from `entry`, the
+        price the market order is expected to fill at, in whole price increments
+        (see `pips_raw`).
+        The venue releases them when the entry fills and cancels the other one
+        when either fills, so the strategy sends no further orders per trade.
+        """
+        instrument = self.instrument
+        direction = 1 if side == OrderSide.BUY else -1
+        precision = instrument.price_precision
+        stop = pips_raw(instrument, self.config.stop_loss_pips, entry)
+        target = pips_raw(instrument, self.config.take_profit_pips, entry)
+        bracket = self.order_factory.bracket(
             instrument_id=self.config.instrument_id,
-            order_side=OrderSide.SELL,
+            order_side=side,
             quantity=self.trade_size,
+            sl_trigger_price=Price.from_raw(entry.raw - direction * stop, precision),
+            tp_price=Price.from_raw(entry.raw + direction * target, precision),
+            tp_post_only=False,
         )
-        self.submit_order(order)
-        self._log.info(f"Going SHORT @ {tick.bid_price} - MACD: {self.macd.value:.6f}")
-
-    def place_exit_orders(self):
-        """Place stop-loss and take-profit orders for the current position."""
-        if not self.position:
-            return
-
-        entry_price = float(self.position.avg_px_open)
-        pip_value = 0.0001  # For FX pairs (adjust for different instruments)
-
-        if self.position.side == PositionSide.LONG:
-            # Long position: stop below entry, target above
-            stop_price = entry_price - (self.config.stop_loss_pips * pip_value)
-            target_price = entry_price + (self.config.take_profit_pips * pip_value)
-
-            # Stop-loss order
-            stop_loss = self.order_factory.stop_market(
-                instrument_id=self.config.instrument_id,
-                order_side=OrderSide.SELL,
-                quantity=self.trade_size,
-                trigger_price=Price.from_str(f"{stop_price:.5f}"),
-            )
-            self.submit_order(stop_loss)
-
-            # Take-profit order
-            take_profit = self.order_factory.limit(
-                instrument_id=self.config.instrument_id,
-                order_side=OrderSide.SELL,
-                quantity=self.trade_size,
-                price=Price.from_str(f"{target_price:.5f}"),
-            )
-            self.submit_order(take_profit)
-
-            self._log.info(
-                f"Placed LONG exit orders - Stop: {stop_price:.5f}, Target: {target_price:.5f}"
-            )
-
-        else:  # SHORT position
-            # Short position: stop above entry, target below
-            stop_price = entry_price + (self.config.stop_loss_pips * pip_value)
-            target_price = entry_price - (self.config.take_profit_pips * pip_value)
-
-            # Stop-loss order
-            stop_loss = self.order_factory.stop_market(
-                instrument_id=self.config.instrument_id,
-                order_side=OrderSide.BUY,
-                quantity=self.trade_size,
-                trigger_price=Price.from_str(f"{stop_price:.5f}"),
-            )
-            self.submit_order(stop_loss)
-
-            # Take-profit order
-            take_profit = self.order_factory.limit(
-                instrument_id=self.config.instrument_id,
-                order_side=OrderSide.BUY,
-                quantity=self.trade_size,
-                price=Price.from_str(f"{target_price:.5f}"),
-            )
-            self.submit_order(take_profit)
-
-            self._log.info(
-                f"Placed SHORT exit orders - Stop: {stop_price:.5f}, Target: {target_price:.5f}"
-            )
+        self.submit_order_list(bracket)
 
     def on_dispose(self):
         """Clean up on strategy disposal."""
         pass
 
 
-class EMACrossBarConfig(StrategyConfig):
-    instrument_id: InstrumentId
+class EMACrossBarConfig(InstrumentStrategyConfig, kw_only=True, forbid_unknown_fields=True):
     bar_type: str
     fast_period: int = 10
     slow_period: int = 20
     trade_size: int = 100
 
 
-class EMACrossBarStrategy(Strategy):
+class EMACrossBarStrategy(InstrumentStrategy):
     """
     Exponential Moving Average Crossover Strategy for Bar Data (Long Only).
     """
 
+    __slots__ = ("fast_ema", "slow_ema")
+
     def __init__(self, config: EMACrossBarConfig):
         super().__init__(config=config)
 
@@ -433,28 +579,52 @@ class EMACrossBarStrategy(Strategy):
             price_type=PriceType.LAST,
         )
 
-        self.trade_size = Quantity.from_int(config.trade_size)
-        self.position: Position | None = None
-
     def on_start(self):
-        from nautilus_trader.model import BarType
+        super().on_start()
+        if self.config.warm_start_catalog:
+            self.warm_start()
         self.subscribe_bars(BarType.from_str(self.config.bar_type))
 
+    def on_save(self) -> dict[str, bytes]:
+        return {"fast_ema": pickle.dumps(self.fast_ema), "slow_ema": pickle.dumps(self.slow_ema)}
+
+    def on_load(self, state: dict[str, bytes]):
+        self.fast_ema = pickle.loads(state["fast_ema"])
+        self.slow_ema = pickle.loads(state["slow_ema"])
+
+    def warm_start(self):
+        """Seed the EMAs not restored from a checkpoint with the catalog's closes before the first data of this run."""
+        from research.warm_start import close_history
+        from research.warm_start import seed_ema
+        from research.warm_start import warmup_length
+
+        emas = [ema for ema in (self.fast_ema, self.slow_ema) if not ema.has_inputs]
+        if not emas:
+            return
+        count = warmup_length(max(ema.period for ema in emas))
+        prices = close_history(self.config.warm_start_catalog, self.config.bar_type, self.clock.timestamp_ns(), count)
+        for ema in emas:
+            seed_ema(ema, prices)
+
     def on_bar(self, bar: Bar):
-        self.fast_ema.handle_bar(bar)
-        self.slow_ema.handle_bar(bar)
+        fast_ema = self.fast_ema
+        slow_ema = self.slow_ema
+        fast_ema.handle_bar(bar)
+        slow_ema.handle_bar(bar)
 
-        if not self.fast_ema.initialized or not self.slow_ema.initialized:
+        if not fast_ema.initialized or not slow_ema.initialized:
             return
 
         self.check_signals(bar)
 
     def check_signals(self, bar: Bar):
-        if self.fast_ema.value > self.slow_ema.value:
-            if self.is_flat:
+        fast = self.fast_ema.value
+        slow = self.slow_ema.value
+        if fast > slow:
+            if self.side == PositionSide.FLAT:
                 self.go_long(bar)
-        elif self.fast_ema.value < self.slow_ema.value:
-            if self.is_long:
+        elif fast < slow:
+            if self.side == PositionSide.LONG:
                 # Close any long position
                 self.close_all_positions(self.config.instrument_id)
 
@@ -467,17 +637,123 @@ class EMACrossBarStrategy(Strategy):
         self.submit_order(order)
         self._log.info(f"Going LONG @ {bar.close} - Fast: {self.fast_ema.value:.2f}, Slow: {self.slow_ema.value:.2f}")
 
+
+class EMACrossPortfolioConfig(StrategyConfig):
+    bar_types: list[str]
+    fast_period: int = 10
+    slow_period: int = 20
+    trade_size: int = 100
+    # Wait after a timestamp's first bar before acting on a partial batch; 0 waits until the clock moves on
+    flush_delay_ms: int = 0
+
+
+class EMACrossPortfolioStrategy(Strategy):
+    """
+    Cross-sectional EMA Crossover Strategy for many instruments (Long Only).
+
+    Same signal as EMACrossBarStrategy, but a single instance trades every bar type
+    and keeps the indicator state for all instruments in NumPy arrays indexed by
+    instrument. Bars are buffered per timestamp and the EMAs are updated in one
+    batch once every instrument has reported, and orders are only submitted for
+    names whose signal flipped. A batch missing some instruments is flushed by a
+    time alert `flush_delay_ms` after its first bar (in a backtest, as soon as
+    the clock passes its timestamp, before any later bar is processed), and
+    whatever is buffered is flushed on stop.
+    """
+
+    def __init__(self, config: EMACrossPortfolioConfig):
+        super().__init__(config=config)
+
+        self.bar_types = [BarType.from_str(bar_type) for bar_type in config.bar_types]
+        self.instrument_ids = [bar_type.instrument_id for bar_type in self.bar_types]
+        self.bar_index = {bar_type: n for n, bar_type in enumerate(self.bar_types)}
+        self.instrument_index = {instrument_id: n for n, instrument_id in enumerate(self.instrument_ids)}
+
+        n = len(self.bar_types)
+        self.fast_alpha = 2.0 / (config.fast_period + 1.0)
+        self.slow_alpha = 2.0 / (config.slow_period + 1.0)
+        self.warmup = max(config.fast_period, config.slow_period)
+
+        # Indicator and position state, one slot per instrument
+        self.fast = np.zeros(n, dtype=np.float64)
+        self.slow = np.zeros(n, dtype=np.float64)
+        self.count = np.zeros(n, dtype=np.int32)
+        self.is_long = np.zeros(n, dtype=np.bool_)
+
+        # Bars buffered for the current timestamp
+        self.close = np.zeros(n, dtype=np.float64)
+        self.received = np.zeros(n, dtype=np.bool_)
+        self.n_received = 0
+        self.batch_ts = -1
+        self.flush_delay_ns = config.flush_delay_ms * 1_000_000
+
+        self.trade_size = Quantity.from_int(config.trade_size)
+
+    def on_start(self):
+        for bar_type in self.bar_types:
+            self.subscribe_bars(bar_type)
+
+    def on_stop(self):
+        self.flush()
+
+    def on_bar(self, bar: Bar):
+        if bar.ts_event != self.batch_ts:
+            self.flush()
+            self.batch_ts = bar.ts_event
+            self.clock.set_time_alert_ns(
+                f"flush-{bar.ts_event}",
+                max(bar.ts_init + self.flush_delay_ns, self.clock.timestamp_ns() + 1),
+                partial(self.flush_batch, bar.ts_event),
+            )
+
+        n = self.bar_index[bar.bar_type]
+        if not self.received[n]:
+            self.n_received += 1
+        self.received[n] = True
+        self.close[n] = bar.close.as_double()
+
+        if self.n_received == len(self.bar_types):
+            self.flush()
+
+    def flush_batch(self, ts_event: int, _alert=None):
+        """Flush the batch of `ts_event` if it is still buffered."""
+        if self.batch_ts == ts_event:
+            self.flush()
+
+    def flush(self):
+        """Update the indicators for the buffered bars and act on flipped signals."""
+        if self.n_received == 0:
+            return
+
+        mask = self.received
+        close = self.close[mask]
+        first = self.count[mask] == 0
+        self.fast[mask] = np.where(first, close, self.fast_alpha * close + (1.0 - self.fast_alpha) * self.fast[mask])
+        self.slow[mask] = np.where(first, close, self.slow_alpha * close + (1.0 - self.slow_alpha) * self.slow[mask])
+        self.count[mask] += 1
+
+        ready = mask & (self.count >= self.warmup)
+        entries = np.flatnonzero(ready & (self.fast > self.slow) & ~self.is_long)
+        exits = np.flatnonzero(ready & (self.fast < self.slow) & self.is_long)
+
+        for n in entries:
+            self.go_long(n)
+        for n in exits:
+            self.close_all_positions(self.instrument_ids[n])
+
+        self.received[:] = False
+        self.n_received = 0
+
+    def go_long(self, n: int):
+        order = self.order_factory.market(
+            instrument_id=self.instrument_ids[n],
+            order_side=OrderSide.BUY,
+            quantity=self.trade_size,
+        )
+        self.submit_order(order)
+
     def on_event(self, event: Event):
         if isinstance(event, PositionOpened):
-            self.position = self.cache.position(event.position_id)
+            self.is_long[self.instrument_index[event.instrument_id]] = event.side == PositionSide.LONG
         elif isinstance(event, PositionClosed):
-            if self.position and self.position.id == event.position_id:
-                self.position = None
-
-    @property
-    def is_flat(self) -> bool:
-        return self.position is None
-
-    @property
-    def is_long(self) -> bool:
-        return self.position and self.position.side == PositionSide.LONG
+            self.is_long[self.instrument_index[event.instrument_id]] = False